@@ -0,0 +1,216 @@
+# aws_client.py
+import atexit
+import copy
+import datetime
+import hashlib
+import json
+import os
+import threading
+import time
+
+import boto3
+
+from aws_executor import CLIENT_CONFIG, executor
+from aws_metrics import metrics
+
+# 조회 결과 캐시 TTL(초)과 디스크 캐시 허용 여부: (서비스, 오퍼레이션) → (ttl, disk)
+# 목록에 있는 탐색용 조회만 캐시하고, 그 밖의 조회는 폴링 루프가 최신 상태를 보도록 그대로 호출
+OPERATION_TTLS = {
+    ('ec2', 'describe_vpcs'): (3600, True),
+    ('ec2', 'describe_security_groups'): (300, True),
+    ('iam', 'get_role'): (300, True),
+    ('sts', 'get_caller_identity'): (3600, True),
+    ('rds', 'describe_db_instances'): (5, False),
+}
+READ_PREFIXES = ('describe_', 'get_', 'list_')
+
+# DAILYFEED_AWS_CACHE=disk 이면 디스크 캐시 사용, off 이면 캐시 비활성화
+CACHE_MODE = os.getenv('DAILYFEED_AWS_CACHE', 'memory')
+CACHE_DIR = os.path.expanduser('~/.cache/dailyfeed/aws')
+
+
+class CacheStats:
+    """오퍼레이션별 캐시 적중/미스 카운터"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = {}
+        self.misses = {}
+
+    def record(self, operation, hit):
+        with self.lock:
+            counter = self.hits if hit else self.misses
+            counter[operation] = counter.get(operation, 0) + 1
+
+    def print_summary(self):
+        total_hits = sum(self.hits.values())
+        total_misses = sum(self.misses.values())
+        if not total_hits and not total_misses:
+            return
+        print(f"\n📊 AWS 조회 캐시: 적중 {total_hits}회 / 미스 {total_misses}회 "
+              f"(절약한 API 호출 {total_hits}회)")
+        for operation in sorted(set(self.hits) | set(self.misses)):
+            print(f"   {operation}: 적중 {self.hits.get(operation, 0)} / "
+                  f"미스 {self.misses.get(operation, 0)}")
+
+
+stats = CacheStats()
+_memory = {}
+_lock = threading.Lock()
+_session = None
+_session_lock = threading.Lock()
+
+
+def _create_client(service, region_name):
+    """
+    공유 세션에서 클라이언트 생성 (세션의 클라이언트 생성은 스레드 안전하지 않으므로 잠금)
+
+    모든 호출은 aws_executor의 토큰 버킷/재시도 예산을 거치고 aws_metrics로 계측된다.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = boto3.session.Session()
+        client = _session.client(service, region_name=region_name, config=CLIENT_CONFIG)
+    return metrics.attach(executor.attach(client))
+
+
+def _encode(value):
+    if isinstance(value, datetime.datetime):
+        return {'__datetime__': value.isoformat()}
+    raise TypeError(f"직렬화할 수 없는 값: {type(value)}")
+
+
+def _decode(value):
+    if '__datetime__' in value:
+        return datetime.datetime.fromisoformat(value['__datetime__'])
+    return value
+
+
+def invalidate(service=None):
+    """캐시 무효화 (service를 지정하지 않으면 전체)"""
+    with _lock:
+        for key in [k for k in _memory if service is None or k[0] == service]:
+            del _memory[key]
+
+    if not os.path.isdir(CACHE_DIR):
+        return
+    prefix = f"{service}." if service else ''
+    for name in os.listdir(CACHE_DIR):
+        if name.startswith(prefix):
+            try:
+                os.remove(os.path.join(CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+class CachedClient:
+    """
+    boto3 클라이언트 래퍼
+
+    OPERATION_TTLS 에 있는 조회는 TTL 동안 결과를 재사용하고, 나머지 조회는 그대로 호출한다.
+    변경 호출 후에는 같은 서비스의 캐시를 무효화한다. mode='off' 이면 캐시 없이 호출한다.
+    get_paginator, get_waiter, exceptions 등은 원래 클라이언트로 위임한다.
+    """
+
+    def __init__(self, service, region_name=None, mode=CACHE_MODE):
+        self.service = service
+        self.region_name = region_name
+        self.mode = mode
+        self.client = _create_client(service, region_name)
+        self._operations = set(self.client.meta.method_to_api_mapping)
+        self._scope = None
+
+    def __getattr__(self, name):
+        attr = getattr(self.client, name)
+        if name not in self._operations or self.mode == 'off':
+            return attr
+        if (self.service, name) in OPERATION_TTLS:
+            return lambda **kwargs: self._cached_call(name, attr, kwargs)
+        if name.startswith(READ_PREFIXES):
+            return attr
+        return lambda **kwargs: self._mutating_call(attr, kwargs)
+
+    def _scope_key(self):
+        """자격 증명/리전별로 캐시를 분리하기 위한 키"""
+        if self._scope is None:
+            credentials = _session.get_credentials()
+            access_key = credentials.access_key if credentials else ''
+            self._scope = hashlib.sha256(
+                f"{access_key}:{self.client.meta.region_name}".encode()
+            ).hexdigest()[:16]
+        return self._scope
+
+    def _cached_call(self, name, method, kwargs):
+        ttl, disk = OPERATION_TTLS[(self.service, name)]
+        params = json.dumps(kwargs, sort_keys=True, default=str)
+        key = (self.service, self._scope_key(), name, params)
+        operation = f"{self.service}.{name}"
+        now = time.time()
+
+        with _lock:
+            entry = _memory.get(key)
+        if entry and entry[0] > now:
+            stats.record(operation, hit=True)
+            return copy.deepcopy(entry[1])
+
+        disk_path = None
+        if disk and self.mode == 'disk':
+            digest = hashlib.sha256('|'.join(key).encode()).hexdigest()[:32]
+            disk_path = os.path.join(CACHE_DIR, f"{self.service}.{name}.{digest}.json")
+            cached = self._read_disk(disk_path, now)
+            if cached is not None:
+                with _lock:
+                    _memory[key] = (cached[0], cached[1])
+                stats.record(operation, hit=True)
+                return copy.deepcopy(cached[1])
+
+        response = method(**kwargs)
+        response.pop('ResponseMetadata', None)
+        stats.record(operation, hit=False)
+
+        expires = now + ttl
+        with _lock:
+            _memory[key] = (expires, response)
+        if disk_path:
+            self._write_disk(disk_path, expires, response)
+        return copy.deepcopy(response)
+
+    def _mutating_call(self, method, kwargs):
+        response = method(**kwargs)
+        invalidate(self.service)
+        return response
+
+    @staticmethod
+    def _read_disk(path, now):
+        try:
+            with open(path) as f:
+                entry = json.load(f, object_hook=_decode)
+        except (OSError, ValueError):
+            return None
+        if entry['expires'] <= now:
+            return None
+        return entry['expires'], entry['response']
+
+    @staticmethod
+    def _write_disk(path, expires, response):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'expires': expires, 'response': response}, f, default=_encode)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError):
+            pass
+
+
+def client(service, region_name=None, fresh=False):
+    """
+    boto3.client 대신 사용하는 캐시 클라이언트 생성
+
+    fresh=True 이면 캐시를 거치지 않는 클라이언트 (스로틀링/재시도/계측은 동일하게 적용)
+    """
+    return CachedClient(service, region_name=region_name, mode='off' if fresh else CACHE_MODE)
+
+
+atexit.register(stats.print_summary)
@@ -0,0 +1,258 @@
+# aws_executor.py
+import atexit
+import random
+import threading
+import time
+
+from botocore.config import Config
+
+# 스로틀링으로 판단하는 오류 코드
+THROTTLING_CODES = {
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestThrottled',
+    'RequestThrottledException',
+    'RequestLimitExceeded',
+    'TooManyRequestsException',
+    'EC2ThrottledException',
+    'PriorRequestNotComplete',
+    'SlowDown',
+}
+
+# 재시도할 일시적 오류
+TRANSIENT_CODES = {
+    'InternalError',
+    'InternalFailure',
+    'ServiceUnavailable',
+    'RequestTimeout',
+    'RequestTimeoutException',
+}
+TRANSIENT_STATUS_CODES = {500, 502, 503, 504}
+
+# 서비스별 초기 초당 요청 수와 버스트 (서비스 ID 기준, AWS 기본 한도보다 보수적으로)
+SERVICE_RATES = {
+    'rds': (10, 20),
+    'iam': (5, 10),
+    'lambda': (10, 20),
+    'eventbridge': (10, 20),
+    'ec2': (20, 50),
+    'sts': (10, 20),
+}
+DEFAULT_RATE = (10, 20)
+
+# 한도가 별도로 낮은 변경 오퍼레이션
+OPERATION_RATES = {
+    ('rds', 'CreateDBInstance'): (1, 2),
+    ('rds', 'StartDBInstance'): (5, 10),
+    ('rds', 'StopDBInstance'): (5, 10),
+    ('iam', 'CreateRole'): (2, 5),
+    ('iam', 'PutRolePolicy'): (2, 5),
+    ('lambda', 'UpdateFunctionCode'): (2, 5),
+    ('lambda', 'UpdateFunctionConfiguration'): (2, 5),
+}
+
+MAX_ATTEMPTS = 8
+BASE_DELAY = 0.5
+MAX_DELAY = 20
+
+# botocore 자체 재시도는 끄고 재시도 판단을 이 모듈이 맡는다
+CLIENT_CONFIG = Config(retries={'mode': 'standard', 'total_max_attempts': 1})
+
+
+class TokenBucket:
+    """
+    초당 요청 수를 제한하는 토큰 버킷
+
+    스로틀링이 발생하면 속도를 절반으로 줄이고(multiplicative decrease),
+    성공할 때마다 조금씩 원래 속도로 회복한다(additive increase).
+    """
+
+    def __init__(self, rate, capacity, min_rate=0.5, clock=time.monotonic, sleep=time.sleep):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.tokens = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기하고 대기한 시간(초)을 반환"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill(self.clock())
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            self.sleep(delay)
+            waited += delay
+
+    def throttled(self):
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0)
+
+    def succeeded(self):
+        with self.lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+
+class RetryBudget:
+    """
+    전역 재시도 예산
+
+    성공한 호출마다 ratio 만큼 적립하고 재시도마다 1씩 차감하여,
+    장애 상황에서 재시도가 요청 폭주로 번지지 않게 한다.
+    """
+
+    def __init__(self, ratio=0.2, initial=10, capacity=50):
+        self.ratio = ratio
+        self.tokens = initial
+        self.capacity = capacity
+        self.lock = threading.Lock()
+
+    def deposit(self):
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self):
+        with self.lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class AWSCallExecutor:
+    """
+    스로틀링을 고려한 AWS 호출 실행기
+
+    botocore 이벤트(before-send, needs-retry)에 연결되어 클라이언트의 모든 호출
+    (페이지네이터/waiter 포함)에 서비스별·오퍼레이션별 토큰 버킷을 적용하고,
+    스로틀링/일시적 오류는 지수 백오프(full jitter)와 전역 재시도 예산 안에서 재시도한다.
+    """
+
+    def __init__(self, max_attempts=MAX_ATTEMPTS, retry_budget=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.max_attempts = max_attempts
+        self.retry_budget = retry_budget or RetryBudget()
+        self.clock = clock
+        self.sleep = sleep
+        self.buckets = {}
+        self.metrics = {}
+        self.lock = threading.Lock()
+
+    def _bucket(self, key, rate):
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(*rate, clock=self.clock, sleep=self.sleep)
+                self.buckets[key] = bucket
+            return bucket
+
+    def _buckets_for(self, service, operation):
+        buckets = [self._bucket(service, SERVICE_RATES.get(service, DEFAULT_RATE))]
+        rate = OPERATION_RATES.get((service, operation))
+        if rate:
+            buckets.append(self._bucket((service, operation), rate))
+        return buckets
+
+    def _count(self, service, operation, name, amount=1):
+        with self.lock:
+            counters = self.metrics.setdefault(f"{service}.{operation}", {})
+            counters[name] = counters.get(name, 0) + amount
+
+    def attach(self, client):
+        """클라이언트의 이벤트 시스템에 실행기 연결"""
+        service = client.meta.service_model.service_id.hyphenize()
+        client.meta.events.register(f"before-send.{service}", self._before_send)
+        client.meta.events.register(f"needs-retry.{service}", self._needs_retry)
+        return client
+
+    @staticmethod
+    def _parse_event(event_name):
+        # 'before-send.rds.DescribeDBInstances' → ('rds', 'DescribeDBInstances')
+        _, service, operation = event_name.split('.', 2)
+        return service, operation
+
+    def _before_send(self, event_name, **kwargs):
+        service, operation = self._parse_event(event_name)
+        waited = sum(bucket.acquire() for bucket in self._buckets_for(service, operation))
+        self._count(service, operation, 'attempts')
+        if waited > 0:
+            self._count(service, operation, 'queued')
+            self._count(service, operation, 'queued_seconds', waited)
+        # None을 반환해야 실제 요청이 전송된다
+
+    def _needs_retry(self, event_name, response=None, attempts=1, caught_exception=None, **kwargs):
+        service, operation = self._parse_event(event_name)
+        buckets = self._buckets_for(service, operation)
+
+        code = None
+        status = None
+        if response is not None:
+            http_response, parsed = response
+            status = http_response.status_code
+            code = parsed.get('Error', {}).get('Code')
+
+        throttled = code in THROTTLING_CODES or status == 429
+        transient = (
+            caught_exception is not None
+            or code in TRANSIENT_CODES
+            or status in TRANSIENT_STATUS_CODES
+        )
+
+        if not throttled and not transient:
+            if code is None:
+                self.retry_budget.deposit()
+                for bucket in buckets:
+                    bucket.succeeded()
+            return None
+
+        if throttled:
+            self._count(service, operation, 'throttled')
+            for bucket in buckets:
+                bucket.throttled()
+
+        if attempts >= self.max_attempts:
+            self._count(service, operation, 'gave_up')
+            return None
+        if not self.retry_budget.withdraw():
+            self._count(service, operation, 'budget_exhausted')
+            return None
+
+        self._count(service, operation, 'retried')
+        return random.uniform(0, min(MAX_DELAY, BASE_DELAY * 2 ** attempts))
+
+    def print_summary(self):
+        """오퍼레이션별 호출/대기/스로틀링/재시도 지표 출력"""
+        if not self.metrics:
+            return
+        columns = ['attempts', 'queued', 'throttled', 'retried', 'budget_exhausted', 'gave_up']
+        totals = {c: sum(m.get(c, 0) for m in self.metrics.values()) for c in columns}
+        if not any(totals[c] for c in columns[1:]):
+            return
+
+        print(f"\n📊 AWS 호출 실행기: 시도 {totals['attempts']}회, 대기 {totals['queued']}회, "
+              f"스로틀링 {totals['throttled']}회, 재시도 {totals['retried']}회, "
+              f"예산 소진 {totals['budget_exhausted']}회")
+        width = max(len(name) for name in self.metrics)
+        for name in sorted(self.metrics):
+            m = self.metrics[name]
+            print(f"   {name:<{width}}  시도 {m.get('attempts', 0):>4}  "
+                  f"대기 {m.get('queued', 0):>3} ({m.get('queued_seconds', 0):.1f}s)  "
+                  f"스로틀링 {m.get('throttled', 0):>3}  재시도 {m.get('retried', 0):>3}")
+
+
+executor = AWSCallExecutor()
+atexit.register(executor.print_summary)
@@ -0,0 +1,244 @@
+# aws_metrics.py
+import atexit
+import bisect
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+
+# DAILYFEED_AWS_METRICS=off 이면 계측 비활성화
+METRICS_MODE = os.getenv('DAILYFEED_AWS_METRICS', 'on')
+METRICS_DIR = os.getenv('DAILYFEED_AWS_METRICS_DIR', os.path.expanduser('~/.cache/dailyfeed/metrics'))
+# 설정하면 종료 시 Prometheus Pushgateway 로도 전송 (istio-addon/prometheus.yaml 의 prometheus-pushgateway 잡이 수집)
+PUSHGATEWAY_URL = os.getenv('DAILYFEED_AWS_METRICS_PUSHGATEWAY')
+
+# 지연 히스토그램 버킷 상한(초)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+METRIC_PREFIX = 'dailyfeed_aws_api'
+CONTEXT_KEY = 'aws_metrics_started'
+
+
+class OperationStats:
+    """오퍼레이션 하나의 호출/오류/재시도 수와 지연 히스토그램"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = {}
+        self.retries = 0
+        self.failed_attempts = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+
+    def observe(self, seconds, error=None, retries=0):
+        self.calls += 1
+        self.retries += retries
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.latency_sum += seconds
+        self.latency_max = max(self.latency_max, seconds)
+
+    def percentile(self, fraction):
+        """히스토그램 버킷 기준 근사 백분위 (버킷 상한)"""
+        rank = fraction * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS + (self.latency_max,), self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return min(bound, self.latency_max)
+        return self.latency_max
+
+    def to_dict(self):
+        return {
+            'calls': self.calls,
+            'errors': dict(self.errors),
+            'retries': self.retries,
+            'failed_attempts': self.failed_attempts,
+            'latency': {
+                'sum': round(self.latency_sum, 6),
+                'max': round(self.latency_max, 6),
+                'avg': round(self.latency_sum / self.calls, 6) if self.calls else 0,
+                'p50': self.percentile(0.5),
+                'p95': self.percentile(0.95),
+                'buckets': {
+                    str(bound): count for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), self.buckets)
+                },
+            },
+        }
+
+
+class ApiMetrics:
+    """
+    botocore 이벤트 기반 AWS API 계측
+
+    before-call 에서 시작 시각을 요청 context 에 남기고 after-call/after-call-error 에서
+    오퍼레이션별 호출 수, 지연(재시도 포함), 오류 코드, 재시도 횟수를 기록한다.
+    needs-retry 는 시도마다 발생하므로 실패한 시도(재시도 여부와 무관) 수를 센다.
+    호출마다 잠금 한 번과 정수 연산만 하므로 API 왕복 시간에 비해 오버헤드는 무시할 수 있다.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.operations = {}
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+
+    def _stats(self, event_name):
+        # 'after-call.rds.DescribeDBInstances' → ('rds', 'DescribeDBInstances')
+        _, service, operation = event_name.split('.', 2)
+        key = (service, operation)
+        stats = self.operations.get(key)
+        if stats is None:
+            stats = self.operations.setdefault(key, OperationStats())
+        return stats
+
+    def attach(self, client):
+        """클라이언트의 이벤트 시스템에 계측 훅 연결"""
+        if METRICS_MODE == 'off':
+            return client
+        service = client.meta.service_model.service_id.hyphenize()
+        events = client.meta.events
+        events.register(f"before-call.{service}", self._before_call)
+        events.register(f"after-call.{service}", self._after_call)
+        events.register(f"after-call-error.{service}", self._after_call_error)
+        events.register(f"needs-retry.{service}", self._needs_retry)
+        return client
+
+    def _before_call(self, context=None, **kwargs):
+        if context is not None:
+            context[CONTEXT_KEY] = self.clock()
+
+    def _elapsed(self, context):
+        started = (context or {}).get(CONTEXT_KEY)
+        return self.clock() - started if started is not None else 0.0
+
+    def _after_call(self, event_name, parsed=None, context=None, **kwargs):
+        elapsed = self._elapsed(context)
+        parsed = parsed or {}
+        error = parsed.get('Error', {}).get('Code')
+        retries = parsed.get('ResponseMetadata', {}).get('RetryAttempts', 0)
+        with self.lock:
+            self._stats(event_name).observe(elapsed, error=error, retries=retries)
+
+    def _after_call_error(self, event_name, exception=None, context=None, **kwargs):
+        elapsed = self._elapsed(context)
+        with self.lock:
+            self._stats(event_name).observe(elapsed, error=type(exception).__name__)
+
+    def _needs_retry(self, event_name, response=None, caught_exception=None, **kwargs):
+        failed = caught_exception is not None
+        if response is not None:
+            failed = failed or 'Error' in response[1] or response[0].status_code >= 500
+        if failed:
+            with self.lock:
+                self._stats(event_name).failed_attempts += 1
+        # 재시도 판단은 aws_executor 가 하므로 항상 None
+
+    def report(self):
+        """JSON 보고서용 dict"""
+        with self.lock:
+            operations = {
+                f"{service}.{operation}": stats.to_dict()
+                for (service, operation), stats in sorted(self.operations.items())
+            }
+        return {
+            'script': script_name(),
+            'started_at': self.started_at,
+            'finished_at': time.time(),
+            'total_calls': sum(o['calls'] for o in operations.values()),
+            'total_retries': sum(o['retries'] for o in operations.values()),
+            'operations': operations,
+        }
+
+    def prometheus_text(self):
+        """Prometheus 텍스트 노출 형식"""
+        script = script_name()
+        lines = [
+            f"# HELP {METRIC_PREFIX}_calls_total AWS API calls by operation",
+            f"# TYPE {METRIC_PREFIX}_calls_total counter",
+        ]
+        with self.lock:
+            items = sorted(self.operations.items())
+            for (service, operation), stats in items:
+                labels = f'script="{script}",service="{service}",operation="{operation}"'
+                lines.append(f"{METRIC_PREFIX}_calls_total{{{labels}}} {stats.calls}")
+
+            lines += [
+                f"# HELP {METRIC_PREFIX}_errors_total AWS API calls that ended in an error",
+                f"# TYPE {METRIC_PREFIX}_errors_total counter",
+            ]
+            for (service, operation), stats in items:
+                for code, count in sorted(stats.errors.items()):
+                    labels = f'script="{script}",service="{service}",operation="{operation}",code="{code}"'
+                    lines.append(f"{METRIC_PREFIX}_errors_total{{{labels}}} {count}")
+
+            lines += [
+                f"# HELP {METRIC_PREFIX}_retries_total AWS API retry attempts",
+                f"# TYPE {METRIC_PREFIX}_retries_total counter",
+            ]
+            for (service, operation), stats in items:
+                labels = f'script="{script}",service="{service}",operation="{operation}"'
+                lines.append(f"{METRIC_PREFIX}_retries_total{{{labels}}} {stats.retries}")
+
+            lines += [
+                f"# HELP {METRIC_PREFIX}_call_duration_seconds AWS API call latency including retries",
+                f"# TYPE {METRIC_PREFIX}_call_duration_seconds histogram",
+            ]
+            for (service, operation), stats in items:
+                labels = f'script="{script}",service="{service}",operation="{operation}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), stats.buckets):
+                    cumulative += count
+                    lines.append(f'{METRIC_PREFIX}_call_duration_seconds_bucket{{{labels},le="{bound}"}} '
+                                 f'{cumulative}')
+                lines.append(f"{METRIC_PREFIX}_call_duration_seconds_sum{{{labels}}} {stats.latency_sum:.6f}")
+                lines.append(f"{METRIC_PREFIX}_call_duration_seconds_count{{{labels}}} {stats.calls}")
+        return '\n'.join(lines) + '\n'
+
+    def write_reports(self, directory=METRICS_DIR):
+        """종료 시 <스크립트>.json, <스크립트>.prom 저장 (호출이 없으면 생략)"""
+        if METRICS_MODE == 'off' or not self.operations:
+            return
+        base = os.path.join(directory, script_name())
+        report = self.report()
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(f"{base}.json", 'w') as f:
+                json.dump(report, f, indent=2)
+            text = self.prometheus_text()
+            tmp_path = f"{base}.prom.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+            # textfile collector 가 쓰다 만 파일을 읽지 않도록 교체
+            os.replace(tmp_path, f"{base}.prom")
+        except OSError as e:
+            print(f"⚠️  AWS API 지표 저장 실패: {e}")
+            return
+
+        print(f"\n📈 AWS API 지표: 호출 {report['total_calls']}회, 재시도 {report['total_retries']}회 "
+              f"→ {base}.json, {base}.prom")
+        if PUSHGATEWAY_URL:
+            self.push(text)
+
+    def push(self, text):
+        url = f"{PUSHGATEWAY_URL.rstrip('/')}/metrics/job/dailyfeed_aws/script/{script_name()}"
+        request = urllib.request.Request(url, data=text.encode(), method='PUT',
+                                         headers={'Content-Type': 'text/plain; version=0.0.4'})
+        try:
+            urllib.request.urlopen(request, timeout=5).close()
+        except OSError as e:
+            print(f"⚠️  Pushgateway 전송 실패: {e}")
+
+
+def script_name():
+    """실행 중인 스크립트 이름 (rds-deploy-all.py → rds-deploy-all)"""
+    name = os.path.basename(sys.argv[0] or 'python')
+    return os.path.splitext(name)[0] or 'python'
+
+
+metrics = ApiMetrics()
+atexit.register(metrics.write_reports)
@@ -1,73 +1,191 @@
 # cleanup_all.py
-import boto3
 import time
 
-def cleanup_all(db_instance_id='dailyfeed-dev'):
-    """모든 리소스 삭제"""
-    
-    print("🗑️  리소스 정리 시작...\n")
-    
-    region = 'ap-northeast-2'
-    rds = boto3.client('rds', region_name=region)
-    lambda_client = boto3.client('lambda', region_name=region)
-    events = boto3.client('events', region_name=region)
-    iam = boto3.client('iam')
-    ec2 = boto3.client('ec2', region_name=region)
-    
-    # 1. EventBridge 규칙 삭제
-    print("1. EventBridge 규칙 삭제...")
-    for rule_name in ['RDSScheduler-Start-9AM', 'RDSScheduler-Stop-6PM']:
-        try:
-            events.remove_targets(Rule=rule_name, Ids=['1'])
-            events.delete_rule(Name=rule_name)
-            print(f"   ✅ {rule_name} 삭제")
-        except:
-            print(f"   ⚠️  {rule_name} 없음")
-    
-    # 2. Lambda 함수 삭제
-    print("\n2. Lambda 함수 삭제...")
+from botocore.exceptions import ClientError
+
+import aws_client
+from dag_executor import DagExecutor, StepFailedError
+from rds_waiter import RDSReadinessWaiter
+
+def delete_rule(events, rule_name):
+    """EventBridge 규칙의 타겟 제거 후 규칙 삭제"""
+    try:
+        targets = events.list_targets_by_rule(Rule=rule_name)['Targets']
+        if targets:
+            events.remove_targets(Rule=rule_name, Ids=[t['Id'] for t in targets])
+        events.delete_rule(Name=rule_name)
+        print(f"   ✅ {rule_name} 삭제")
+    except events.exceptions.ResourceNotFoundException:
+        print(f"   ⚠️  {rule_name} 없음")
+
+def delete_lambda_function(lambda_client):
     try:
         lambda_client.delete_function(FunctionName='RDSScheduler')
         print("   ✅ Lambda 함수 삭제")
-    except:
+    except lambda_client.exceptions.ResourceNotFoundException:
         print("   ⚠️  Lambda 함수 없음")
-    
-    # 3. IAM 역할 삭제
-    print("\n3. IAM 역할 삭제...")
+
+def delete_lambda_role(iam):
     try:
         iam.delete_role_policy(
             RoleName='RDSSchedulerLambdaRole',
             PolicyName='RDSSchedulerPolicy'
         )
+    except iam.exceptions.NoSuchEntityException:
+        pass
+    try:
         iam.delete_role(RoleName='RDSSchedulerLambdaRole')
         print("   ✅ IAM 역할 삭제")
-    except:
+    except iam.exceptions.NoSuchEntityException:
         print("   ⚠️  IAM 역할 없음")
-    
-    # 4. RDS 인스턴스 삭제
-    print(f"\n4. RDS 인스턴스 삭제: {db_instance_id}...")
+
+# 삭제 요청이 거부되는 진행 중 상태 → 삭제 가능해지는 상태
+SETTLING_STATUSES = {
+    'creating': 'available',
+    'backing-up': 'available',
+    'modifying': 'available',
+    'rebooting': 'available',
+    'starting': 'available',
+    'configuring-enhanced-monitoring': 'available',
+    'configuring-log-exports': 'available',
+    'stopping': 'stopped',
+}
+DELETE_ATTEMPTS = 3
+
+def delete_rds_instance(rds, db_instance_id):
+    """
+    RDS 삭제 요청 (삭제를 시작했으면 True)
+
+    InvalidDBInstanceStateFault 이면 현재 상태를 다시 조회해, 이미 삭제 중이면 True,
+    진행 중인 작업이 있으면 끝날 때까지 기다렸다가 다시 요청하고, 그 밖의 상태면 실패로 처리한다.
+    """
+    fresh = aws_client.client('rds', region_name=rds.meta.region_name, fresh=True)
+    for _ in range(DELETE_ATTEMPTS):
+        try:
+            rds.delete_db_instance(
+                DBInstanceIdentifier=db_instance_id,
+                SkipFinalSnapshot=True
+            )
+            print(f"   ✅ RDS 삭제 시작: {db_instance_id} (5-10분 소요)")
+            return True
+        except rds.exceptions.DBInstanceNotFoundFault:
+            print(f"   ⚠️  RDS 인스턴스 없음: {db_instance_id}")
+            return False
+        except rds.exceptions.InvalidDBInstanceStateFault:
+            try:
+                db = fresh.describe_db_instances(DBInstanceIdentifier=db_instance_id)['DBInstances'][0]
+            except fresh.exceptions.DBInstanceNotFoundFault:
+                print(f"   ⚠️  RDS 인스턴스 없음: {db_instance_id}")
+                return False
+            status = db['DBInstanceStatus']
+            if status == 'deleting':
+                print(f"   ℹ️  RDS 이미 삭제 진행 중: {db_instance_id}")
+                return True
+            if status in ('available', 'stopped'):
+                # 조회 사이에 진행 중이던 작업이 끝난 경우
+                continue
+            if status not in SETTLING_STATUSES:
+                raise RuntimeError(f"{db_instance_id}: 삭제할 수 없는 상태 {status}")
+            print(f"   ⏳ RDS {status} 상태, 완료 후 삭제 재시도: {db_instance_id}")
+            RDSReadinessWaiter(fresh, timeout=1800).wait(
+                db_instance_id, target=SETTLING_STATUSES[status], fresh=False
+            )
+    raise RuntimeError(f"{db_instance_id}: 삭제 요청 {DELETE_ATTEMPTS}회 거부됨")
+
+def wait_rds_deleted(rds, db_instance_id, deleting):
+    if not deleting:
+        return
+    print(f"   ⏳ RDS 삭제 완료 대기: {db_instance_id}")
+    RDSReadinessWaiter(rds, timeout=1800).wait(db_instance_id, target='deleted')
+
+def delete_security_group(ec2, group_name, timeout=600):
+    """
+    보안 그룹 삭제
+
+    RDS 삭제 직후에는 ENI가 남아 있어 DependencyViolation이 발생하므로,
+    해당 보안 그룹을 사용하는 ENI가 사라질 때까지 기다렸다가 삭제한다.
+    """
+    sgs = ec2.describe_security_groups(
+        Filters=[{'Name': 'group-name', 'Values': [group_name]}]
+    )['SecurityGroups']
+    if not sgs:
+        print(f"   ⚠️  보안 그룹 없음: {group_name}")
+        return
+    sg_id = sgs[0]['GroupId']
+
+    # ENI 목록은 매번 최신 상태를 조회해야 하므로 캐시를 거치지 않는다
+    ec2_fresh = aws_client.client('ec2', region_name=ec2.meta.region_name, fresh=True)
+    deadline = time.monotonic() + timeout
+    delay = 5
+    while True:
+        enis = ec2_fresh.describe_network_interfaces(
+            Filters=[{'Name': 'group-id', 'Values': [sg_id]}]
+        )['NetworkInterfaces']
+        if not enis:
+            try:
+                ec2.delete_security_group(GroupId=sg_id)
+                print(f"   ✅ 보안 그룹 삭제: {group_name} ({sg_id})")
+                return
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'DependencyViolation':
+                    raise
+
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"보안 그룹 삭제 대기 시간 초과: {sg_id}")
+        print(f"   ⏳ 보안 그룹 사용 중 (ENI {len(enis)}개), {delay}초 후 재시도")
+        time.sleep(delay)
+        delay = min(delay * 2, 30)
+
+def cleanup_all(db_instance_id='dailyfeed-dev', group_name='dailyfeed-rds-dev-sg'):
+    """
+    모든 리소스 삭제
+
+    의존 관계: 규칙 → Lambda 함수 → IAM 역할, RDS 삭제 → 삭제 완료 → 보안 그룹
+    서로 독립적인 삭제는 동시에 진행한다.
+    """
+
+    print("🗑️  리소스 정리 시작...\n")
+
+    region = 'ap-northeast-2'
+    rds = aws_client.client('rds', region_name=region)
+    lambda_client = aws_client.client('lambda', region_name=region)
+    events = aws_client.client('events', region_name=region)
+    iam = aws_client.client('iam')
+    ec2 = aws_client.client('ec2', region_name=region)
+
+    rule_names = [
+        rule['Name']
+        for page in events.get_paginator('list_rules').paginate(NamePrefix='RDSScheduler-')
+        for rule in page['Rules']
+    ]
+
+    executor = DagExecutor(max_workers=8)
+    for rule_name in rule_names:
+        executor.add_step(f"rule:{rule_name}",
+                          lambda rule_name=rule_name: delete_rule(events, rule_name))
+    executor.add_step('lambda_function', lambda *_: delete_lambda_function(lambda_client),
+                      deps=[f"rule:{rule_name}" for rule_name in rule_names])
+    executor.add_step('iam_role', lambda _: delete_lambda_role(iam), deps=['lambda_function'])
+    executor.add_step('rds_instance', lambda: delete_rds_instance(rds, db_instance_id))
+    executor.add_step('rds_deleted', lambda deleting: wait_rds_deleted(rds, db_instance_id, deleting),
+                      deps=['rds_instance'])
+    executor.add_step('security_group', lambda _: delete_security_group(ec2, group_name),
+                      deps=['rds_deleted'])
+
     try:
-        rds.delete_db_instance(
-            DBInstanceIdentifier=db_instance_id,
-            SkipFinalSnapshot=True
-        )
-        print(f"   ✅ RDS 삭제 시작 (5-10분 소요)")
-    except:
-        print(f"   ⚠️  RDS 인스턴스 없음")
-    
-    # 5. 보안 그룹 삭제 (RDS 삭제 후 가능)
-    print("\n5. 보안 그룹 정리...")
-    print("   ℹ️  RDS 삭제 완료 후 수동으로 삭제하세요:")
-    print("   aws ec2 delete-security-group --group-name dailyfeed-rds-dev-sg")
-    
+        executor.run()
+    except StepFailedError as e:
+        print(f"\n❌ 일부 리소스 정리 실패: {e}")
+        return False
+
     print("\n✅ 정리 완료!")
-    print("   RDS 삭제는 백그라운드에서 진행됩니다.")
+    return True
 
 if __name__ == '__main__':
     print("⚠️  경고: 모든 리소스가 삭제됩니다!")
     response = input("정말로 삭제하시겠습니까? (yes/no): ")
-    
+
     if response.lower() == 'yes':
         cleanup_all('dailyfeed-dev')
     else:
-        print("취소되었습니다.")
\ No newline at end of file
+        print("취소되었습니다.")
@@ -0,0 +1,150 @@
+# dag_executor.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class StepFailedError(Exception):
+    """하나 이상의 단계가 실패했을 때 발생"""
+
+    def __init__(self, failures):
+        self.failures = failures
+        names = ', '.join(failures)
+        super().__init__(f"실패한 단계: {names}")
+
+
+class DagExecutor:
+    """
+    의존성 그래프 기반 단계 실행기
+
+    서로 의존하지 않는 단계는 스레드 풀에서 동시에 실행하고,
+    실제 의존 관계가 있는 지점에서만 합류한다.
+    각 단계 함수는 의존 단계의 결과를 deps 순서대로 인자로 받는다.
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.steps = {}
+        self.order = []
+        self.results = {}
+        self.timings = {}
+        self._lock = threading.Lock()
+
+    def add_step(self, name, func, deps=()):
+        """단계 등록 (deps: 먼저 끝나야 하는 단계 이름 목록)"""
+        if name in self.steps:
+            raise ValueError(f"중복된 단계 이름: {name}")
+        self.steps[name] = (func, tuple(deps))
+        self.order.append(name)
+        return self
+
+    def _validate(self):
+        for name, (_, deps) in self.steps.items():
+            for dep in deps:
+                if dep not in self.steps:
+                    raise ValueError(f"{name}: 알 수 없는 의존 단계 {dep}")
+
+        # 위상 정렬로 순환 의존 검사
+        remaining = {name: set(deps) for name, (_, deps) in self.steps.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"순환 의존: {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def _run_step(self, name, started_at):
+        func, deps = self.steps[name]
+        args = [self.results[dep] for dep in deps]
+        start = time.monotonic()
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.timings[name] = {
+                    'offset': start - started_at,
+                    'duration': time.monotonic() - start,
+                }
+
+    def run(self):
+        """
+        그래프 실행
+
+        실패한 단계에 의존하는 단계는 건너뛰고, 독립적인 단계는 계속 진행한다.
+        모든 단계가 끝난 뒤 요약을 출력하고, 실패가 있으면 StepFailedError 발생
+        """
+        self._validate()
+
+        status = {name: 'pending' for name in self.order}
+        failures = {}
+        started_at = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+
+            while True:
+                # 의존 단계가 실패/건너뜀이면 건너뛰기
+                changed = True
+                while changed:
+                    changed = False
+                    for name in self.order:
+                        if status[name] != 'pending':
+                            continue
+                        deps = self.steps[name][1]
+                        if any(status[dep] in ('failed', 'skipped') for dep in deps):
+                            status[name] = 'skipped'
+                            changed = True
+
+                # 의존 단계가 모두 성공한 단계 제출
+                for name in self.order:
+                    if status[name] != 'pending':
+                        continue
+                    deps = self.steps[name][1]
+                    if all(status[dep] == 'done' for dep in deps):
+                        status[name] = 'running'
+                        running[pool.submit(self._run_step, name, started_at)] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        self.results[name] = future.result()
+                        status[name] = 'done'
+                    except Exception as e:
+                        status[name] = 'failed'
+                        failures[name] = e
+                        print(f"❌ {name} 단계 실패: {e}")
+
+        self.print_summary(status, time.monotonic() - started_at)
+
+        if failures:
+            raise StepFailedError(failures)
+        return self.results
+
+    def print_summary(self, status, total):
+        """단계별 소요 시간 요약 출력"""
+        labels = {
+            'done': '✅ 성공',
+            'failed': '❌ 실패',
+            'skipped': '⏭️  건너뜀',
+        }
+        width = max(len(name) for name in self.order)
+
+        print("\n" + "="*60)
+        print("⏱️  단계별 소요 시간")
+        print("="*60)
+        for name in self.order:
+            timing = self.timings.get(name)
+            if timing:
+                print(f"   {name:<{width}}  {labels[status[name]]}  "
+                      f"시작 +{timing['offset']:6.1f}s  소요 {timing['duration']:6.1f}s")
+            else:
+                print(f"   {name:<{width}}  {labels[status[name]]}")
+
+        serial = sum(t['duration'] for t in self.timings.values())
+        print(f"\n   전체 소요: {total:.1f}s (순차 실행 시 {serial:.1f}s)")
@@ -0,0 +1,316 @@
+# db_users.py
+import json
+import os
+import re
+
+import pymysql
+
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'db-users.json')
+DEFAULT_DATABASE = 'dailyfeed'
+
+# mysql.db / mysql.user 의 권한 컬럼 → GRANT 키워드
+DB_PRIVILEGE_COLUMNS = {
+    'Select_priv': 'SELECT',
+    'Insert_priv': 'INSERT',
+    'Update_priv': 'UPDATE',
+    'Delete_priv': 'DELETE',
+    'Create_priv': 'CREATE',
+    'Drop_priv': 'DROP',
+    'Grant_priv': 'GRANT OPTION',
+    'References_priv': 'REFERENCES',
+    'Index_priv': 'INDEX',
+    'Alter_priv': 'ALTER',
+    'Create_tmp_table_priv': 'CREATE TEMPORARY TABLES',
+    'Lock_tables_priv': 'LOCK TABLES',
+    'Create_view_priv': 'CREATE VIEW',
+    'Show_view_priv': 'SHOW VIEW',
+    'Create_routine_priv': 'CREATE ROUTINE',
+    'Alter_routine_priv': 'ALTER ROUTINE',
+    'Execute_priv': 'EXECUTE',
+    'Event_priv': 'EVENT',
+    'Trigger_priv': 'TRIGGER',
+}
+GLOBAL_PRIVILEGE_COLUMNS = {
+    **DB_PRIVILEGE_COLUMNS,
+    'Reload_priv': 'RELOAD',
+    'Process_priv': 'PROCESS',
+    'Show_db_priv': 'SHOW DATABASES',
+    'Repl_slave_priv': 'REPLICATION SLAVE',
+    'Repl_client_priv': 'REPLICATION CLIENT',
+    'Create_user_priv': 'CREATE USER',
+}
+TABLE_PRIVILEGES = {
+    'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'CREATE', 'DROP', 'GRANT OPTION',
+    'REFERENCES', 'INDEX', 'ALTER', 'CREATE VIEW', 'SHOW VIEW', 'TRIGGER',
+}
+
+# ALL PRIVILEGES 가 의미하는 권한 (GRANT OPTION 제외)
+ALL_PRIVILEGES = {
+    'db': set(DB_PRIVILEGE_COLUMNS.values()) - {'GRANT OPTION'},
+    'table': TABLE_PRIVILEGES - {'GRANT OPTION'},
+}
+ALLOWED_PRIVILEGES = {
+    'global': set(GLOBAL_PRIVILEGE_COLUMNS.values()),
+    'db': set(DB_PRIVILEGE_COLUMNS.values()),
+    'table': TABLE_PRIVILEGES,
+}
+
+IDENTIFIER = re.compile(r'^\w+$')
+ERROR_NO_SUCH_TABLE = 1146
+
+PLAN_SYMBOLS = {'create': '+', 'grant': '+', 'revoke': '-', 'skip': '!'}
+
+
+class ManifestError(Exception):
+    pass
+
+
+def _privilege_list(columns):
+    return "CONCAT_WS(',', " + ', '.join(
+        f"IF({column} = 'Y', '{privilege}', NULL)" for column, privilege in columns.items()
+    ) + ")"
+
+
+# 사용자 존재 여부와 전역/DB/테이블 권한을 쿼리 한 번으로 조회
+CURRENT_STATE_QUERY = f"""
+    SELECT 'global' AS level, User AS user, Host AS host, NULL AS db, NULL AS tbl,
+           {_privilege_list(GLOBAL_PRIVILEGE_COLUMNS)} AS privileges
+    FROM mysql.user WHERE User IN ({{users}})
+    UNION ALL
+    SELECT 'db', User, Host, Db, NULL, {_privilege_list(DB_PRIVILEGE_COLUMNS)}
+    FROM mysql.db WHERE User IN ({{users}})
+    UNION ALL
+    SELECT 'table', User, Host, Db, Table_name, UPPER(Table_priv)
+    FROM mysql.tables_priv WHERE User IN ({{users}})
+"""
+
+
+class UserSpec:
+    """매니페스트의 사용자 하나: grants 는 (db, table) → 권한 집합 (전역은 (None, None))"""
+
+    def __init__(self, name, host='%', password=None, grants=None):
+        self.name = name
+        self.host = host
+        self.password = password
+        self.grants = grants or {}
+
+    @property
+    def label(self):
+        return f"{self.name}@{self.host}"
+
+    def __repr__(self):
+        return f"UserSpec({self.label}, {len(self.grants)} grants)"
+
+
+def _level(target):
+    db, table = target
+    if db is None:
+        return 'global'
+    return 'db' if table is None else 'table'
+
+
+def describe_target(target):
+    db, table = target
+    if db is None:
+        return '*.*'
+    return f"{db}.{table or '*'}"
+
+
+def parse_target(on):
+    """'dailyfeed.*' → ('dailyfeed', None), 'dailyfeed.posts' → ('dailyfeed', 'posts'), '*.*' → (None, None)"""
+    db, sep, table = on.partition('.')
+    if not sep:
+        raise ManifestError(f"권한 대상 형식 오류(db.* 또는 db.table): {on}")
+    if db == '*':
+        if table != '*':
+            raise ManifestError(f"권한 대상 형식 오류: {on}")
+        return None, None
+    for name in (db, table):
+        if name != '*' and not IDENTIFIER.match(name):
+            raise ManifestError(f"허용하지 않는 식별자: {on}")
+    return db, None if table == '*' else table
+
+
+def normalize_privileges(privileges, target):
+    """['ALL PRIVILEGES'] 등 → 비교 가능한 권한 집합"""
+    level = _level(target)
+    result = set()
+    for privilege in privileges:
+        privilege = ' '.join(privilege.upper().split())
+        if privilege in ('ALL', 'ALL PRIVILEGES'):
+            if level == 'global':
+                raise ManifestError("*.* 에 ALL PRIVILEGES 는 지원하지 않습니다 (권한을 나열해 주세요)")
+            result |= ALL_PRIVILEGES[level]
+        elif privilege in ALLOWED_PRIVILEGES[level]:
+            result.add(privilege)
+        else:
+            raise ManifestError(f"{describe_target(target)} 에 사용할 수 없는 권한: {privilege}")
+    return frozenset(result)
+
+
+def load_manifest(path=DEFAULT_MANIFEST, database=None):
+    """
+    사용자 매니페스트(JSON) → [UserSpec]
+
+    "on" 의 {database} 는 database 인자(없으면 매니페스트의 database)로 바뀐다.
+    비밀번호는 "password" 또는 "password_env"(환경 변수 이름)로 지정한다.
+    """
+    with open(path) as f:
+        manifest = json.load(f)
+    database = database or manifest.get('database', DEFAULT_DATABASE)
+
+    users = []
+    for entry in manifest['users']:
+        if not IDENTIFIER.match(entry['name']):
+            raise ManifestError(f"허용하지 않는 사용자 이름: {entry['name']}")
+        password = entry.get('password')
+        if entry.get('password_env'):
+            password = os.getenv(entry['password_env'], password)
+        grants = {}
+        for grant in entry.get('grants', []):
+            target = parse_target(grant['on'].format(database=database))
+            grants[target] = grants.get(target, frozenset()) | normalize_privileges(grant['privileges'], target)
+        users.append(UserSpec(entry['name'], entry.get('host', '%'), password, grants))
+    return users
+
+
+def read_current_state(cursor, users):
+    """(이름, 호스트) → 권한 대상 → 권한 집합 (사용자가 없으면 키 없음)"""
+    names = sorted({user.name for user in users})
+    placeholders = ', '.join(['%s'] * len(names))
+    cursor.execute(CURRENT_STATE_QUERY.format(users=placeholders), names * 3)
+
+    state = {}
+    for row in cursor.fetchall():
+        level, user, host, db, table, privileges = row
+        grants = state.setdefault((user, host), {})
+        # GRANT ON `a_b`.* 는 mysql.db 에 a\_b 로 저장될 수 있다
+        target = (db.replace('\\_', '_') if db else None, table)
+        privileges = {p.strip() for p in (privileges or '').split(',') if p.strip()}
+        if level == 'table':
+            privileges = {'GRANT OPTION' if p == 'GRANT' else p for p in privileges}
+        if privileges:
+            grants[target] = frozenset(privileges)
+    return state
+
+
+def _quote_target(target):
+    db, table = target
+    if db is None:
+        return '*.*'
+    return f"`{db}`.`{table}`" if table else f"`{db}`.*"
+
+
+def _grant_statement(privileges, target):
+    grant_option = 'GRANT OPTION' in privileges
+    listed = sorted(privileges - {'GRANT OPTION'}) or ['USAGE']
+    statement = f"GRANT {', '.join(listed)} ON {_quote_target(target)} TO %s@%s"
+    return statement + (' WITH GRANT OPTION' if grant_option else '')
+
+
+def plan(users, state, prune=False):
+    """
+    변경 목록 [(사용자, 작업, 설명, SQL, 인자)]
+
+    매니페스트에 있는 권한 중 없는 것만 GRANT 하고, prune=True 이면
+    관리 대상 사용자에게 매니페스트에 없는 권한을 REVOKE 한다.
+    """
+    changes = []
+    for user in users:
+        account = (user.name, user.host)
+        current = state.get(account)
+        if current is None:
+            if not user.password:
+                changes.append((user.label, 'skip', '비밀번호 없음 (password_env 환경 변수 확인)', None, None))
+                continue
+            changes.append((user.label, 'create', 'CREATE USER',
+                            "CREATE USER %s@%s IDENTIFIED BY %s", (user.name, user.host, user.password)))
+            current = {}
+
+        for target, desired in user.grants.items():
+            missing = desired - current.get(target, frozenset())
+            if missing:
+                changes.append((user.label, 'grant', f"GRANT {', '.join(sorted(missing))} ON {describe_target(target)}",
+                                _grant_statement(missing, target), account))
+
+        if not prune:
+            continue
+        for target, privileges in current.items():
+            extra = privileges - user.grants.get(target, frozenset())
+            if extra:
+                statement = f"REVOKE {', '.join(sorted(extra))} ON {_quote_target(target)} FROM %s@%s"
+                changes.append((user.label, 'revoke', f"REVOKE {', '.join(sorted(extra))} ON {describe_target(target)}",
+                                statement, account))
+    return changes
+
+
+def print_plan(changes, log=print):
+    if not changes:
+        log("✅ 변경 없음: 모든 사용자/권한이 매니페스트와 같습니다")
+        return
+    width = max(len(user) for user, *_ in changes)
+    for user, action, detail, _, _ in changes:
+        log(f"{PLAN_SYMBOLS[action]} {user:<{width}}  {detail}")
+
+
+def apply(connection, changes, log=print):
+    """
+    변경 적용 → (실패한 변경 수, 경고 수)
+
+    테이블이 아직 없어 실패한 테이블 단위 GRANT 는 스키마 적용 후 다시 실행하면 되므로 경고로 센다.
+    """
+    failures = warnings = 0
+    with connection.cursor() as cursor:
+        for user, action, detail, statement, args in changes:
+            if statement is None:
+                continue
+            try:
+                cursor.execute(statement, args)
+                log(f"✅ {user}: {detail}")
+            except pymysql.MySQLError as e:
+                if e.args and e.args[0] == ERROR_NO_SUCH_TABLE:
+                    log(f"⚠️  {user}: 테이블 없음, 스키마 적용 후 다시 실행하세요 ({detail})")
+                    warnings += 1
+                else:
+                    log(f"❌ {user}: {detail} 실패: {e}")
+                    failures += 1
+    return failures, warnings
+
+
+def connect(host, user, password, port=3306):
+    return pymysql.connect(host=host, port=port, user=user, password=password,
+                           connect_timeout=10, autocommit=True)
+
+
+def provision(host, master_username, master_password, users=None, database=None,
+              port=3306, prune=False, dry_run=False, log=print):
+    """
+    인스턴스 하나에 매니페스트의 사용자/권한 반영 (연결 하나로 조회 → 계획 → 적용)
+
+    반환: (실패 수, 경고 수)
+      실패: 연결/인증 오류, CREATE USER 나 GRANT 실패 등 실제 오류
+      경고: 비밀번호 환경 변수가 없어 건너뛴 사용자, 테이블이 아직 없는 테이블 단위 GRANT
+    """
+    users = users if users is not None else load_manifest(database=database)
+    try:
+        connection = connect(host, master_username, master_password, port=port)
+    except pymysql.MySQLError as e:
+        log(f"❌ 연결 오류: {e}")
+        log("   보안 그룹 설정을 확인하세요.")
+        return 1, 0
+
+    try:
+        with connection.cursor() as cursor:
+            state = read_current_state(cursor, users)
+        changes = plan(users, state, prune=prune)
+        print_plan(changes, log)
+        skipped = sum(1 for _, action, *_ in changes if action == 'skip')
+        if dry_run:
+            return 0, skipped
+        failures, warnings = apply(connection, changes, log)
+        return failures, warnings + skipped
+    except pymysql.MySQLError as e:
+        log(f"❌ 사용자 확인 실패: {e}")
+        return 1, 0
+    finally:
+        connection.close()
@@ -0,0 +1,238 @@
+# lambda_coldstart.py
+# RDSScheduler 핸들러 cold/warm 시작 측정 (AWS 계정 없이 로컬에서 실행)
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+DEFAULT_HANDLER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda_function.py')
+
+# Lambda 는 메모리에 비례해 CPU 를 배정 (1,769MB 에서 vCPU 1개)
+FULL_VCPU_MEMORY_MB = 1769
+MEMORY_SIZES = (128, 256, 512, 1024)
+# Python 런타임 자체가 쓰는 메모리 여유분
+RUNTIME_HEADROOM_MB = 40
+
+RDS_NAMESPACE = 'http://rds.amazonaws.com/doc/2014-10-31/'
+
+
+def _db_instance_xml(db_id, status):
+    return (f"<DBInstance><DBInstanceIdentifier>{db_id}</DBInstanceIdentifier>"
+            f"<DBInstanceStatus>{status}</DBInstanceStatus>"
+            f"<TagList><Tag><Key>AutoShutdown</Key><Value>true</Value></Tag></TagList></DBInstance>")
+
+
+def _response_xml(action, result):
+    return (f'<{action}Response xmlns="{RDS_NAMESPACE}"><{action}Result>{result}</{action}Result>'
+            f'<ResponseMetadata><RequestId>local</RequestId></ResponseMetadata></{action}Response>')
+
+
+class FakeRdsServer:
+    """
+    DescribeDBInstances / StartDBInstance / StopDBInstance 에 고정 응답을 주는 로컬 HTTP 서버
+
+    자식 프로세스는 AWS_ENDPOINT_URL_RDS 로 이 서버를 사용하므로, 핸들러 임포트와
+    클라이언트 생성은 실제와 같고 네트워크 왕복만 latency 로 대신한다.
+    """
+
+    def __init__(self, instances, latency):
+        self.instances = [f"dailyfeed-bench-{i}" for i in range(instances)]
+        self.latency = latency
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                params = parse_qs(self.rfile.read(length).decode())
+                action = params.get('Action', [''])[0]
+                time.sleep(fake.latency)
+                if action == 'DescribeDBInstances':
+                    result = '<DBInstances>' + ''.join(
+                        _db_instance_xml(db_id, 'available') for db_id in fake.instances
+                    ) + '</DBInstances>'
+                elif action in ('StartDBInstance', 'StopDBInstance'):
+                    status = 'starting' if action == 'StartDBInstance' else 'stopping'
+                    result = _db_instance_xml(params['DBInstanceIdentifier'][0], status)
+                else:
+                    self.send_error(400)
+                    return
+                body = _response_xml(action, result).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/xml')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+
+
+def run_child(handler_path, invocations, action):
+    """새 인터프리터에서 핸들러 임포트 → 첫 호출(cold) → 반복 호출(warm) 측정 결과(JSON) 출력"""
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(handler_path)))
+    module_name = os.path.splitext(os.path.basename(handler_path))[0]
+    handler = __import__(module_name)
+    import_ms = (time.perf_counter() - start) * 1000
+
+    event = {'action': action}
+    invoke_start = time.perf_counter()
+    response = handler.lambda_handler(event, None)
+    first_ms = (time.perf_counter() - invoke_start) * 1000
+    cold_ms = (time.perf_counter() - start) * 1000
+    cold_cpu_ms = (time.process_time() - cpu_start) * 1000
+
+    warm = []
+    for _ in range(invocations - 1):
+        invoke_start = time.perf_counter()
+        handler.lambda_handler(event, None)
+        warm.append((time.perf_counter() - invoke_start) * 1000)
+
+    print(json.dumps({
+        'status_code': response['statusCode'],
+        'import_ms': import_ms,
+        'first_invoke_ms': first_ms,
+        'cold_ms': cold_ms,
+        'cold_cpu_ms': cold_cpu_ms,
+        'warm_ms': warm,
+        # ru_maxrss 는 Linux 에서 KB
+        'rss_before_mb': rss_before / 1024,
+        'rss_peak_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def sample(handler_path, invocations, action, endpoint):
+    env = {
+        **os.environ,
+        'AWS_ENDPOINT_URL_RDS': endpoint,
+        'AWS_REGION': 'ap-northeast-2',
+        'AWS_DEFAULT_REGION': 'ap-northeast-2',
+        'AWS_ACCESS_KEY_ID': 'coldstart',
+        'AWS_SECRET_ACCESS_KEY': 'coldstart',
+        'AWS_EC2_METADATA_DISABLED': 'true',
+        'DB_INSTANCE_IDS': '',
+        'TARGET_TAGS': 'AutoShutdown=true',
+        'PYTHONDONTWRITEBYTECODE': '1',
+    }
+    env.pop('AWS_PROFILE', None)
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', '--handler', handler_path,
+         '--invocations', str(invocations), '--action', action],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    # 핸들러 로그 뒤의 마지막 줄이 측정 결과
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def report(samples):
+    cold = [s['cold_ms'] for s in samples]
+    imports = [s['import_ms'] for s in samples]
+    first = [s['first_invoke_ms'] for s in samples]
+    warm = [ms for s in samples for ms in s['warm_ms']]
+    cpu = statistics.median(s['cold_cpu_ms'] for s in samples)
+    peak = max(s['rss_peak_mb'] for s in samples)
+    interpreter = statistics.median(s['rss_before_mb'] for s in samples)
+
+    print("\n" + "="*60)
+    print("측정 결과 (ms)")
+    print("="*60)
+    print(f"   {'':<22} {'p50':>8} {'p95':>8} {'max':>8}")
+    for label, values in (('cold: 임포트', imports), ('cold: 첫 호출', first),
+                          ('cold: 합계', cold), ('warm: 호출', warm)):
+        if values:
+            print(f"   {label:<22} {statistics.median(values):>8.1f} {percentile(values, 0.95):>8.1f} "
+                  f"{max(values):>8.1f}")
+    print(f"\n   cold CPU 시간(중앙값): {cpu:.1f}ms")
+    print(f"   메모리: 인터프리터 {interpreter:.1f}MB → 최대 {peak:.1f}MB (핸들러 {peak - interpreter:.1f}MB)")
+
+    print("\n" + "="*60)
+    print("메모리 크기별 cold start 추정")
+    print("="*60)
+    # 로컬 CPU 를 vCPU 1개로 보고, CPU 시간만 배정 비율에 맞춰 늘린다 (대기 시간은 그대로)
+    wait_ms = max(statistics.median(cold) - cpu, 0)
+    for memory in MEMORY_SIZES:
+        share = min(memory / FULL_VCPU_MEMORY_MB, 1)
+        fits = peak + RUNTIME_HEADROOM_MB <= memory
+        print(f"   {memory:>5}MB  vCPU {share:.2f}  ~{cpu / share + wait_ms:>7.0f}ms  "
+              f"{'✅' if fits else '⚠️  메모리 부족 가능'}")
+    # init 단계는 메모리보다 많은 CPU 를 받을 수 있어 상한에 가깝다
+    print("   (상한 추정치: 실제 값은 CloudWatch Logs REPORT 줄의 Init Duration 으로 확인)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='RDSScheduler Lambda cold/warm 시작 측정')
+    parser.add_argument('--handler', default=DEFAULT_HANDLER, help='측정할 핸들러 파일 (다른 버전과 비교 가능)')
+    parser.add_argument('--samples', type=int, default=5, help='cold start 측정 횟수 (매번 새 프로세스)')
+    parser.add_argument('--invocations', type=int, default=20, help='프로세스마다 호출 횟수 (첫 호출 외에는 warm)')
+    parser.add_argument('--action', default='status', choices=['status', 'start', 'stop'])
+    parser.add_argument('--instances', type=int, default=3, help='태그가 일치하는 가상 인스턴스 수')
+    parser.add_argument('--latency', type=float, default=0.02, help='가상 RDS API 응답 지연(초)')
+    parser.add_argument('--json', action='store_true', help='측정값을 JSON 으로 출력')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.handler, args.invocations, args.action)
+        sys.exit(0)
+
+    print("="*60)
+    print("RDSScheduler Lambda cold/warm 시작 측정")
+    print("="*60)
+    print(f"📦 핸들러: {args.handler}")
+    print(f"🔁 cold {args.samples}회 × 호출 {args.invocations}회, 인스턴스 {args.instances}개, "
+          f"API 지연 {args.latency * 1000:.0f}ms")
+
+    samples = []
+    with FakeRdsServer(args.instances, args.latency) as server:
+        for i in range(args.samples):
+            try:
+                result = sample(args.handler, args.invocations, args.action, server.url)
+            except subprocess.CalledProcessError as e:
+                print(f"❌ 측정 실패:\n{e.stderr}")
+                sys.exit(1)
+            if result['status_code'] != 200:
+                print(f"❌ 핸들러 응답 코드 {result['status_code']}")
+                sys.exit(1)
+            print(f"   #{i + 1}: cold {result['cold_ms']:.1f}ms (임포트 {result['import_ms']:.1f}ms)")
+            samples.append(result)
+
+    if args.json:
+        print(json.dumps(samples, indent=2))
+    report(samples)
+
+# 사용법:
+# python lambda-coldstart.py
+# python lambda-coldstart.py --samples 10 --invocations 50 --action stop --instances 20
+# git show HEAD~1:boto/rds/lambda_function.py > /tmp/lambda_function.py && python lambda-coldstart.py --handler /tmp/lambda_function.py
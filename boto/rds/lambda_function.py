@@ -0,0 +1,270 @@
+# lambda_function.py
+# RDSScheduler Lambda 핸들러 (rds-deploy-all.py가 이 파일을 패키징하여 배포)
+import calendar
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.config import Config
+from botocore.session import get_session
+
+import prewarm
+
+# 대상 선택 기본값 (이벤트 payload의 instances/tags가 우선)
+# - DB_INSTANCE_IDS: 쉼표로 구분한 식별자 목록 (이전 버전의 DB_INSTANCE_ID도 지원)
+# - TARGET_TAGS: 'Key=Value,Key2=Value2' 형식의 태그 조건 (모두 일치)
+DB_INSTANCE_IDS = os.environ.get('DB_INSTANCE_IDS', os.environ.get('DB_INSTANCE_ID', ''))
+TARGET_TAGS = os.environ.get('TARGET_TAGS', '')
+MAX_WORKERS = int(os.environ.get('MAX_WORKERS', '8'))
+
+# 사전 시작: START_RULE_NAME 규칙을 START_TARGET_UTC 에 available 이 되도록 앞당긴다
+START_RULE_NAME = os.environ.get('START_RULE_NAME', 'RDSScheduler-Start-9AM')
+START_TARGET_UTC = os.environ.get('START_TARGET_UTC', '00:00')
+PREWARM_PERCENTILE = float(os.environ.get('PREWARM_PERCENTILE', str(prewarm.DEFAULT_PERCENTILE)))
+PREWARM_MARGIN_SECONDS = int(os.environ.get('PREWARM_MARGIN_SECONDS', str(prewarm.DEFAULT_MARGIN_SECONDS)))
+
+# idle_stop: 최근 IDLE_MINUTES 동안 DB 연결이 없었던 인스턴스만 중지
+IDLE_MINUTES = int(os.environ.get('IDLE_MINUTES', '60'))
+IDLE_METRIC_PERIOD = 300
+
+# "DB instance has been started" (RDS 이벤트 규칙이 이 이벤트로 Lambda 호출)
+START_COMPLETED_EVENT = 'RDS-EVENT-0088'
+
+# RDS API 타임아웃(초): 함수 Timeout(60초) 안에 재시도까지 끝나도록 짧게 설정
+CONNECT_TIMEOUT = float(os.environ.get('RDS_CONNECT_TIMEOUT', '3'))
+READ_TIMEOUT = float(os.environ.get('RDS_READ_TIMEOUT', '10'))
+
+CLIENT_CONFIG = Config(
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=READ_TIMEOUT,
+    retries={'mode': 'standard', 'max_attempts': 3},
+    max_pool_connections=MAX_WORKERS,
+    tcp_keepalive=True,
+)
+
+# 첫 사용 시 만들고 같은 실행 환경의 이후 호출(warm)에서 재사용
+_session = None
+_clients = {}
+_cold_start = True
+
+def get_client(service):
+    """서비스 클라이언트 (boto3/s3transfer 임포트 없이 botocore 세션으로 필요한 서비스만 생성)"""
+    global _session
+    if service not in _clients:
+        if _session is None:
+            _session = get_session()
+        # AWS_REGION은 Lambda 예약 환경 변수이므로 botocore가 자동으로 감지
+        _clients[service] = _session.create_client(service, config=CLIENT_CONFIG)
+    return _clients[service]
+
+def instance_tags(db):
+    return {t['Key']: t['Value'] for t in db.get('TagList', [])}
+
+def parse_tags(value):
+    """'Key=Value,Key2=Value2' → {'Key': 'Value', 'Key2': 'Value2'}"""
+    tags = {}
+    for item in value.split(','):
+        key, sep, tag_value = item.strip().partition('=')
+        if sep:
+            tags[key] = tag_value
+    return tags
+
+def resolve_targets(event):
+    """이벤트 payload → 환경 변수 순서로 대상 인스턴스 목록/태그 조건 결정"""
+    instances = event.get('instances')
+    if instances is None:
+        instances = [i.strip() for i in DB_INSTANCE_IDS.split(',') if i.strip()]
+    tags = event.get('tags')
+    if tags is None:
+        tags = parse_tags(TARGET_TAGS)
+    return instances, tags
+
+def describe_targets(instances, tags):
+    """대상 인스턴스 상태를 한 번의 페이지네이션된 describe로 조회"""
+    kwargs = {}
+    if instances:
+        kwargs['Filters'] = [{'Name': 'db-instance-id', 'Values': instances}]
+
+    # paginator 모델(paginators-1.json)을 읽지 않도록 Marker로 직접 페이지 순회
+    found = []
+    while True:
+        page = get_client('rds').describe_db_instances(**kwargs)
+        for db in page['DBInstances']:
+            db_tags = instance_tags(db)
+            if all(db_tags.get(k) == v for k, v in tags.items()):
+                found.append(db)
+        if not page.get('Marker'):
+            return found
+        kwargs['Marker'] = page['Marker']
+
+def control_instance(action, db):
+    """인스턴스 하나에 시작/중지 요청 (상태가 맞지 않으면 현재 상태만 반환)"""
+    db_instance_id = db['DBInstanceIdentifier']
+    status = db['DBInstanceStatus']
+    start = time.monotonic()
+    result = {'instance': db_instance_id, 'status': status}
+
+    try:
+        if action == 'start' and status == 'stopped':
+            rds = get_client('rds')
+            rds.start_db_instance(DBInstanceIdentifier=db_instance_id)
+            result['result'] = 'Starting'
+            # RDS-EVENT-0088 수신 시 소요 시간 계산에 사용 (실패해도 시작 요청은 성공)
+            try:
+                rds.add_tags_to_resource(
+                    ResourceName=db['DBInstanceArn'],
+                    Tags=[{'Key': prewarm.REQUESTED_TAG, 'Value': str(int(time.time()))}]
+                )
+            except Exception as e:
+                print(f"WARNING: start requested tag not recorded: {db_instance_id} ({e})")
+                result['warning'] = str(e)
+        elif action == 'stop' and status == 'available':
+            get_client('rds').stop_db_instance(DBInstanceIdentifier=db_instance_id)
+            result['result'] = 'Stopping'
+        else:
+            result['result'] = f'Status: {status}'
+    except Exception as e:
+        result['result'] = 'Error'
+        result['error'] = str(e)
+
+    result['elapsed_ms'] = round((time.monotonic() - start) * 1000, 1)
+    return result
+
+def idle_instances(targets):
+    """최근 IDLE_MINUTES 내내 DatabaseConnections 최대값이 0인 available 인스턴스 (get_metric_data 한 번)"""
+    available = [db['DBInstanceIdentifier'] for db in targets if db['DBInstanceStatus'] == 'available']
+    if not available:
+        return set()
+    queries = [{
+        'Id': f"connections{i}",
+        'MetricStat': {
+            'Metric': {
+                'Namespace': 'AWS/RDS',
+                'MetricName': 'DatabaseConnections',
+                'Dimensions': [{'Name': 'DBInstanceIdentifier', 'Value': db_instance_id}],
+            },
+            'Period': IDLE_METRIC_PERIOD,
+            'Stat': 'Maximum',
+        },
+    } for i, db_instance_id in enumerate(available)]
+    end = int(time.time())
+    response = get_client('cloudwatch').get_metric_data(
+        MetricDataQueries=queries, StartTime=end - IDLE_MINUTES * 60, EndTime=end
+    )
+    values = {r['Id']: r['Values'] for r in response['MetricDataResults']}
+
+    # 방금 시작해 지표가 구간 전체에 없으면 유휴로 보지 않는다
+    required = IDLE_MINUTES * 60 // IDLE_METRIC_PERIOD - 1
+    idle = set()
+    for i, db_instance_id in enumerate(available):
+        points = values.get(f"connections{i}", [])
+        if len(points) >= required and max(points, default=0) == 0:
+            idle.add(db_instance_id)
+    return idle
+
+def update_start_schedule():
+    """대상 인스턴스 중 가장 긴 선행 시간으로 시작 규칙 스케줄 갱신 → 적용된 스케줄"""
+    instances, tags = resolve_targets({})
+    lead = max(
+        (prewarm.lead_seconds(prewarm.parse_durations(instance_tags(db).get(prewarm.DURATIONS_TAG)),
+                              PREWARM_PERCENTILE, PREWARM_MARGIN_SECONDS)
+         for db in describe_targets(instances, tags)),
+        default=prewarm.DEFAULT_LEAD_SECONDS,
+    )
+    schedule = prewarm.start_cron(START_TARGET_UTC, lead)
+
+    events = get_client('events')
+    rule = events.describe_rule(Name=START_RULE_NAME)
+    if rule.get('ScheduleExpression') != schedule:
+        kwargs = {'Description': rule['Description']} if rule.get('Description') else {}
+        events.put_rule(Name=START_RULE_NAME, ScheduleExpression=schedule, State=rule['State'], **kwargs)
+        print(f"Start rule: {rule.get('ScheduleExpression')} -> {schedule}")
+    return schedule
+
+def record_start(event):
+    """RDS 시작 완료 이벤트 → 스케줄러가 요청한 start 라면 소요 시간 기록 후 시작 규칙 갱신"""
+    detail = event.get('detail', {})
+    db_instance_id = detail.get('SourceIdentifier')
+    if detail.get('EventID') != START_COMPLETED_EVENT or not db_instance_id:
+        return {'statusCode': 200, 'body': json.dumps({'ignored': detail.get('EventID')})}
+
+    found = describe_targets([db_instance_id], {})
+    requested = instance_tags(found[0]).get(prewarm.REQUESTED_TAG, '') if found else ''
+    if not requested.isdigit():
+        # 수동 시작 등 스케줄러가 요청하지 않은 start 는 기록하지 않는다
+        return {'statusCode': 200, 'body': json.dumps({'ignored': db_instance_id})}
+
+    db = found[0]
+    finished = calendar.timegm(time.strptime(event['time'], '%Y-%m-%dT%H:%M:%SZ'))
+    duration = max(finished - int(requested), 0)
+    durations = prewarm.parse_durations(instance_tags(db).get(prewarm.DURATIONS_TAG)) + [duration]
+
+    rds = get_client('rds')
+    rds.add_tags_to_resource(
+        ResourceName=db['DBInstanceArn'],
+        Tags=[{'Key': prewarm.DURATIONS_TAG, 'Value': prewarm.format_durations(durations)}]
+    )
+    rds.remove_tags_from_resource(ResourceName=db['DBInstanceArn'], TagKeys=[prewarm.REQUESTED_TAG])
+    print(f"Start duration: {db_instance_id} {duration}s ({len(durations)} samples)")
+
+    try:
+        schedule = update_start_schedule()
+    except Exception as e:
+        return {'statusCode': 500, 'body': f"Recorded {duration}s, schedule update failed: {e}"}
+    return {
+        'statusCode': 200,
+        'body': json.dumps({'instance': db_instance_id, 'duration_s': duration, 'schedule': schedule}),
+    }
+
+def lambda_handler(event, context):
+    global _cold_start
+    cold_start, _cold_start = _cold_start, False
+    if event.get('source') == 'aws.rds':
+        print(f"RDS event: {json.dumps(event.get('detail', {}))}, Cold start: {cold_start}")
+        return record_start(event)
+
+    action = event.get('action', 'status')
+    instances, tags = resolve_targets(event)
+    print(f"Action: {action}, Instances: {instances or '*'}, Tags: {tags}, Cold start: {cold_start}")
+
+    if not instances and not tags:
+        return {'statusCode': 400, 'body': 'No target instances or tags configured'}
+
+    start = time.monotonic()
+    try:
+        targets = describe_targets(instances, tags)
+    except Exception as e:
+        return {'statusCode': 500, 'body': str(e)}
+    describe_ms = round((time.monotonic() - start) * 1000, 1)
+
+    control_action = action
+    if action == 'idle_stop':
+        try:
+            idle = idle_instances(targets)
+        except Exception as e:
+            return {'statusCode': 500, 'body': str(e)}
+        print(f"Idle for {IDLE_MINUTES}m: {sorted(idle) or '-'}")
+        targets = [db for db in targets if db['DBInstanceIdentifier'] in idle]
+        control_action = 'stop'
+
+    if len(targets) > 1:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            results = list(pool.map(lambda db: control_instance(control_action, db), targets))
+    else:
+        results = [control_instance(control_action, db) for db in targets]
+
+    for result in results:
+        print(json.dumps(result))
+
+    failed = [r for r in results if r['result'] == 'Error']
+    return {
+        'statusCode': 500 if failed else 200,
+        'body': json.dumps({
+            'action': action,
+            'results': results,
+            'describe_ms': describe_ms,
+            'total_ms': round((time.monotonic() - start) * 1000, 1),
+            'cold_start': cold_start,
+        })
+    }
@@ -0,0 +1,88 @@
+# lambda_package.py
+import base64
+import hashlib
+import io
+import os
+import zipfile
+
+# 모든 ZIP 항목에 고정 타임스탬프/권한을 사용해 같은 소스 → 같은 바이트 보장
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+ZIP_FILE_MODE = 0o644 << 16
+
+CACHE_DIR = os.path.expanduser('~/.cache/dailyfeed/lambda')
+
+
+class LambdaPackage:
+    """메모리에서 빌드한 Lambda 배포 패키지"""
+
+    def __init__(self, zip_bytes, source_hash, cached=False):
+        self.zip_bytes = zip_bytes
+        self.source_hash = source_hash
+        self.cached = cached
+        # Lambda의 CodeSha256과 같은 형식 (SHA-256 digest의 base64)
+        self.code_sha256 = base64.b64encode(hashlib.sha256(zip_bytes).digest()).decode()
+
+    def matches(self, function_configuration):
+        """배포된 함수(get_function의 Configuration)와 코드가 같은지 여부"""
+        return function_configuration.get('CodeSha256') == self.code_sha256
+
+
+def source_hash(files):
+    """파일 이름과 내용으로 계산한 소스 해시 (항목 순서와 무관)"""
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        content = files[name]
+        digest.update(name.encode())
+        digest.update(len(content).to_bytes(8, 'big'))
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def build_zip(files):
+    """
+    결정적 ZIP 생성
+
+    항목을 이름순으로 정렬하고 타임스탬프/권한을 고정하여
+    같은 소스에서는 항상 같은 바이트가 나오도록 한다.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name in sorted(files):
+            info = zipfile.ZipInfo(name, date_time=ZIP_TIMESTAMP)
+            info.external_attr = ZIP_FILE_MODE
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3
+            zf.writestr(info, files[name])
+    return buffer.getvalue()
+
+
+def build_package(files, cache_dir=CACHE_DIR):
+    """
+    Lambda 패키지 빌드 (소스 해시로 로컬 캐시)
+
+    files: ZIP 내 경로 → 내용(bytes 또는 str)
+    """
+    files = {
+        name: content.encode() if isinstance(content, str) else content
+        for name, content in files.items()
+    }
+    key = source_hash(files)
+
+    cache_path = os.path.join(cache_dir, f"{key}.zip") if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            return LambdaPackage(f.read(), key, cached=True)
+
+    zip_bytes = build_zip(files)
+
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(zip_bytes)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  패키지 캐시 저장 실패: {e}")
+
+    return LambdaPackage(zip_bytes, key)
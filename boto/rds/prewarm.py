@@ -0,0 +1,99 @@
+# prewarm.py
+# 예측 기반 사전 시작 타이밍 모델 (Lambda 패키지, 배포 스크립트, 리플레이 스크립트가 공유)
+import math
+import re
+
+# 인스턴스 태그: 스케줄러가 start 요청한 시각(epoch 초), 최근 start → available 소요 시간(초)
+REQUESTED_TAG = 'SchedulerStartRequestedAt'
+DURATIONS_TAG = 'SchedulerStartDurations'
+
+# 태그 값은 최대 256자이므로 최근 기록만 유지
+HISTORY_SIZE = 30
+TAG_VALUE_LIMIT = 256
+
+# 기록이 부족할 때 사용하는 선행 시간 (정지된 RDS 시작에 보통 5-10분)
+DEFAULT_LEAD_SECONDS = 600
+MIN_SAMPLES = 3
+DEFAULT_PERCENTILE = 90
+DEFAULT_MARGIN_SECONDS = 60
+# 잘못된 기록으로 지나치게 일찍 시작하지 않도록 상한
+MAX_LEAD_SECONDS = 45 * 60
+
+CRON_DAILY = re.compile(r'^cron\((\d+) (\d+) \* \* \? \*\)$')
+
+
+def parse_durations(value):
+    """'412,388,...' → [412, 388, ...] (잘못된 값은 무시)"""
+    durations = []
+    for item in (value or '').split(','):
+        item = item.strip()
+        if item.isdigit():
+            durations.append(int(item))
+    return durations
+
+
+def format_durations(durations):
+    """최근 HISTORY_SIZE개를 태그 길이 제한 안에서 'a,b,c' 로"""
+    recent = [str(int(d)) for d in durations[-HISTORY_SIZE:]]
+    while len(','.join(recent)) > TAG_VALUE_LIMIT:
+        recent.pop(0)
+    return ','.join(recent)
+
+
+def percentile(values, pct):
+    """nearest-rank 백분위"""
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def lead_seconds(durations, pct=DEFAULT_PERCENTILE, margin=DEFAULT_MARGIN_SECONDS,
+                 default=DEFAULT_LEAD_SECONDS, min_samples=MIN_SAMPLES):
+    """
+    목표 시각보다 얼마나 먼저 start 해야 하는지(초)
+
+    최근 소요 시간의 pct 백분위 + margin, 기록이 min_samples 미만이면 default 를 쓴다.
+    """
+    recent = durations[-HISTORY_SIZE:]
+    if len(recent) < min_samples:
+        lead = default
+    else:
+        lead = percentile(recent, pct) + margin
+    return min(lead, MAX_LEAD_SECONDS)
+
+
+def parse_time(value):
+    """'HH:MM' → 자정 기준 분"""
+    hour, _, minute = value.partition(':')
+    return int(hour) * 60 + int(minute or 0)
+
+
+def start_cron(target, lead):
+    """목표 시각(UTC 'HH:MM')에 available 이 되도록 lead 초 먼저 실행하는 매일 cron (분 단위 올림)"""
+    minutes = (parse_time(target) - math.ceil(lead / 60)) % (24 * 60)
+    return f"cron({minutes % 60} {minutes // 60} * * ? *)"
+
+
+def cron_lead_minutes(expression, target):
+    """매일 cron 이 목표 시각보다 몇 분 앞서는지 (사전 시작 범위 밖이거나 형식이 다르면 None)"""
+    match = CRON_DAILY.match(expression or '')
+    if not match:
+        return None
+    minute, hour = int(match.group(1)), int(match.group(2))
+    lead = (parse_time(target) - (hour * 60 + minute)) % (24 * 60)
+    return lead if lead * 60 <= MAX_LEAD_SECONDS else None
+
+
+def replay(durations, pct=DEFAULT_PERCENTILE, margin=DEFAULT_MARGIN_SECONDS,
+           default=DEFAULT_LEAD_SECONDS, min_samples=MIN_SAMPLES):
+    """
+    기록된 소요 시간을 날짜순으로 재생
+
+    i번째 날은 그 전까지의 기록만으로 선행 시간을 정하고(Lambda 와 같은 분 단위 올림),
+    실제 소요 시간과 비교한다. 반환: [(실제 초, 선행 초, 늦은 초, 일찍 켜진 초)]
+    """
+    results = []
+    for i, actual in enumerate(durations):
+        lead = math.ceil(lead_seconds(durations[:i], pct, margin, default, min_samples) / 60) * 60
+        results.append((actual, lead, max(actual - lead, 0), max(lead - actual, 0)))
+    return results
@@ -0,0 +1,342 @@
+# benchmark.py
+"""
+boto/rds 스크립트 오프라인 벤치마크
+
+moto(인프로세스 AWS 대체)에서 배포/정리/스케줄 토글/수동 시작·중지를 실행하고
+시나리오별 소요 시간, 오퍼레이션별 API 호출 수, 최대 동시 호출 수를 측정한다.
+botocore 이벤트 훅으로 호출마다 지연을 주입하므로(인스턴스 생성 등은 더 길게)
+병렬화/캐시/재시도 동작이 실제와 비슷하게 소요 시간에 반영된다.
+결과를 benchmark-baseline.json 과 비교해서 느려지거나 호출이 늘면 종료 코드 1.
+
+사용법:
+    python rds-benchmark.py
+    python rds-benchmark.py --scenario deploy_fresh deploy_noop --repeat 5
+    python rds-benchmark.py --latency rds.CreateDBInstance=3 --default-latency 0.05
+    python rds-benchmark.py --mysql localhost:23306      # DB 사용자 생성까지 로컬 MySQL 로 실행
+    python rds-benchmark.py --update-baseline
+"""
+import argparse
+import atexit
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+# 실제 계정, 조회 캐시, 대기 이력, Lambda 패키지 캐시를 건드리지 않도록 import 전에 격리
+os.environ['HOME'] = tempfile.mkdtemp(prefix='dailyfeed-benchmark-')
+os.environ['AWS_ACCESS_KEY_ID'] = 'testing'
+os.environ['AWS_SECRET_ACCESS_KEY'] = 'testing'
+os.environ['AWS_DEFAULT_REGION'] = 'ap-northeast-2'
+os.environ['DAILYFEED_AWS_CACHE'] = 'memory'
+os.environ.pop('AWS_PROFILE', None)
+
+import boto3
+from moto import mock_aws
+
+import aws_client
+import aws_executor
+import aws_metrics
+import db_users
+import toggle_schedule
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(SCRIPT_DIR, 'benchmark-baseline.json')
+REGION = 'ap-northeast-2'
+MASTER_PASSWORD = 'hitEnter###'
+
+# 호출당 주입 지연(초): 실제 API 왕복 시간에 가깝게, 오래 걸리는 오퍼레이션은 따로 지정
+DEFAULT_LATENCY = 0.03
+OPERATION_LATENCIES = {
+    'rds.CreateDBInstance': 1.0,
+    'rds.DeleteDBInstance': 0.5,
+    'rds.StartDBInstance': 0.3,
+    'rds.StopDBInstance': 0.3,
+    'lambda.CreateFunction': 0.3,
+    'lambda.UpdateFunctionCode': 0.3,
+    'iam.CreateRole': 0.1,
+    'ec2.CreateSecurityGroup': 0.1,
+}
+
+# 기준 대비 허용 오차: 소요 시간이 (1 + TOLERANCE) 배 + SLACK_SECONDS 를 넘으면 회귀
+TOLERANCE = 0.2
+SLACK_SECONDS = 0.1
+
+
+def load_script(filename, name):
+    """하이픈이 들어간 스크립트 파일을 모듈로 로드"""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SCRIPT_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+deploy_all = load_script('rds-deploy-all.py', 'deploy_all')
+cleanup = load_script('cleanup-all.py', 'cleanup_all')
+manual_control = load_script('rds-start-stop-not-auto.py', 'manual_control')
+
+# 벤치마크 출력만 남기기 위해 스크립트 모듈들의 종료 시 요약은 끈다
+atexit.unregister(aws_client.stats.print_summary)
+atexit.unregister(aws_executor.executor.print_summary)
+atexit.unregister(aws_metrics.metrics.write_reports)
+
+
+class ApiRecorder:
+    """
+    botocore 이벤트 훅으로 API 호출 수/동시 호출 수를 기록하고 지연을 주입
+
+    before-call/after-call 은 재시도를 포함한 호출 하나에 한 번씩,
+    before-send 는 실제 전송(시도)마다 발생한다.
+    """
+
+    def __init__(self, default_latency=DEFAULT_LATENCY, latencies=None):
+        self.default_latency = default_latency
+        self.latencies = latencies or {}
+        self.lock = threading.Lock()
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.calls = {}
+            self.in_flight = 0
+            self.peak = 0
+
+    @staticmethod
+    def _operation(event_name):
+        # 'before-call.rds.CreateDBInstance' → 'rds.CreateDBInstance'
+        return event_name.split('.', 1)[1]
+
+    def before_call(self, event_name, **kwargs):
+        if not self.enabled:
+            return
+        operation = self._operation(event_name)
+        with self.lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def after_call(self, event_name, **kwargs):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.in_flight -= 1
+
+    def before_send(self, event_name, **kwargs):
+        if not self.enabled:
+            return None
+        latency = self.latencies.get(self._operation(event_name), self.default_latency)
+        if latency > 0:
+            time.sleep(latency)
+        return None
+
+    def attach(self, session):
+        session.events.register('before-call', self.before_call)
+        session.events.register('after-call', self.after_call)
+        session.events.register('after-call-error', self.after_call)
+        session.events.register('before-send', self.before_send)
+
+
+def local_provision(host, port):
+    """DB 사용자 생성의 접속 대상을 로컬 MySQL 로 바꾼 db_users.provision"""
+    original = db_users.provision
+
+    def provision(endpoint, master_username, master_password, **kwargs):
+        kwargs['port'] = port
+        return original(host, os.getenv('MYSQL_USERNAME', 'root'),
+                        os.getenv('MYSQL_PASSWORD', 'pressF5!!!'), **kwargs)
+    return provision
+
+
+def skip_provision(endpoint, *args, **kwargs):
+    print(f"ℹ️  벤치마크: DB 사용자 생성 생략 ({endpoint})")
+    return 0, 0
+
+
+def reset_clients(recorder):
+    """시나리오마다 새 세션/캐시/토큰 버킷으로 시작 (이전 시나리오의 상태가 섞이지 않게)"""
+    session = boto3.session.Session(region_name=REGION)
+    recorder.attach(session)
+    aws_client._session = session
+    aws_client.invalidate()
+    aws_executor.executor.buckets.clear()
+    aws_executor.executor.metrics.clear()
+
+
+def deploy():
+    deploy_all.RDSSchedulerDeployer(region=REGION).deploy(master_password=MASTER_PASSWORD)
+
+
+# 시나리오: 이름 → (준비 단계 목록, 측정 대상). 준비 단계의 호출은 기록하지 않는다
+SCENARIOS = {
+    'deploy_fresh': ([], deploy),
+    'deploy_noop': ([deploy], deploy),
+    'toggle_schedule': ([deploy], lambda: toggle_schedule.toggle_schedule(enable=False)),
+    'control_rds': ([deploy], lambda: manual_control.control_rds('stop')),
+    'cleanup_all': ([deploy], lambda: cleanup.cleanup_all()),
+}
+
+
+def run_scenario(name, recorder, verbose=False):
+    """시나리오 1회 실행 → {'wall_seconds', 'calls', 'total_calls', 'peak_concurrency'}"""
+    setup, target = SCENARIOS[name]
+    output = None if verbose else io.StringIO()
+    with mock_aws(), contextlib.redirect_stdout(output or sys.stdout):
+        reset_clients(recorder)
+        for step in setup:
+            step()
+
+        aws_client.invalidate()
+        recorder.reset()
+        recorder.enabled = True
+        start = time.monotonic()
+        try:
+            target()
+        finally:
+            elapsed = time.monotonic() - start
+            recorder.enabled = False
+
+    return {
+        'wall_seconds': round(elapsed, 3),
+        'calls': dict(sorted(recorder.calls.items())),
+        'total_calls': sum(recorder.calls.values()),
+        'peak_concurrency': recorder.peak,
+    }
+
+
+def measure(name, recorder, repeat, verbose=False):
+    """repeat 번 실행해서 소요 시간은 중앙값, 호출 수는 최댓값 사용"""
+    runs = [run_scenario(name, recorder, verbose) for _ in range(repeat)]
+    result = max(runs, key=lambda r: r['total_calls'])
+    result['wall_seconds'] = round(statistics.median(r['wall_seconds'] for r in runs), 3)
+    result['peak_concurrency'] = max(r['peak_concurrency'] for r in runs)
+    return result
+
+
+def compare(name, result, baseline):
+    """기준과 비교 → (회귀 목록, 경고 목록)"""
+    regressions, warnings = [], []
+    expected = baseline.get(name)
+    if expected is None:
+        warnings.append('기준 없음 (--update-baseline 으로 기록)')
+        return regressions, warnings
+
+    limit = expected['wall_seconds'] * (1 + TOLERANCE) + SLACK_SECONDS
+    if result['wall_seconds'] > limit:
+        regressions.append(f"소요 시간 {expected['wall_seconds']:.2f}s → {result['wall_seconds']:.2f}s "
+                           f"(허용 {limit:.2f}s)")
+    for operation, count in result['calls'].items():
+        before = expected['calls'].get(operation, 0)
+        if count > before:
+            regressions.append(f"{operation} 호출 {before} → {count}")
+    if result['peak_concurrency'] < expected['peak_concurrency']:
+        warnings.append(f"최대 동시 호출 {expected['peak_concurrency']} → {result['peak_concurrency']}")
+    return regressions, warnings
+
+
+def parse_latencies(values):
+    """['rds.CreateDBInstance=2', ...] → {'rds.CreateDBInstance': 2.0}"""
+    latencies = dict(OPERATION_LATENCIES)
+    for value in values or []:
+        operation, sep, seconds = value.partition('=')
+        if not sep:
+            raise ValueError(f"지연 형식 오류(서비스.오퍼레이션=초): {value}")
+        latencies[operation] = float(seconds)
+    return latencies
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='boto/rds 오프라인 벤치마크 (moto)')
+    parser.add_argument('--scenario', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--repeat', type=int, default=3, help='시나리오별 반복 횟수 (소요 시간 중앙값)')
+    parser.add_argument('--default-latency', type=float, default=DEFAULT_LATENCY,
+                        help='호출당 주입 지연(초)')
+    parser.add_argument('--latency', action='append', metavar='OPERATION=SECONDS',
+                        help='오퍼레이션별 지연 (예: rds.CreateDBInstance=3)')
+    parser.add_argument('--iam-propagation', type=float, default=0,
+                        help='IAM 역할 전파 대기(초), 실제 배포는 10초')
+    parser.add_argument('--mysql', metavar='HOST:PORT',
+                        help='DB 사용자 생성을 이 로컬 MySQL 에 실행 (기본: 생략)')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help='현재 결과를 기준으로 저장')
+    parser.add_argument('--verbose', action='store_true', help='스크립트 출력 표시')
+    args = parser.parse_args()
+
+    try:
+        latencies = parse_latencies(args.latency)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    deploy_all.IAM_PROPAGATION_SECONDS = args.iam_propagation
+    if args.mysql:
+        host, _, port = args.mysql.partition(':')
+        deploy_all.db_users.provision = local_provision(host, int(port or 3306))
+    else:
+        deploy_all.db_users.provision = skip_provision
+
+    recorder = ApiRecorder(args.default_latency, latencies)
+    stored = load_baseline(args.baseline)
+    baseline = stored.get('scenarios', {})
+    if stored and (stored['default_latency'], stored['latencies']) != (args.default_latency, latencies):
+        print("⚠️  기준과 주입 지연 설정이 다릅니다: 소요 시간 비교가 의미 없을 수 있음")
+
+    print("⏳ 준비 실행 (moto 백엔드 초기화, 측정 제외)...")
+    run_scenario('deploy_fresh', recorder)
+
+    results = {}
+    failed = False
+    for name in args.scenario:
+        result = measure(name, recorder, args.repeat, args.verbose)
+        results[name] = result
+
+        print("\n" + "="*60)
+        print(f"{name}: {result['wall_seconds']:.2f}s, API {result['total_calls']}회, "
+              f"최대 동시 {result['peak_concurrency']}")
+        print("="*60)
+        for operation, count in result['calls'].items():
+            print(f"   {operation:<40} {count:>4}")
+
+        if args.update_baseline:
+            continue
+        regressions, warnings = compare(name, result, baseline)
+        for warning in warnings:
+            print(f"   ⚠️  {warning}")
+        for regression in regressions:
+            print(f"   ❌ {regression}")
+        if regressions:
+            failed = True
+        elif name in baseline:
+            print(f"   ✅ 기준({baseline[name]['wall_seconds']:.2f}s) 이내")
+
+    if args.update_baseline:
+        scenarios = dict(baseline)
+        scenarios.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump({
+                'default_latency': args.default_latency,
+                'latencies': latencies,
+                'scenarios': scenarios,
+            }, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"\n💾 기준 저장: {args.baseline}")
+        return 0
+
+    print("\n" + ("❌ 회귀 발견" if failed else "✅ 회귀 없음"))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,9 @@
 # create_security_group.py
-import boto3
+import aws_client
 
 def create_rds_security_group(group_name):
     """RDS용 보안 그룹 생성"""
-    ec2 = boto3.client('ec2', region_name='ap-northeast-2')
+    ec2 = aws_client.client('ec2', region_name='ap-northeast-2')
     
     # 기본 VPC ID 가져오기
     vpcs = ec2.describe_vpcs(Filters=[{'Name': 'isDefault', 'Values': ['true']}])
@@ -1,61 +1,10 @@
 # create_rds_free_tier.py
-import boto3
 import sys
 import time
-import pymysql
 
-def create_database_user(endpoint, master_username, master_password, db_name,
-                        new_username='dailyfeed', new_password='hitEnter###'):
-    """
-    RDS 인스턴스에 새로운 데이터베이스 사용자 생성
-    """
-    print(f"\n🔐 데이터베이스 사용자 확인 및 생성 중...")
-
-    try:
-        # MySQL 연결
-        connection = pymysql.connect(
-            host=endpoint,
-            user=master_username,
-            password=master_password,
-            database=db_name,
-            connect_timeout=10
-        )
-
-        with connection.cursor() as cursor:
-            # 사용자 존재 여부 확인
-            cursor.execute(f"SELECT User FROM mysql.user WHERE User = '{new_username}' AND Host = '%'")
-            user_exists = cursor.fetchone()
-
-            if user_exists:
-                print(f"ℹ️  사용자가 이미 존재합니다: {new_username}")
-            else:
-                # 사용자 생성
-                cursor.execute(f"CREATE USER '{new_username}'@'%' IDENTIFIED BY '{new_password}'")
-                print(f"✅ 사용자 생성: {new_username}")
-
-            # 권한 부여 (모든 권한)
-            cursor.execute(f"GRANT ALL PRIVILEGES ON {db_name}.* TO '{new_username}'@'%'")
-            print(f"✅ 권한 부여: {db_name} 데이터베이스에 대한 모든 권한")
-
-            # 권한 적용
-            cursor.execute("FLUSH PRIVILEGES")
-            print(f"✅ 권한 적용 완료")
-
-        connection.commit()
-        connection.close()
-
-        print(f"\n📊 사용자 정보:")
-        print(f"   사용자명: {new_username}")
-        print(f"   비밀번호: {new_password}")
-        print(f"   데이터베이스: {db_name}")
-        print(f"   엔드포인트: {endpoint}")
-
-    except pymysql.MySQLError as e:
-        print(f"❌ 사용자 생성 실패: {str(e)}")
-        print(f"   수동으로 사용자를 생성해야 할 수 있습니다.")
-    except Exception as e:
-        print(f"❌ 연결 오류: {str(e)}")
-        print(f"   보안 그룹 설정을 확인하세요.")
+import aws_client
+import db_users
+from rds_waiter import wait_for_available
 
 def create_rds_free_tier(
     ## 초기 DB instance 이름 : my-dev-db, db 명: mydb
@@ -73,7 +22,7 @@ def create_rds_free_tier(
     - Single-AZ
     """
     
-    rds = boto3.client('rds', region_name='ap-northeast-2')
+    rds = aws_client.client('rds', region_name='ap-northeast-2')
     
     try:
         response = rds.create_db_instance(
@@ -137,21 +86,16 @@ def create_rds_free_tier(
         print(f"\n   생성 진행 상황 확인:")
         print(f"   aws rds describe-db-instances --db-instance-identifier {db_instance_identifier}")
 
-        # RDS 인스턴스가 사용 가능해질 때까지 대기
-        print(f"\n⏳ RDS 인스턴스가 사용 가능해질 때까지 대기 중...")
-        waiter = rds.get_waiter('db_instance_available')
-        waiter.wait(
-            DBInstanceIdentifier=db_instance_identifier,
-            WaiterConfig={'Delay': 30, 'MaxAttempts': 40}
-        )
+        # RDS 인스턴스가 사용 가능해질 때까지 대기 (적응형 폴링, 진행 상황/ETA 출력)
+        instances = wait_for_available(rds, db_instance_identifier)
 
         # 엔드포인트 가져오기
-        db_response = rds.describe_db_instances(DBInstanceIdentifier=db_instance_identifier)
-        endpoint = db_response['DBInstances'][0]['Endpoint']['Address']
+        endpoint = instances[db_instance_identifier]['Endpoint']['Address']
         print(f"✅ RDS 인스턴스 사용 가능: {endpoint}")
 
-        # 데이터베이스 사용자 생성
-        create_database_user(endpoint, master_username, master_password, db_name)
+        # 데이터베이스 사용자 생성 (db-users.json 매니페스트)
+        print(f"\n🔐 데이터베이스 사용자 확인 및 생성 중...")
+        db_users.provision(endpoint, master_username, master_password, database=db_name)
 
         return response
         
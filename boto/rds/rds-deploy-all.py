@@ -1,380 +1,685 @@
 # deploy_all.py
-import boto3
 import json
 import time
-import zipfile
 import os
-import pymysql
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote
 
-def create_database_user(endpoint, master_username, master_password, db_name,
-                        new_username='dailyfeed', new_password='hitEnter###'):
-    """
-    RDS 인스턴스에 새로운 데이터베이스 사용자 생성
-    """
-    print(f"\n🔐 데이터베이스 사용자 확인 및 생성 중...")
+import aws_client
+import db_users
+import prewarm
+from dag_executor import DagExecutor
+from lambda_package import build_package
+from rds_waiter import wait_for_available
 
-    try:
-        # MySQL 연결
-        connection = pymysql.connect(
-            host=endpoint,
-            user=master_username,
-            password=master_password,
-            database=db_name,
-            connect_timeout=10
-        )
+FUNCTION_NAME = 'RDSScheduler'
+ROLE_NAME = 'RDSSchedulerLambdaRole'
+POLICY_NAME = 'RDSSchedulerPolicy'
+RULE_PREFIX = 'RDSScheduler-'
 
-        with connection.cursor() as cursor:
-            # 사용자 존재 여부 확인
-            cursor.execute(f"SELECT User FROM mysql.user WHERE User = '{new_username}' AND Host = '%'")
-            user_exists = cursor.fetchone()
+# Lambda 메모리 크기 (lambda-coldstart.py 의 cold/warm 측정 결과로 결정)
+LAMBDA_MEMORY_MB = 128
 
-            if user_exists:
-                print(f"ℹ️  사용자가 이미 존재합니다: {new_username}")
-            else:
-                # 사용자 생성
-                cursor.execute(f"CREATE USER '{new_username}'@'%' IDENTIFIED BY '{new_password}'")
-                print(f"✅ 사용자 생성: {new_username}")
+# 새로 만든 IAM 역할이 Lambda에서 사용 가능해질 때까지 기다리는 시간
+IAM_PROPAGATION_SECONDS = 10
+
+START_RULE = 'RDSScheduler-Start-9AM'
+STOP_RULE = 'RDSScheduler-Stop-6PM'
+STARTED_RULE = 'RDSScheduler-Started'
+IDLE_RULE = 'RDSScheduler-IdleStop'
+SCHEDULE_RULE_NAMES = [START_RULE, STOP_RULE, STARTED_RULE, IDLE_RULE]
 
-            # 권한 부여 (모든 권한)
-            cursor.execute(f"GRANT ALL PRIVILEGES ON {db_name}.* TO '{new_username}'@'%'")
-            print(f"✅ 권한 부여: {db_name} 데이터베이스에 대한 모든 권한")
+# 이 시각(UTC, KST 오전 9시)에 available 이 되도록 시작 규칙을 앞당긴다
+START_TARGET_UTC = '00:00'
+STOP_SCHEDULE = 'cron(0 9 * * ? *)'
+IDLE_CHECK_SCHEDULE = 'rate(15 minutes)'
 
-            # 권한 적용
-            cursor.execute("FLUSH PRIVILEGES")
-            print(f"✅ 권한 적용 완료")
+# RDS 시작 완료(RDS-EVENT-0088) → Lambda 가 start → available 소요 시간 기록
+STARTED_EVENT_PATTERN = {
+    'source': ['aws.rds'],
+    'detail-type': ['RDS DB Instance Event'],
+    'detail': {'EventID': ['RDS-EVENT-0088']},
+}
 
-        connection.commit()
-        connection.close()
+TRUST_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [{
+        "Effect": "Allow",
+        "Principal": {"Service": "lambda.amazonaws.com"},
+        "Action": "sts:AssumeRole"
+    }]
+}
+
+ROLE_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Action": [
+                "rds:DescribeDBInstances",
+                "rds:StartDBInstance",
+                "rds:StopDBInstance",
+                "rds:AddTagsToResource",
+                "rds:RemoveTagsFromResource"
+            ],
+            "Resource": "*"
+        },
+        {
+            "Effect": "Allow",
+            "Action": [
+                "events:DescribeRule",
+                "events:PutRule"
+            ],
+            "Resource": "*"
+        },
+        {
+            "Effect": "Allow",
+            "Action": [
+                "cloudwatch:GetMetricData"
+            ],
+            "Resource": "*"
+        },
+        {
+            "Effect": "Allow",
+            "Action": [
+                "logs:CreateLogGroup",
+                "logs:CreateLogStream",
+                "logs:PutLogEvents"
+            ],
+            "Resource": "*"
+        }
+    ]
+}
 
-        print(f"\n📊 사용자 정보:")
-        print(f"   사용자명: {new_username}")
-        print(f"   비밀번호: {new_password}")
-        print(f"   데이터베이스: {db_name}")
-        print(f"   엔드포인트: {endpoint}")
+MYSQL_INGRESS = {
+    'IpProtocol': 'tcp',
+    'FromPort': 3306,
+    'ToPort': 3306,
+    'IpRanges': [{'CidrIp': '0.0.0.0/0'}]
+}
 
-    except pymysql.MySQLError as e:
-        print(f"❌ 사용자 생성 실패: {str(e)}")
-        print(f"   수동으로 사용자를 생성해야 할 수 있습니다.")
-    except Exception as e:
-        print(f"❌ 연결 오류: {str(e)}")
-        print(f"   보안 그룹 설정을 확인하세요.")
+PLAN_SYMBOLS = {'create': '+', 'update': '~', 'noop': '='}
+
+def has_mysql_ingress(sg):
+    """보안 그룹에 MySQL(3306) 인바운드 규칙이 있는지 여부"""
+    return any(p.get('FromPort') == 3306 for p in sg.get('IpPermissions', []))
+
+def policy_document(document):
+    """IAM 정책 문서를 dict로 (boto3는 보통 dict로 디코딩하지만 문자열일 수 있음)"""
+    if isinstance(document, str):
+        return json.loads(unquote(document))
+    return document
 
 class RDSSchedulerDeployer:
-    def __init__(self, db_instance_id='dailyfeed-dev', db_name='dailyfeed', region='ap-northeast-2'):
+    def __init__(self, db_instance_id='dailyfeed-dev', db_name='dailyfeed', region='ap-northeast-2',
+                 target_tags=None, group_name='dailyfeed-rds-dev-sg',
+                 prewarm_percentile=prewarm.DEFAULT_PERCENTILE, idle_stop=False, idle_minutes=60):
         self.db_instance_id = db_instance_id
+        # 시작 소요 시간 기록의 이 백분위까지 목표 시각 전에 available 이 되도록 사전 시작
+        self.prewarm_percentile = prewarm_percentile
+        # True 이면 오후 6시 고정 중지 대신 idle_minutes 동안 연결이 없을 때 중지
+        self.idle_stop = idle_stop
+        self.idle_minutes = idle_minutes
+        # 스케줄러 Lambda가 시작/중지할 인스턴스 태그 조건 (생성 스크립트가 붙이는 태그)
+        self.target_tags = target_tags or {'AutoShutdown': 'true'}
         self.db_name = db_name
         self.region = region
-        self.rds = boto3.client('rds', region_name=region)
-        self.iam = boto3.client('iam')
-        self.lambda_client = boto3.client('lambda', region_name=region)
-        self.events = boto3.client('events', region_name=region)
-        self.sts = boto3.client('sts')
-        self.ec2 = boto3.client('ec2', region_name=region)
-        
-    def step1_create_rds(self, master_password, group_name):
-        """1단계: RDS 프리티어 생성"""
+        self.group_name = group_name
+        self.rds = aws_client.client('rds', region_name=region)
+        self.iam = aws_client.client('iam')
+        self.lambda_client = aws_client.client('lambda', region_name=region)
+        self.events = aws_client.client('events', region_name=region)
+        self.sts = aws_client.client('sts')
+        self.ec2 = aws_client.client('ec2', region_name=region)
+        
+    def lambda_environment(self):
+        """스케줄러 Lambda 환경 변수 (태그 조건에 맞는 인스턴스 전체가 대상)"""
+        return {
+            'TARGET_TAGS': ','.join(f"{k}={v}" for k, v in self.target_tags.items()),
+            'START_RULE_NAME': START_RULE,
+            'START_TARGET_UTC': START_TARGET_UTC,
+            'PREWARM_PERCENTILE': str(self.prewarm_percentile),
+            'IDLE_MINUTES': str(self.idle_minutes),
+        }
+    
+    def start_lead_seconds(self, state):
+        """배포 대상 인스턴스의 시작 소요 시간 기록으로 계산한 사전 시작 시간(초)"""
+        db = state['db_instance'] or {}
+        tags = {t['Key']: t['Value'] for t in db.get('TagList', [])}
+        durations = prewarm.parse_durations(tags.get(prewarm.DURATIONS_TAG))
+        return prewarm.lead_seconds(durations, self.prewarm_percentile)
+    
+    def schedule_rules(self, state):
+        """
+        EventBridge 규칙 [(이름, put_rule 인자, Lambda 입력, Lambda 권한 StatementId, 설명)]
+
+        시작 규칙 스케줄은 이후 Lambda 가 시작 소요 시간을 기록할 때마다 다시 계산한다.
+        """
+        lead_minutes = -(-self.start_lead_seconds(state) // 60)
+        return [
+            (START_RULE,
+             {'ScheduleExpression': prewarm.start_cron(START_TARGET_UTC, lead_minutes * 60), 'State': 'ENABLED'},
+             {'action': 'start'}, 'AllowEventBridgeStart',
+             f"매일 오전 9시 available 목표 ({lead_minutes:.0f}분 전 시작)"),
+            (STOP_RULE,
+             {'ScheduleExpression': STOP_SCHEDULE, 'State': 'DISABLED' if self.idle_stop else 'ENABLED'},
+             {'action': 'stop'}, 'AllowEventBridgeStop', '매일 오후 6시'),
+            (STARTED_RULE,
+             {'EventPattern': json.dumps(STARTED_EVENT_PATTERN), 'State': 'ENABLED'},
+             None, 'AllowEventBridgeStarted', 'RDS 시작 완료 시 소요 시간 기록'),
+            (IDLE_RULE,
+             {'ScheduleExpression': IDLE_CHECK_SCHEDULE, 'State': 'ENABLED' if self.idle_stop else 'DISABLED'},
+             {'action': 'idle_stop'}, 'AllowEventBridgeIdleStop', f"{self.idle_minutes}분 유휴 시 중지"),
+        ]
+    
+    @staticmethod
+    def rule_matches(rule_name, rule, spec):
+        """현재 규칙이 원하는 설정과 같은지 (시작 규칙은 Lambda 가 조정한 사전 시작 스케줄도 허용)"""
+        if rule.get('State') != spec['State']:
+            return False
+        if 'EventPattern' in spec:
+            current = rule.get('EventPattern')
+            return current is not None and json.loads(current) == json.loads(spec['EventPattern'])
+        if rule_name == START_RULE:
+            return prewarm.cron_lead_minutes(rule.get('ScheduleExpression'), START_TARGET_UTC) is not None
+        return rule.get('ScheduleExpression') == spec['ScheduleExpression']
+    
+    def lambda_configuration(self, role_arn):
+        """코드 외 Lambda 함수 설정 (생성/비교에 공통 사용)"""
+        return {
+            'Runtime': 'python3.11',
+            'Role': role_arn,
+            'Handler': 'lambda_function.lambda_handler',
+            'Timeout': 60,
+            'MemorySize': LAMBDA_MEMORY_MB,
+            # AWS_REGION은 Lambda 예약 변수이므로 제외
+            'Environment': {'Variables': self.lambda_environment()},
+        }
+    
+    def build_lambda_package(self):
+        """Lambda 코드 패키지 (태그/목록으로 선택한 인스턴스 전체를 한 번에 처리)"""
+        lambda_source = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda_function.py')
+        with open(lambda_source) as f:
+            lambda_code = f.read()
+        # 메모리에서 결정적으로 빌드, 소스 해시로 로컬 캐시
+        with open(os.path.join(os.path.dirname(lambda_source), 'prewarm.py')) as f:
+            prewarm_code = f.read()
+        return build_package({'lambda_function.py': lambda_code, 'prewarm.py': prewarm_code})
+    
+    # ------------------------------------------------------------------
+    # 현재 상태 조회 / 계획
+    # ------------------------------------------------------------------
+    
+    def _read_security_group(self):
+        sgs = self.ec2.describe_security_groups(
+            Filters=[{'Name': 'group-name', 'Values': [self.group_name]}]
+        )['SecurityGroups']
+        return sgs[0] if sgs else None
+    
+    def _read_db_instance(self):
+        try:
+            response = self.rds.describe_db_instances(DBInstanceIdentifier=self.db_instance_id)
+        except self.rds.exceptions.DBInstanceNotFoundFault:
+            return None
+        return response['DBInstances'][0]
+    
+    def _read_role(self):
+        try:
+            role = self.iam.get_role(RoleName=ROLE_NAME)['Role']
+        except self.iam.exceptions.NoSuchEntityException:
+            return None
+        role['AssumeRolePolicyDocument'] = policy_document(role.get('AssumeRolePolicyDocument'))
+        return role
+    
+    def _read_role_policy(self):
+        try:
+            response = self.iam.get_role_policy(RoleName=ROLE_NAME, PolicyName=POLICY_NAME)
+        except self.iam.exceptions.NoSuchEntityException:
+            return None
+        return policy_document(response['PolicyDocument'])
+    
+    def _read_function(self):
+        try:
+            return self.lambda_client.get_function(FunctionName=FUNCTION_NAME)['Configuration']
+        except self.lambda_client.exceptions.ResourceNotFoundException:
+            return None
+    
+    def _read_permissions(self):
+        try:
+            policy = self.lambda_client.get_policy(FunctionName=FUNCTION_NAME)['Policy']
+        except self.lambda_client.exceptions.ResourceNotFoundException:
+            return set()
+        return {statement['Sid'] for statement in json.loads(policy)['Statement']}
+    
+    def _read_rules(self):
+        rules = {}
+        for page in self.events.get_paginator('list_rules').paginate(NamePrefix=RULE_PREFIX):
+            for rule in page['Rules']:
+                rules[rule['Name']] = rule
+        return rules
+    
+    def _read_targets(self, rule_name):
+        try:
+            targets = self.events.list_targets_by_rule(Rule=rule_name)['Targets']
+        except self.events.exceptions.ResourceNotFoundException:
+            return None
+        return {target['Id']: target for target in targets}
+    
+    def read_state(self):
+        """관리 대상 리소스의 현재 상태를 한 번에(병렬 조회) 읽기"""
+        readers = {
+            'security_group': self._read_security_group,
+            'db_instance': self._read_db_instance,
+            'role': self._read_role,
+            'role_policy': self._read_role_policy,
+            'function': self._read_function,
+            'permissions': self._read_permissions,
+            'rules': self._read_rules,
+            'account_id': lambda: self.sts.get_caller_identity()['Account'],
+        }
+        for rule_name in SCHEDULE_RULE_NAMES:
+            readers[f"targets:{rule_name}"] = lambda rule_name=rule_name: self._read_targets(rule_name)
+        
+        with ThreadPoolExecutor(max_workers=len(readers)) as pool:
+            futures = {name: pool.submit(reader) for name, reader in readers.items()}
+            return {name: future.result() for name, future in futures.items()}
+    
+    def function_arn(self, state):
+        if state['function']:
+            return state['function']['FunctionArn']
+        return f"arn:aws:lambda:{self.region}:{state['account_id']}:function:{FUNCTION_NAME}"
+    
+    def plan(self, state):
+        """원하는 설정과 현재 상태를 비교한 변경 목록 [(리소스, 작업, 설명)]"""
+        changes = []
+        
+        sg = state['security_group']
+        if sg is None:
+            changes.append(('security_group', 'create', self.group_name))
+        elif not has_mysql_ingress(sg):
+            changes.append(('security_group', 'update', f"{sg['GroupId']} 3306 인바운드 추가"))
+        else:
+            changes.append(('security_group', 'noop', sg['GroupId']))
+        
+        db = state['db_instance']
+        if db is None:
+            changes.append(('db_instance', 'create', self.db_instance_id))
+            users = db_users.load_manifest(database=self.db_name)
+            changes.append(('db_user', 'create', ', '.join(user.name for user in users)))
+        else:
+            changes.append(('db_instance', 'noop', f"{self.db_instance_id} ({db['DBInstanceStatus']})"))
+        
+        role = state['role']
+        if role is None:
+            changes.append(('lambda_role', 'create', ROLE_NAME))
+        elif role.get('AssumeRolePolicyDocument') != TRUST_POLICY:
+            changes.append(('lambda_role', 'update', f"{ROLE_NAME} 신뢰 정책"))
+        else:
+            changes.append(('lambda_role', 'noop', ROLE_NAME))
+        
+        if state['role_policy'] != ROLE_POLICY:
+            action = 'create' if state['role_policy'] is None else 'update'
+            changes.append(('role_policy', action, POLICY_NAME))
+        else:
+            changes.append(('role_policy', 'noop', POLICY_NAME))
+        
+        function = state['function']
+        if function is None:
+            changes.append(('lambda_function', 'create', FUNCTION_NAME))
+        else:
+            code_changed = not self.package.matches(function)
+            if code_changed:
+                changes.append(('lambda_code', 'update', f"{FUNCTION_NAME} 코드"))
+            role_arn = role['Arn'] if role else None
+            desired = self.lambda_configuration(role_arn)
+            current = {
+                key: function.get(key) for key in desired if key != 'Environment'
+            }
+            current['Environment'] = {
+                'Variables': function.get('Environment', {}).get('Variables', {})
+            }
+            diff = sorted(key for key in desired if desired[key] != current[key])
+            if diff:
+                changes.append(('lambda_config', 'update', f"{FUNCTION_NAME} {', '.join(diff)}"))
+            if not code_changed and not diff:
+                changes.append(('lambda_function', 'noop', FUNCTION_NAME))
+        
+        lambda_arn = self.function_arn(state)
+        for rule_name, spec, lambda_input, statement_id, _ in self.schedule_rules(state):
+            detail = spec.get('ScheduleExpression', 'RDS 이벤트')
+            if spec['State'] != 'ENABLED':
+                detail += ' (비활성)'
+            rule = state['rules'].get(rule_name)
+            if rule is None:
+                changes.append((f"rule:{rule_name}", 'create', detail))
+            elif not self.rule_matches(rule_name, rule, spec):
+                changes.append((f"rule:{rule_name}", 'update', detail))
+            else:
+                changes.append((f"rule:{rule_name}", 'noop', rule.get('ScheduleExpression', detail)))
+            
+            target = (state[f"targets:{rule_name}"] or {}).get('1')
+            desired_input = json.dumps(lambda_input) if lambda_input else None
+            if target is None or target['Arn'] != lambda_arn or target.get('Input') != desired_input:
+                changes.append((f"target:{rule_name}", 'update' if target else 'create',
+                                lambda_input['action'] if lambda_input else '이벤트 전달'))
+            
+            if function is None or statement_id not in state['permissions']:
+                changes.append((f"permission:{statement_id}", 'create', rule_name))
+        
+        return changes
+    
+    def print_plan(self, changes):
+        """계획 출력 (+ 생성, ~ 변경, = 변경 없음)"""
         print("\n" + "="*60)
-        print("1단계: RDS 프리티어 인스턴스 생성")
+        print("📋 배포 계획")
+        print("="*60)
+        width = max(len(resource) for resource, _, _ in changes)
+        for resource, action, detail in changes:
+            print(f"   {PLAN_SYMBOLS[action]} {resource:<{width}}  {detail}")
+        pending = [c for c in changes if c[1] != 'noop']
+        print(f"\n   변경 {len(pending)}건 / 전체 {len(changes)}건")
+    
+    # ------------------------------------------------------------------
+    # 단계별 적용 (계획에 포함된 변경만 수행)
+    # ------------------------------------------------------------------
+    
+    def step1_create_security_group(self, state):
+        """1단계: RDS 보안 그룹 생성"""
+        print("\n" + "="*60)
+        print("1단계: RDS 보안 그룹 생성")
         print("="*60)
         
-        # 보안 그룹 생성
-        vpcs = self.ec2.describe_vpcs(
-            Filters=[{'Name': 'isDefault', 'Values': ['true']}]
-        )
-        vpc_id = vpcs['Vpcs'][0]['VpcId']
-        
-        try:
+        sg = state['security_group']
+        if sg is None:
+            vpcs = self.ec2.describe_vpcs(
+                Filters=[{'Name': 'isDefault', 'Values': ['true']}]
+            )
+            vpc_id = vpcs['Vpcs'][0]['VpcId']
+            
             sg_response = self.ec2.create_security_group(
-                GroupName=group_name,
+                GroupName=self.group_name,
                 Description='RDS MySQL Security Group',
                 VpcId=vpc_id
             )
             sg_id = sg_response['GroupId']
-            
-            self.ec2.authorize_security_group_ingress(
-                GroupId=sg_id,
-                IpPermissions=[{
-                    'IpProtocol': 'tcp',
-                    'FromPort': 3306,
-                    'ToPort': 3306,
-                    'IpRanges': [{'CidrIp': '0.0.0.0/0'}]
-                }]
-            )
             print(f"✅ 보안 그룹 생성: {sg_id}")
-        except:
-            sgs = self.ec2.describe_security_groups(
-                Filters=[{'Name': 'group-name', 'Values': [group_name]}]
-            )
-            sg_id = sgs['SecurityGroups'][0]['GroupId']
+        else:
+            sg_id = sg['GroupId']
             print(f"ℹ️  기존 보안 그룹 사용: {sg_id}")
         
-        # RDS 생성
-        try:
-            self.rds.create_db_instance(
-                DBInstanceIdentifier=self.db_instance_id,
-                DBInstanceClass='db.t3.micro',
-                Engine='mysql',
-                EngineVersion='8.0.43',
-                MasterUsername='admin',
-                MasterUserPassword=master_password,
-                DBName=self.db_name,
-                AllocatedStorage=20,
-                StorageType='gp3',
-                MultiAZ=False,
-                BackupRetentionPeriod=7,
-                PubliclyAccessible=True,
-                VpcSecurityGroupIds=[sg_id],
-                Tags=[
-                    {'Key': 'Environment', 'Value': 'development'},
-                    {'Key': 'AutoShutdown', 'Value': 'true'}
-                ]
-            )
-            print(f"✅ RDS 생성 시작: {self.db_instance_id}")
-            print("   ⏳ 5-10분 후 사용 가능")
-
-            # RDS 인스턴스가 사용 가능해질 때까지 대기
-            print(f"\n⏳ RDS 인스턴스가 사용 가능해질 때까지 대기 중...")
-            waiter = self.rds.get_waiter('db_instance_available')
-            waiter.wait(
-                DBInstanceIdentifier=self.db_instance_id,
-                WaiterConfig={'Delay': 30, 'MaxAttempts': 40}
+        if sg is None or not has_mysql_ingress(sg):
+            self.ec2.authorize_security_group_ingress(
+                GroupId=sg_id,
+                IpPermissions=[MYSQL_INGRESS]
             )
+            print(f"✅ 인바운드 규칙 추가: MySQL (3306)")
+        
+        return sg_id
+    
+    def step1_create_rds(self, master_password, sg_id, state):
+        """
+        1단계: RDS 프리티어 생성
 
-            # 엔드포인트 가져오기
-            db_response = self.rds.describe_db_instances(DBInstanceIdentifier=self.db_instance_id)
-            endpoint = db_response['DBInstances'][0]['Endpoint']['Address']
-            print(f"✅ RDS 인스턴스 사용 가능: {endpoint}")
+        새로 생성한 경우 사용 가능해질 때까지 대기 후 엔드포인트 반환,
+        이미 존재하면 None 반환
+        """
+        print("\n" + "="*60)
+        print("1단계: RDS 프리티어 인스턴스 생성")
+        print("="*60)
+        
+        if state['db_instance'] is not None:
+            print(f"ℹ️  RDS 이미 존재: {self.db_instance_id}")
+            return None
+        
+        self.rds.create_db_instance(
+            DBInstanceIdentifier=self.db_instance_id,
+            DBInstanceClass='db.t3.micro',
+            Engine='mysql',
+            EngineVersion='8.0.43',
+            MasterUsername='admin',
+            MasterUserPassword=master_password,
+            DBName=self.db_name,
+            AllocatedStorage=20,
+            StorageType='gp3',
+            MultiAZ=False,
+            BackupRetentionPeriod=7,
+            PubliclyAccessible=True,
+            VpcSecurityGroupIds=[sg_id],
+            Tags=[
+                {'Key': 'Environment', 'Value': 'development'},
+                {'Key': 'AutoShutdown', 'Value': 'true'}
+            ]
+        )
+        print(f"✅ RDS 생성 시작: {self.db_instance_id}")
+        print("   ⏳ 5-10분 후 사용 가능")
 
-            # 데이터베이스 사용자 생성
-            create_database_user(endpoint, 'admin', master_password, self.db_name)
+        # RDS 인스턴스가 사용 가능해질 때까지 대기 (적응형 폴링, 진행 상황/ETA 출력)
+        instances = wait_for_available(self.rds, self.db_instance_id)
 
-        except self.rds.exceptions.DBInstanceAlreadyExistsFault:
-            print(f"ℹ️  RDS 이미 존재: {self.db_instance_id}")
+        # 엔드포인트 가져오기
+        endpoint = instances[self.db_instance_id]['Endpoint']['Address']
+        print(f"✅ RDS 인스턴스 사용 가능: {endpoint}")
+        return endpoint
     
-    def step2_create_lambda_role(self):
+    def step1_create_database_user(self, endpoint, master_password):
+        """1단계: 새로 생성된 RDS에 데이터베이스 사용자 생성"""
+        if endpoint is None:
+            print("ℹ️  기존 RDS 사용: 데이터베이스 사용자 생성 생략")
+            return
+        print(f"\n🔐 데이터베이스 사용자 확인 및 생성 중...")
+        failed, warned = db_users.provision(endpoint, 'admin', master_password, database=self.db_name)
+        if failed:
+            # 연결/인증 오류, CREATE USER 실패 등: 의존 단계를 건너뛰고 배포를 실패로 표시
+            raise RuntimeError(f"데이터베이스 사용자 생성 실패 {failed}건 (위 로그 확인)")
+        if warned:
+            # 새 RDS 에는 스키마가 없고 비밀번호 환경 변수가 없을 수 있으므로 경고만 남긴다
+            print(f"⚠️  데이터베이스 사용자 경고 {warned}건: 스키마 적용/비밀번호 설정 후 "
+                  f"rds-user-create.py 를 다시 실행하세요")
+    
+    def step2_create_lambda_role(self, state):
         """2단계: Lambda IAM 역할 생성"""
         print("\n" + "="*60)
         print("2단계: Lambda IAM 역할 생성")
         print("="*60)
         
-        trust_policy = {
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Principal": {"Service": "lambda.amazonaws.com"},
-                "Action": "sts:AssumeRole"
-            }]
-        }
+        role = state['role']
+        created = role is None
+        if created:
+            try:
+                response = self.iam.create_role(
+                    RoleName=ROLE_NAME,
+                    AssumeRolePolicyDocument=json.dumps(TRUST_POLICY)
+                )
+                role_arn = response['Role']['Arn']
+                print(f"✅ IAM 역할 생성: {role_arn}")
+            except self.iam.exceptions.EntityAlreadyExistsException:
+                # IAM 은 전역이므로 다른 리전 배포가 먼저 만들었을 수 있다 (전파 대기는 그대로)
+                role = self._read_role()
+                role_arn = role['Arn']
+                print(f"ℹ️  다른 배포가 만든 역할 사용: {role_arn}")
+        else:
+            role_arn = role['Arn']
+            if role.get('AssumeRolePolicyDocument') != TRUST_POLICY:
+                self.iam.update_assume_role_policy(
+                    RoleName=ROLE_NAME,
+                    PolicyDocument=json.dumps(TRUST_POLICY)
+                )
+                print(f"✅ 신뢰 정책 업데이트: {role_arn}")
+            else:
+                print(f"ℹ️  기존 역할 사용: {role_arn}")
         
-        try:
-            response = self.iam.create_role(
-                RoleName='RDSSchedulerLambdaRole',
-                AssumeRolePolicyDocument=json.dumps(trust_policy)
+        if state['role_policy'] != ROLE_POLICY:
+            self.iam.put_role_policy(
+                RoleName=ROLE_NAME,
+                PolicyName=POLICY_NAME,
+                PolicyDocument=json.dumps(ROLE_POLICY)
             )
-            role_arn = response['Role']['Arn']
-            print(f"✅ IAM 역할 생성: {role_arn}")
-        except self.iam.exceptions.EntityAlreadyExistsException:
-            response = self.iam.get_role(RoleName='RDSSchedulerLambdaRole')
-            role_arn = response['Role']['Arn']
-            print(f"ℹ️  기존 역할 사용: {role_arn}")
-        
-        policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Effect": "Allow",
-                    "Action": [
-                        "rds:DescribeDBInstances",
-                        "rds:StartDBInstance",
-                        "rds:StopDBInstance"
-                    ],
-                    "Resource": "*"
-                },
-                {
-                    "Effect": "Allow",
-                    "Action": [
-                        "logs:CreateLogGroup",
-                        "logs:CreateLogStream",
-                        "logs:PutLogEvents"
-                    ],
-                    "Resource": "*"
-                }
-            ]
-        }
-        
-        self.iam.put_role_policy(
-            RoleName='RDSSchedulerLambdaRole',
-            PolicyName='RDSSchedulerPolicy',
-            PolicyDocument=json.dumps(policy)
-        )
-        print("✅ IAM 정책 연결")
+            print("✅ IAM 정책 연결")
+        else:
+            print("ℹ️  IAM 정책 변경 없음")
         
-        print("⏳ IAM 역할 전파 대기 (10초)...")
-        time.sleep(10)
+        if created:
+            # 새 역할만 전파 대기 (기존 역할은 이미 전파됨)
+            print(f"⏳ IAM 역할 전파 대기 ({IAM_PROPAGATION_SECONDS}초)...")
+            time.sleep(IAM_PROPAGATION_SECONDS)
         
         return role_arn
     
-    def step3_create_lambda_function(self, role_arn):
+    def step3_create_lambda_function(self, role_arn, state):
         """3단계: Lambda 함수 생성"""
         print("\n" + "="*60)
         print("3단계: Lambda 함수 생성")
         print("="*60)
         
-        # Lambda 코드
-        lambda_code = '''import boto3
-import os
-import json
-from datetime import datetime
-
-DB_INSTANCE_ID = os.environ['DB_INSTANCE_ID']
-# AWS_REGION은 Lambda 예약 환경 변수이므로 boto3가 자동으로 감지
-rds = boto3.client('rds')
-
-def lambda_handler(event, context):
-    action = event.get('action', 'status')
-    print(f"Action: {action}, Instance: {DB_INSTANCE_ID}")
-    
-    try:
-        response = rds.describe_db_instances(DBInstanceIdentifier=DB_INSTANCE_ID)
-        status = response['DBInstances'][0]['DBInstanceStatus']
-        
-        if action == 'start' and status == 'stopped':
-            rds.start_db_instance(DBInstanceIdentifier=DB_INSTANCE_ID)
-            return {'statusCode': 200, 'body': 'Starting'}
-        elif action == 'stop' and status == 'available':
-            rds.stop_db_instance(DBInstanceIdentifier=DB_INSTANCE_ID)
-            return {'statusCode': 200, 'body': 'Stopping'}
-        else:
-            return {'statusCode': 200, 'body': f'Status: {status}'}
-    except Exception as e:
-        return {'statusCode': 500, 'body': str(e)}
-'''
-        
-        # ZIP 생성
-        with zipfile.ZipFile('lambda.zip', 'w') as zf:
-            zf.writestr('lambda_function.py', lambda_code)
+        package = self.package
+        configuration = state['function']
         
-        with open('lambda.zip', 'rb') as f:
-            zip_content = f.read()
-        
-        try:
+        if configuration is None:
             response = self.lambda_client.create_function(
-                FunctionName='RDSScheduler',
-                Runtime='python3.11',
-                Role=role_arn,
-                Handler='lambda_function.lambda_handler',
-                Code={'ZipFile': zip_content},
-                Timeout=60,
-                MemorySize=128,
-                Environment={
-                    'Variables': {
-                        'DB_INSTANCE_ID': self.db_instance_id
-                        # AWS_REGION은 Lambda 예약 변수이므로 제외
-                    }
-                }
+                FunctionName=FUNCTION_NAME,
+                Code={'ZipFile': package.zip_bytes},
+                **self.lambda_configuration(role_arn)
             )
             function_arn = response['FunctionArn']
             print(f"✅ Lambda 함수 생성: {function_arn}")
-        except self.lambda_client.exceptions.ResourceConflictException:
+            return function_arn
+        
+        function_arn = configuration['FunctionArn']
+        
+        # 배포된 코드의 CodeSha256과 같으면 업로드/업데이트 대기 생략
+        if package.matches(configuration):
+            print(f"ℹ️  Lambda 코드 변경 없음 (sha256 {package.code_sha256[:12]}...)")
+        else:
             self.lambda_client.update_function_code(
-                FunctionName='RDSScheduler',
-                ZipFile=zip_content
+                FunctionName=FUNCTION_NAME,
+                ZipFile=package.zip_bytes
+            )
+            waiter = self.lambda_client.get_waiter('function_updated_v2')
+            waiter.wait(FunctionName=FUNCTION_NAME)
+            print(f"✅ Lambda 코드 업데이트: {function_arn}")
+        
+        config_changes = [c for c in self.plan_changes if c[0] == 'lambda_config']
+        if config_changes:
+            self.lambda_client.update_function_configuration(
+                FunctionName=FUNCTION_NAME,
+                **self.lambda_configuration(role_arn)
             )
-            response = self.lambda_client.get_function(FunctionName='RDSScheduler')
-            function_arn = response['Configuration']['FunctionArn']
-            print(f"✅ Lambda 함수 업데이트: {function_arn}")
+            print(f"✅ Lambda 설정 업데이트: {config_changes[0][2]}")
         
-        os.remove('lambda.zip')
         return function_arn
     
-    def step4_create_eventbridge_rules(self, lambda_arn):
+    def step4_create_eventbridge_rules(self, lambda_arn, state):
         """4단계: EventBridge 스케줄 생성"""
         print("\n" + "="*60)
         print("4단계: EventBridge 스케줄 설정")
         print("="*60)
         
-        account_id = self.sts.get_caller_identity()['Account']
-        
-        # 시작 규칙
-        self.events.put_rule(
-            Name='RDSScheduler-Start-9AM',
-            ScheduleExpression='cron(0 0 * * ? *)',
-            State='ENABLED'
-        )
-        print("✅ 시작 규칙 생성: 매일 오전 9시")
-        
-        # 중지 규칙
-        self.events.put_rule(
-            Name='RDSScheduler-Stop-6PM',
-            ScheduleExpression='cron(0 9 * * ? *)',
-            State='ENABLED'
-        )
-        print("✅ 중지 규칙 생성: 매일 오후 6시")
-        
-        # Lambda 권한
-        for rule_name, statement_id in [
-            ('RDSScheduler-Start-9AM', 'AllowEventBridgeStart'),
-            ('RDSScheduler-Stop-6PM', 'AllowEventBridgeStop')
-        ]:
-            try:
-                self.lambda_client.add_permission(
-                    FunctionName='RDSScheduler',
-                    StatementId=statement_id,
-                    Action='lambda:InvokeFunction',
-                    Principal='events.amazonaws.com',
-                    SourceArn=f'arn:aws:events:{self.region}:{account_id}:rule/{rule_name}'
-                )
-            except:
-                pass
-        
-        print("✅ Lambda 권한 부여")
-        
-        # 타겟 연결
-        self.events.put_targets(
-            Rule='RDSScheduler-Start-9AM',
-            Targets=[{
-                'Id': '1',
-                'Arn': lambda_arn,
-                'Input': json.dumps({'action': 'start'})
-            }]
-        )
+        pending = {resource for resource, action, _ in self.plan_changes if action != 'noop'}
         
-        self.events.put_targets(
-            Rule='RDSScheduler-Stop-6PM',
-            Targets=[{
-                'Id': '1',
-                'Arn': lambda_arn,
-                'Input': json.dumps({'action': 'stop'})
-            }]
-        )
-        print("✅ EventBridge 타겟 연결")
+        for rule_name, spec, lambda_input, statement_id, description in self.schedule_rules(state):
+            if f"rule:{rule_name}" in pending:
+                self.events.put_rule(Name=rule_name, **spec)
+                print(f"✅ 규칙 생성: {rule_name} ({description})")
+            else:
+                print(f"ℹ️  규칙 변경 없음: {rule_name}")
+            
+            # Lambda 권한
+            if f"permission:{statement_id}" in pending:
+                try:
+                    self.lambda_client.add_permission(
+                        FunctionName=FUNCTION_NAME,
+                        StatementId=statement_id,
+                        Action='lambda:InvokeFunction',
+                        Principal='events.amazonaws.com',
+                        SourceArn=f'arn:aws:events:{self.region}:{state["account_id"]}:rule/{rule_name}'
+                    )
+                    print(f"✅ Lambda 권한 부여: {statement_id}")
+                except self.lambda_client.exceptions.ResourceConflictException:
+                    print(f"ℹ️  Lambda 권한 이미 존재: {statement_id}")
+            
+            # 타겟 연결
+            if f"target:{rule_name}" in pending:
+                target = {'Id': '1', 'Arn': lambda_arn}
+                if lambda_input:
+                    target['Input'] = json.dumps(lambda_input)
+                # 입력이 없으면 EventBridge 가 RDS 이벤트 자체를 전달
+                self.events.put_targets(Rule=rule_name, Targets=[target])
+                print(f"✅ EventBridge 타겟 연결: {rule_name}")
     
-    def deploy(self, master_password):
-        """전체 배포"""
+    def deploy(self, master_password, plan_only=False):
+        """
+        전체 배포
+
+        현재 상태를 한 번에 읽어 원하는 설정과 비교한 뒤 변경분만 적용한다.
+        plan_only=True 이면 계획만 출력하고 종료
+        """
         print("\n" + "🚀 "*20)
         print("RDS 자동 스케줄러 배포 시작")
         print("🚀 "*20)
         
-        self.step1_create_rds(master_password, 'dailyfeed-rds-dev-sg')
-        role_arn = self.step2_create_lambda_role()
-        lambda_arn = self.step3_create_lambda_function(role_arn)
-        self.step4_create_eventbridge_rules(lambda_arn)
+        self.package = self.build_lambda_package()
+        state = self.read_state()
+        self.plan_changes = self.plan(state)
+        self.print_plan(self.plan_changes)
+        
+        if plan_only:
+            return self.plan_changes
+        
+        pending = {resource for resource, action, _ in self.plan_changes if action != 'noop'}
+        if not pending:
+            print("\n✅ 변경 사항 없음: 배포할 리소스가 없습니다.")
+            return self.plan_changes
+        
+        # RDS 대기(5-10분)와 IAM/Lambda/EventBridge 작업은 서로 독립적이므로 병렬 실행
+        # 실제 의존 관계: 보안 그룹 → RDS → DB 사용자, 역할 → 함수 → 규칙
+        # 변경이 없는 리소스 체인은 단계 자체를 등록하지 않는다
+        executor = DagExecutor(max_workers=4)
+        if pending & {'security_group', 'db_instance'}:
+            executor.add_step('security_group',
+                              lambda: self.step1_create_security_group(state))
+            executor.add_step('rds',
+                              lambda sg_id: self.step1_create_rds(master_password, sg_id, state),
+                              deps=['security_group'])
+            executor.add_step('db_user',
+                              lambda endpoint: self.step1_create_database_user(endpoint, master_password),
+                              deps=['rds'])
+        
+        if pending - {'security_group', 'db_instance', 'db_user'}:
+            executor.add_step('lambda_role', lambda: self.step2_create_lambda_role(state))
+            executor.add_step('lambda_function',
+                              lambda role_arn: self.step3_create_lambda_function(role_arn, state),
+                              deps=['lambda_role'])
+            executor.add_step('eventbridge_rules',
+                              lambda lambda_arn: self.step4_create_eventbridge_rules(lambda_arn, state),
+                              deps=['lambda_function'])
+        executor.run()
         
         print("\n" + "✅ "*20)
         print("배포 완료!")
         print("✅ "*20)
         print(f"\n📊 설정 요약:")
         print(f"   RDS: {self.db_instance_id}")
-        print(f"   시작: 매일 오전 9시 (KST)")
-        print(f"   중지: 매일 오후 6시 (KST)")
-        print(f"   가동: 하루 9시간")
-        print(f"   예상 비용: $5-7/월 (75% 절감)")
+        print(f"   스케줄 대상: 태그 {self.lambda_environment()['TARGET_TAGS']} 인스턴스 전체")
+        print(f"   시작: 매일 오전 9시 (KST) available 목표, 시작 소요 시간 p{self.prewarm_percentile:g} 기준 사전 시작")
+        if self.idle_stop:
+            print(f"   중지: {self.idle_minutes}분 동안 DB 연결이 없을 때")
+        else:
+            print(f"   중지: 매일 오후 6시 (KST)")
+            print(f"   가동: 하루 9시간")
+            print(f"   예상 비용: $5-7/월 (75% 절감)")
+        return self.plan_changes
 
 if __name__ == '__main__':
+    import sys
+    
     deployer = RDSSchedulerDeployer(
         db_instance_id='dailyfeed-dev',
         db_name='dailyfeed',
-        region='ap-northeast-2'
+        region='ap-northeast-2',
+        # python rds-deploy-all.py --idle-stop → 오후 6시 고정 중지 대신 유휴 시 중지
+        idle_stop='--idle-stop' in sys.argv
     )
     
-    deployer.deploy(master_password='hitEnter###')
\ No newline at end of file
+    # python rds-deploy-all.py plan  → 변경 계획만 출력
+    plan_only = len(sys.argv) > 1 and sys.argv[1].lower() == 'plan'
+    deployer.deploy(master_password='hitEnter###', plan_only=plan_only)
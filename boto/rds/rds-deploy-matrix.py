@@ -0,0 +1,191 @@
+# deploy_matrix.py
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MATRIX = os.path.join(SCRIPT_DIR, 'deploy-matrix.json')
+
+# RDSSchedulerDeployer 생성자 인자로 넘기는 매트릭스 키
+DEPLOYER_KEYS = ('db_instance_id', 'db_name', 'region', 'target_tags', 'group_name',
+                 'prewarm_percentile', 'idle_stop', 'idle_minutes')
+# 리전마다 하나인 Lambda/규칙 설정: 같은 리전의 대상끼리 값이 같아야 한다
+REGION_SHARED_KEYS = ('target_tags', 'prewarm_percentile', 'idle_stop', 'idle_minutes')
+
+
+class MatrixError(Exception):
+    pass
+
+
+def load_matrix(path, only=None):
+    """
+    배포 매트릭스(JSON) → [대상 설정]
+
+    각 대상은 defaults 위에 덮어쓴 값이며 name, region, db_instance_id 가 필요하다.
+    """
+    with open(path) as f:
+        matrix = json.load(f)
+    defaults = matrix.get('defaults', {})
+
+    targets = []
+    for entry in matrix['targets']:
+        target = {**defaults, **entry}
+        for key in ('name', 'region', 'db_instance_id'):
+            if not target.get(key):
+                raise MatrixError(f"{target.get('name', '?')}: '{key}' 가 없습니다")
+        unknown = set(target) - set(DEPLOYER_KEYS) - {'name'}
+        if unknown:
+            raise MatrixError(f"{target['name']}: 알 수 없는 키 {', '.join(sorted(unknown))}")
+        targets.append(target)
+
+    names = [target['name'] for target in targets]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise MatrixError(f"중복된 대상 이름: {', '.join(sorted(duplicates))}")
+    if only:
+        missing = set(only) - set(names)
+        if missing:
+            raise MatrixError(f"매트릭스에 없는 대상: {', '.join(sorted(missing))}")
+        targets = [target for target in targets if target['name'] in only]
+
+    # 같은 리전의 대상은 Lambda 함수/규칙을 공유하므로 공유 설정이 다르면 서로 덮어쓴다
+    for region, group in group_by_region(targets).items():
+        for key in REGION_SHARED_KEYS:
+            values = {json.dumps(target.get(key), sort_keys=True) for target in group}
+            if len(values) > 1:
+                raise MatrixError(f"{region}: 같은 리전 대상의 '{key}' 값이 다릅니다 "
+                                  f"({', '.join(target['name'] for target in group)})")
+    return targets
+
+
+def group_by_region(targets):
+    groups = {}
+    for target in targets:
+        groups.setdefault(target['region'], []).append(target)
+    return groups
+
+
+def load_deployer_module():
+    """rds-deploy-all.py 를 모듈로 로드 (하이픈이 들어간 파일 이름)"""
+    spec = importlib.util.spec_from_file_location('deploy_all', os.path.join(SCRIPT_DIR, 'rds-deploy-all.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def deploy_target(deploy_all, target, master_password, plan_only):
+    """대상 하나 배포 → (이름, 리전, 성공 여부, 변경 수, 초, 출력)"""
+    output = io.StringIO()
+    start = time.monotonic()
+    ok, pending = True, 0
+    # 각 리전은 별도 프로세스이므로 stdout 전환이 다른 대상 출력과 섞이지 않는다
+    with contextlib.redirect_stdout(output):
+        try:
+            kwargs = {key: target[key] for key in DEPLOYER_KEYS if key in target}
+            deployer = deploy_all.RDSSchedulerDeployer(**kwargs)
+            changes = deployer.deploy(master_password=master_password, plan_only=plan_only)
+            pending = sum(1 for _, action, _ in changes if action != 'noop')
+        except Exception:
+            ok = False
+            print(f"❌ 배포 실패\n{traceback.format_exc()}")
+    return target['name'], target['region'], ok, pending, time.monotonic() - start, output.getvalue()
+
+
+def deploy_region(targets, master_password, plan_only):
+    """
+    리전 하나의 대상을 순서대로 배포 (프로세스 풀 작업 단위)
+
+    같은 리전의 대상은 Lambda 함수/규칙을 공유하므로 동시에 배포하지 않는다.
+    한 대상이 실패해도 나머지 대상은 계속 진행한다.
+    """
+    deploy_all = load_deployer_module()
+    return [deploy_target(deploy_all, target, master_password, plan_only) for target in targets]
+
+
+def print_target(name, region, ok, output):
+    print("\n" + "="*60)
+    print(f"[{name}] {region} {'✅' if ok else '❌'}")
+    print("="*60)
+    for line in output.rstrip().splitlines():
+        print(f"   {line}")
+
+
+def write_log(log_dir, name, output):
+    os.makedirs(log_dir, exist_ok=True)
+    path = os.path.join(log_dir, f"{name}.log")
+    with open(path, 'w') as f:
+        f.write(output)
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='여러 리전/환경에 RDS 스케줄러 동시 배포')
+    parser.add_argument('--matrix', default=DEFAULT_MATRIX, help='배포 매트릭스 JSON')
+    parser.add_argument('--only', nargs='+', default=None, help='배포할 대상 이름 (기본: 전체)')
+    parser.add_argument('--plan', action='store_true', help='변경 계획만 출력')
+    parser.add_argument('--max-workers', type=int, default=None, help='동시에 배포할 리전 수 (기본: 리전 수)')
+    parser.add_argument('--log-dir', default=None, help='대상별 출력 저장 디렉터리')
+    args = parser.parse_args()
+
+    # 마스터 비밀번호는 환경 변수로 전달 (기본값은 생성 스크립트와 같은 값)
+    master_password = os.getenv('RDS_MASTER_PASSWORD', 'hitEnter###')
+
+    print("="*60)
+    print("RDS 스케줄러 다중 리전 배포")
+    print("="*60)
+
+    try:
+        targets = load_matrix(args.matrix, only=args.only)
+    except (OSError, ValueError, KeyError, MatrixError) as e:
+        print(f"❌ 매트릭스 오류: {e}")
+        sys.exit(1)
+
+    regions = group_by_region(targets)
+    for region, group in regions.items():
+        print(f"📋 {region}: {', '.join(target['name'] for target in group)}")
+
+    start = time.monotonic()
+    results = []
+    # 리전마다 프로세스 하나: 대상 출력과 클라이언트/캐시 상태가 섞이지 않는다
+    with ProcessPoolExecutor(max_workers=args.max_workers or len(regions)) as pool:
+        futures = {
+            pool.submit(deploy_region, group, master_password, args.plan): region
+            for region, group in regions.items()
+        }
+        for future in as_completed(futures):
+            region = futures[future]
+            try:
+                region_results = future.result()
+            except Exception as e:
+                # 프로세스 자체가 실패한 경우 (모듈 로드 오류 등)
+                region_results = [(target['name'], region, False, 0, 0.0, f"❌ 배포 프로세스 실패: {e}\n")
+                                  for target in regions[region]]
+            for name, target_region, ok, pending, elapsed, output in region_results:
+                print_target(name, target_region, ok, output)
+                if args.log_dir:
+                    print(f"   📝 {write_log(args.log_dir, name, output)}")
+                results.append((name, target_region, ok, pending, elapsed))
+
+    total = time.monotonic() - start
+    print("\n" + "="*60)
+    print("요약")
+    print("="*60)
+    order = [target['name'] for target in targets]
+    for name, region, ok, pending, elapsed in sorted(results, key=lambda r: order.index(r[0])):
+        print(f"{'✅' if ok else '❌'} {name:<16} {region:<16} 변경 {pending:>3}건 {elapsed:>8.1f}s")
+    serial = sum(elapsed for *_, elapsed in results)
+    print(f"\n⏱️  전체 {total:.1f}s (대상별 합계 {serial:.1f}s)")
+
+    sys.exit(0 if all(ok for _, _, ok, _, _ in results) else 1)
+
+# 사용법:
+# python rds-deploy-matrix.py --plan                       # deploy-matrix.json 의 전체 대상 계획
+# python rds-deploy-matrix.py                              # 전체 배포 (리전끼리 동시, 같은 리전은 순서대로)
+# python rds-deploy-matrix.py --only dev dev-dr --log-dir logs
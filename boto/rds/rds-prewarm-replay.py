@@ -0,0 +1,86 @@
+# prewarm_replay.py
+# 기록된 RDS 시작 소요 시간을 재생해 백분위별 사전 시작 결과 비교 (AWS 호출 없이 실행 가능)
+import argparse
+import json
+import statistics
+import sys
+
+import prewarm
+
+PERCENTILES = (50, 75, 90, 95, 99)
+
+
+def load_durations(path):
+    """JSON 배열, 쉼표/줄바꿈 구분 숫자(초) 또는 SchedulerStartDurations 태그 값"""
+    with open(path) as f:
+        text = f.read().strip()
+    if text.startswith('['):
+        return [int(value) for value in json.loads(text)]
+    return prewarm.parse_durations(text.replace('\n', ','))
+
+
+def durations_from_instance(db_instance_id, region):
+    """RDS 인스턴스의 SchedulerStartDurations 태그에서 기록 읽기"""
+    import aws_client
+    rds = aws_client.client('rds', region_name=region)
+    db = rds.describe_db_instances(DBInstanceIdentifier=db_instance_id)['DBInstances'][0]
+    tags = {t['Key']: t['Value'] for t in db.get('TagList', [])}
+    return prewarm.parse_durations(tags.get(prewarm.DURATIONS_TAG))
+
+
+def summarize(results, skip):
+    """앞 skip 일(기록 부족 구간)을 제외한 (정시 비율, 평균 지연 초, 최대 지연 초, 평균 조기 가동 초)"""
+    results = results[skip:] or results
+    late = [late for _, _, late, _ in results]
+    early = [early for _, _, _, early in results]
+    on_time = sum(1 for value in late if value == 0) / len(results)
+    return on_time, statistics.mean(late), max(late), statistics.mean(early)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='RDS 사전 시작 타이밍 모델 리플레이')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--file', help='시작 소요 시간(초) 기록 파일')
+    source.add_argument('--instance', help='태그에서 기록을 읽을 RDS 인스턴스 식별자')
+    parser.add_argument('--region', default='ap-northeast-2')
+    parser.add_argument('--percentile', type=float, nargs='+', default=list(PERCENTILES), help='비교할 백분위')
+    parser.add_argument('--margin', type=int, default=prewarm.DEFAULT_MARGIN_SECONDS, help='여유 시간(초)')
+    parser.add_argument('--verbose', action='store_true', help='날짜별 결과 출력')
+    args = parser.parse_args()
+
+    if args.file:
+        durations = load_durations(args.file)
+    else:
+        durations = durations_from_instance(args.instance, args.region)
+    if not durations:
+        print("❌ 기록된 시작 소요 시간이 없습니다")
+        sys.exit(1)
+
+    print("="*60)
+    print("RDS 사전 시작 리플레이")
+    print("="*60)
+    print(f"📋 기록 {len(durations)}건: 중앙값 {statistics.median(durations) / 60:.1f}분, "
+          f"최대 {max(durations) / 60:.1f}분")
+    print(f"   기록 {prewarm.MIN_SAMPLES}건 미만 구간은 기본 선행 시간 "
+          f"{prewarm.DEFAULT_LEAD_SECONDS // 60}분 사용 (요약에서 제외)")
+
+    print("\n" + "="*60)
+    print("백분위별 결과")
+    print("="*60)
+    print(f"   {'백분위':<8} {'정시 비율':>9} {'평균 지연':>9} {'최대 지연':>9} {'조기 가동':>9}")
+    for pct in args.percentile:
+        results = prewarm.replay(durations, pct, args.margin)
+        on_time, late_avg, late_max, early_avg = summarize(results, prewarm.MIN_SAMPLES)
+        print(f"   p{pct:<7g} {on_time * 100:>8.0f}% {late_avg / 60:>8.1f}분 {late_max / 60:>8.1f}분 "
+              f"{early_avg / 60:>8.1f}분")
+        if args.verbose:
+            for day, (actual, lead, late, _) in enumerate(results, 1):
+                status = f"❌ {late / 60:.1f}분 늦음" if late else '✅'
+                print(f"      {day:>3}일: 소요 {actual / 60:>5.1f}분, {lead // 60:>3}분 전 시작 {status}")
+
+    print("\n   정시 비율: 목표 시각(오전 9시)에 이미 available 이었던 날의 비율")
+    print("   조기 가동: available 이 된 뒤 목표 시각까지 비용만 발생한 평균 시간")
+
+# 사용법:
+# python rds-prewarm-replay.py --file start-durations.txt
+# python rds-prewarm-replay.py --instance dailyfeed-dev --percentile 90 95 --verbose
@@ -1,10 +1,16 @@
 # manual_control.py
-import boto3
+import argparse
+import fnmatch
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import aws_client
+from rds_waiter import RDSReadinessWaiter
 
 def control_rds(action, db_instance_id='dailyfeed-dev'):
     """RDS 수동 시작/중지"""
-    rds = boto3.client('rds', region_name='ap-northeast-2')
+    rds = aws_client.client('rds', region_name='ap-northeast-2')
     
     try:
         response = rds.describe_db_instances(
@@ -30,14 +36,111 @@ def control_rds(action, db_instance_id='dailyfeed-dev'):
     except Exception as e:
         print(f"❌ 오류: {e}")
 
+def parse_tags(tag_args):
+    """['Key=Value', ...] → {'Key': 'Value'}"""
+    tags = {}
+    for tag in tag_args or []:
+        key, sep, value = tag.partition('=')
+        if not sep:
+            raise ValueError(f"태그 형식 오류(Key=Value): {tag}")
+        tags[key] = value
+    return tags
+
+def discover_instances(rds, tags=None, pattern=None):
+    """
+    태그/식별자 패턴으로 대상 인스턴스 조회
+
+    describe_db_instances 한 번의 페이지네이션으로 전체를 읽고
+    응답에 포함된 TagList로 걸러낸다 (인스턴스별 추가 호출 없음)
+    """
+    tags = tags or {}
+    instances = []
+    for page in rds.get_paginator('describe_db_instances').paginate():
+        for db in page['DBInstances']:
+            if pattern and not fnmatch.fnmatch(db['DBInstanceIdentifier'], pattern):
+                continue
+            db_tags = {t['Key']: t['Value'] for t in db.get('TagList', [])}
+            if any(db_tags.get(k) != v for k, v in tags.items()):
+                continue
+            instances.append(db)
+    return instances
+
+def _control_one(rds, action, db):
+    """인스턴스 하나에 시작/중지 요청 (상태가 맞지 않으면 건너뜀)"""
+    db_instance_id = db['DBInstanceIdentifier']
+    status = db['DBInstanceStatus']
+    start = time.monotonic()
+    result = {'id': db_instance_id, 'status': status}
+
+    try:
+        if action == 'start' and status == 'stopped':
+            rds.start_db_instance(DBInstanceIdentifier=db_instance_id)
+            result['result'] = '✅ 시작 요청'
+        elif action == 'stop' and status == 'available':
+            rds.stop_db_instance(DBInstanceIdentifier=db_instance_id)
+            result['result'] = '✅ 중지 요청'
+        else:
+            result['result'] = '⏭️  건너뜀'
+    except Exception as e:
+        result['result'] = f"❌ 실패: {e}"
+
+    result['requested'] = result['result'].startswith('✅')
+    result['elapsed'] = time.monotonic() - start
+    return result
+
+def control_fleet(action, tags=None, pattern=None, region='ap-northeast-2',
+                  max_workers=8, wait=False):
+    """태그/패턴으로 선택한 RDS 인스턴스들을 동시에 시작/중지"""
+    rds = aws_client.client('rds', region_name=region)
+
+    instances = discover_instances(rds, tags, pattern)
+    if not instances:
+        print("⚠️  조건에 맞는 RDS 인스턴스가 없습니다.")
+        return []
+    print(f"🔍 대상 인스턴스: {len(instances)}개")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(lambda db: _control_one(rds, action, db), instances))
+
+    width = max(len(r['id']) for r in results)
+    print(f"\n   {'인스턴스':<{width}}  {'이전 상태':<12}  {'소요':>6}  결과")
+    for r in results:
+        print(f"   {r['id']:<{width}}  {r['status']:<12}  {r['elapsed']:5.2f}s  {r['result']}")
+
+    requested = [r['id'] for r in results if r['requested']]
+    print(f"\n📊 요청 {len(requested)}개 / 건너뜀·실패 {len(results) - len(requested)}개")
+
+    if wait and requested:
+        target = 'available' if action == 'start' else 'stopped'
+        print(f"\n⏳ {len(requested)}개 인스턴스가 {target} 상태가 될 때까지 대기 중...")
+        RDSReadinessWaiter(rds).wait(requested, target=target)
+
+    return results
+
 if __name__ == '__main__':
-    if len(sys.argv) < 2:
-        print("사용법: python rds-create-not-auto.py [start|stop]")
-        sys.exit(1)
-    
-    action = sys.argv[1].lower()
-    control_rds(action)
+    parser = argparse.ArgumentParser(description='RDS 수동 시작/중지')
+    parser.add_argument('action', choices=['start', 'stop'], type=str.lower)
+    parser.add_argument('--tag', action='append', metavar='KEY=VALUE',
+                        help='태그로 대상 선택 (여러 번 지정 가능, 모두 일치)')
+    parser.add_argument('--pattern', help="식별자 패턴으로 대상 선택 (예: 'dailyfeed-*')")
+    parser.add_argument('--region', default='ap-northeast-2')
+    parser.add_argument('--workers', type=int, default=8, help='동시 요청 수')
+    parser.add_argument('--wait', action='store_true', help='모든 인스턴스가 목표 상태가 될 때까지 대기')
+    args = parser.parse_args()
+
+    if args.tag or args.pattern:
+        try:
+            tags = parse_tags(args.tag)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        control_fleet(args.action, tags=tags, pattern=args.pattern, region=args.region,
+                      max_workers=args.workers, wait=args.wait)
+    else:
+        control_rds(args.action)
 
 # 사용법:
-# python rds-create-not-auto.py start
-# python rds-create-not-auto.py stop
\ No newline at end of file
+# python rds-start-stop-not-auto.py start
+# python rds-start-stop-not-auto.py stop
+# python rds-start-stop-not-auto.py stop --tag AutoShutdown=true --wait
+# python rds-start-stop-not-auto.py start --pattern 'dailyfeed-*' --workers 4
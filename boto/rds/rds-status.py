@@ -0,0 +1,257 @@
+# rds_status.py
+import argparse
+import asyncio
+import datetime
+import fnmatch
+import sys
+import time
+
+import aws_client
+
+FUNCTION_PREFIX = 'RDSScheduler'
+RULE_PREFIX = 'RDSScheduler-'
+METRIC_PERIOD = 300
+METRIC_WINDOW_HOURS = 24
+CONNECT_TIMEOUT = 2
+
+CLEAR_SCREEN = '\033[H\033[J'
+
+STATUS_SYMBOLS = {
+    'available': '🟢',
+    'stopped': '⚪',
+    'starting': '🟡',
+    'stopping': '🟡',
+    'creating': '🟡',
+    'modifying': '🟡',
+    'backing-up': '🟡',
+    'deleting': '🔴',
+}
+
+
+class StatusCollector:
+    """
+    리전별 RDS/EventBridge/Lambda 상태 수집기
+
+    한 틱에서 (서비스, 리전)마다 페이지네이션 조회를 한 번만 하고 모든 행이 그 결과를 공유한다.
+    이전 틱의 같은 조회가 아직 진행 중이면 새로 요청하지 않고 그 결과를 기다린다(요청 병합).
+    boto3 호출은 스레드에서 실행하고, 서비스/리전/DB 연결 확인은 asyncio 로 동시에 진행한다.
+    조회 결과가 바로 보이도록 aws_client 캐시는 사용하지 않는다.
+    """
+
+    def __init__(self, regions, pattern='dailyfeed-*', function_prefix=FUNCTION_PREFIX):
+        self.regions = regions
+        self.pattern = pattern
+        self.function_prefix = function_prefix
+        self.clients = {}
+        self.in_flight = {}
+        self.calls = 0
+
+    def _client(self, service, region):
+        key = (service, region)
+        if key not in self.clients:
+            self.clients[key] = aws_client.CachedClient(service, region_name=region, mode='off')
+        return self.clients[key]
+
+    async def _coalesced(self, key, func):
+        """같은 key 의 조회가 진행 중이면 그 작업을 공유"""
+        task = self.in_flight.get(key)
+        if task is None or task.done():
+            self.calls += 1
+            task = asyncio.ensure_future(asyncio.to_thread(func))
+            self.in_flight[key] = task
+        return await task
+
+    def _paginate(self, service, region, operation, result_key, **kwargs):
+        paginator = self._client(service, region).get_paginator(operation)
+        return [item for page in paginator.paginate(**kwargs) for item in page[result_key]]
+
+    def _describe_instances(self, region):
+        instances = self._paginate('rds', region, 'describe_db_instances', 'DBInstances')
+        return [db for db in instances if fnmatch.fnmatch(db['DBInstanceIdentifier'], self.pattern)]
+
+    def _list_rules(self, region):
+        return self._paginate('events', region, 'list_rules', 'Rules', NamePrefix=RULE_PREFIX)
+
+    def _list_functions(self, region):
+        functions = self._paginate('lambda', region, 'list_functions', 'Functions')
+        return [f for f in functions if f['FunctionName'].startswith(self.function_prefix)]
+
+    def _invocation_metrics(self, region, function_names):
+        """함수별 최근 24시간 호출/오류 수를 get_metric_data 한 번으로 조회"""
+        if not function_names:
+            return {}
+        queries = []
+        for i, name in enumerate(function_names):
+            for metric in ('Invocations', 'Errors'):
+                queries.append({
+                    'Id': f"{metric.lower()}{i}",
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': 'AWS/Lambda',
+                            'MetricName': metric,
+                            'Dimensions': [{'Name': 'FunctionName', 'Value': name}],
+                        },
+                        'Period': METRIC_PERIOD,
+                        'Stat': 'Sum',
+                    },
+                })
+        end = datetime.datetime.now(datetime.timezone.utc)
+        response = self._client('cloudwatch', region).get_metric_data(
+            MetricDataQueries=queries,
+            StartTime=end - datetime.timedelta(hours=METRIC_WINDOW_HOURS),
+            EndTime=end,
+            ScanBy='TimestampDescending',
+        )
+        series = {r['Id']: dict(zip(r['Timestamps'], r['Values'])) for r in response['MetricDataResults']}
+
+        metrics = {}
+        for i, name in enumerate(function_names):
+            invocations = series.get(f"invocations{i}", {})
+            errors = series.get(f"errors{i}", {})
+            invoked = sorted((ts for ts, value in invocations.items() if value > 0), reverse=True)
+            last = invoked[0] if invoked else None
+            metrics[name] = {
+                'invocations': int(sum(invocations.values())),
+                'errors': int(sum(errors.values())),
+                'last_invoked': last,
+                'last_failed': bool(last and errors.get(last, 0) > 0),
+            }
+        return metrics
+
+    async def _functions_with_metrics(self, region):
+        functions = await self._coalesced(('lambda', region), lambda: self._list_functions(region))
+        names = [f['FunctionName'] for f in functions]
+        metrics = await self._coalesced(('cloudwatch', region),
+                                        lambda: self._invocation_metrics(region, names))
+        return [(f, metrics.get(f['FunctionName'], {})) for f in functions]
+
+    @staticmethod
+    async def _check_connectivity(db):
+        """엔드포인트 TCP 연결 시간(ms), 연결할 수 없으면 None"""
+        endpoint = db.get('Endpoint')
+        if not endpoint or db['DBInstanceStatus'] != 'available':
+            return None
+        start = time.monotonic()
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(endpoint['Address'], endpoint['Port']), CONNECT_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError):
+            return None
+        writer.close()
+        return (time.monotonic() - start) * 1000
+
+    async def _collect_region(self, region):
+        results = await asyncio.gather(
+            self._coalesced(('rds', region), lambda: self._describe_instances(region)),
+            self._coalesced(('events', region), lambda: self._list_rules(region)),
+            self._functions_with_metrics(region),
+            return_exceptions=True,
+        )
+        instances, rules, functions = results
+        errors = [f"{region}: {r}" for r in results if isinstance(r, Exception)]
+        instances = [] if isinstance(instances, Exception) else instances
+        rules = [] if isinstance(rules, Exception) else rules
+        functions = [] if isinstance(functions, Exception) else functions
+
+        latencies = await asyncio.gather(*(self._check_connectivity(db) for db in instances))
+        return {
+            'region': region,
+            'instances': list(zip(instances, latencies)),
+            'rules': rules,
+            'functions': functions,
+            'errors': errors,
+        }
+
+    async def collect(self):
+        """모든 리전 상태 한 번 수집 → (리전별 결과, 소요 ms, 이번 틱 API 조회 수)"""
+        calls_before = self.calls
+        start = time.monotonic()
+        snapshot = await asyncio.gather(*(self._collect_region(region) for region in self.regions))
+        return snapshot, (time.monotonic() - start) * 1000, self.calls - calls_before
+
+
+def _format_time(value):
+    if value is None:
+        return '-'
+    return value.astimezone().strftime('%m-%d %H:%M')
+
+
+def render(snapshot, elapsed_ms, calls):
+    """상태 표 문자열"""
+    lines = [f"📊 dailyfeed 상태  {datetime.datetime.now():%Y-%m-%d %H:%M:%S}  "
+             f"(수집 {elapsed_ms:.0f}ms, 조회 {calls}회)", '']
+
+    lines.append("RDS")
+    lines.append(f"   {'리전':<16} {'인스턴스':<28} {'상태':<14} {'클래스':<14} {'AutoShutdown':<13} 연결")
+    for region in snapshot:
+        for db, latency in region['instances']:
+            status = db['DBInstanceStatus']
+            tags = {t['Key']: t['Value'] for t in db.get('TagList', [])}
+            connectivity = f"{latency:.0f}ms" if latency is not None else ('❌' if status == 'available' else '-')
+            lines.append(f"   {region['region']:<16} {db['DBInstanceIdentifier']:<28} "
+                         f"{STATUS_SYMBOLS.get(status, '❔')} {status:<11} {db['DBInstanceClass']:<14} "
+                         f"{tags.get('AutoShutdown', '-'):<13} {connectivity}")
+
+    lines.append('')
+    lines.append("EventBridge 규칙")
+    lines.append(f"   {'리전':<16} {'규칙':<28} {'상태':<14} 스케줄")
+    for region in snapshot:
+        for rule in region['rules']:
+            state = rule.get('State', '-')
+            symbol = '🟢' if state == 'ENABLED' else '⚪'
+            lines.append(f"   {region['region']:<16} {rule['Name']:<28} {symbol} {state:<11} "
+                         f"{rule.get('ScheduleExpression', '-')}")
+
+    lines.append('')
+    lines.append(f"Lambda (최근 {METRIC_WINDOW_HOURS}시간)")
+    lines.append(f"   {'리전':<16} {'함수':<28} {'마지막 호출':<14} {'결과':<6} 호출/오류")
+    for region in snapshot:
+        for function, metrics in region['functions']:
+            last = metrics.get('last_invoked')
+            result = '-' if last is None else ('❌' if metrics['last_failed'] else '✅')
+            lines.append(f"   {region['region']:<16} {function['FunctionName']:<28} {_format_time(last):<14} "
+                         f"{result:<6} {metrics.get('invocations', 0)}/{metrics.get('errors', 0)}")
+
+    errors = [error for region in snapshot for error in region['errors']]
+    if errors:
+        lines.append('')
+        lines.extend(f"⚠️  {error}" for error in errors)
+    return '\n'.join(lines)
+
+
+async def watch(collector, interval, once):
+    in_place = sys.stdout.isatty() and not once
+    while True:
+        tick = time.monotonic()
+        snapshot, elapsed_ms, calls = await collector.collect()
+        text = render(snapshot, elapsed_ms, calls)
+        if in_place:
+            # 화면을 지우고 같은 위치에 다시 그린다
+            sys.stdout.write(CLEAR_SCREEN + text + f"\n\n{interval}초마다 갱신 (Ctrl+C 종료)\n")
+            sys.stdout.flush()
+        else:
+            print(text)
+        if once:
+            return
+        await asyncio.sleep(max(interval - (time.monotonic() - tick), 0))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='dailyfeed RDS/스케줄러 상태 대시보드')
+    parser.add_argument('--region', nargs='+', default=['ap-northeast-2'], help='조회할 리전 (여러 개 가능)')
+    parser.add_argument('--pattern', default='dailyfeed-*', help='RDS 식별자 패턴')
+    parser.add_argument('--interval', type=float, default=5, help='갱신 주기(초)')
+    parser.add_argument('--once', action='store_true', help='한 번만 출력하고 종료')
+    args = parser.parse_args()
+
+    collector = StatusCollector(args.region, pattern=args.pattern)
+    try:
+        asyncio.run(watch(collector, args.interval, args.once))
+    except KeyboardInterrupt:
+        pass
+
+# 사용법:
+# python rds-status.py
+# python rds-status.py --once
+# python rds-status.py --region ap-northeast-2 us-east-1 --interval 10
@@ -1,120 +1,127 @@
 # rds-user-create.py
-import boto3
-import pymysql
+import argparse
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-def create_database_user(endpoint, master_username, master_password, db_name,
-                        new_username='dailyfeed', new_password='hitEnter###'):
-    """
-    RDS 인스턴스에 새로운 데이터베이스 사용자 생성
-    """
-    print(f"\n🔐 데이터베이스 사용자 확인 및 생성 중...")
+import aws_client
+import db_users
 
-    try:
-        # MySQL 연결
-        connection = pymysql.connect(
-            host=endpoint,
-            user=master_username,
-            password=master_password,
-            database=db_name,
-            connect_timeout=10
-        )
+# describe_db_instances 필터 값 최대 개수
+FILTER_CHUNK = 100
 
-        with connection.cursor() as cursor:
-            # 사용자 존재 여부 확인
-            cursor.execute(f"SELECT User FROM mysql.user WHERE User = '{new_username}' AND Host = '%'")
-            user_exists = cursor.fetchone()
-
-            if user_exists:
-                print(f"ℹ️  사용자가 이미 존재합니다: {new_username}")
-            else:
-                # 사용자 생성
-                cursor.execute(f"CREATE USER '{new_username}'@'%' IDENTIFIED BY '{new_password}'")
-                print(f"✅ 사용자 생성: {new_username}")
-
-            # 권한 부여 (모든 권한)
-            cursor.execute(f"GRANT ALL PRIVILEGES ON {db_name}.* TO '{new_username}'@'%'")
-            print(f"✅ 권한 부여: {db_name} 데이터베이스에 대한 모든 권한")
-
-            # 권한 적용
-            cursor.execute("FLUSH PRIVILEGES")
-            print(f"✅ 권한 적용 완료")
-
-        connection.commit()
-        connection.close()
-
-        print(f"\n📊 사용자 정보:")
-        print(f"   사용자명: {new_username}")
-        print(f"   비밀번호: {new_password}")
-        print(f"   데이터베이스: {db_name}")
-        print(f"   엔드포인트: {endpoint}")
-
-    except pymysql.MySQLError as e:
-        print(f"❌ 사용자 생성 실패: {str(e)}")
-        print(f"   수동으로 사용자를 생성해야 할 수 있습니다.")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ 연결 오류: {str(e)}")
-        print(f"   보안 그룹 설정을 확인하세요.")
-        sys.exit(1)
-
-def get_rds_endpoint(db_instance_identifier, region='ap-northeast-2'):
-    """
-    RDS 인스턴스의 엔드포인트 가져오기
+def get_rds_endpoints(db_instance_identifiers, region='ap-northeast-2'):
     """
-    print(f"🔍 RDS 인스턴스 정보 조회 중: {db_instance_identifier}")
-
-    rds = boto3.client('rds', region_name=region)
-
-    try:
-        response = rds.describe_db_instances(DBInstanceIdentifier=db_instance_identifier)
-        db_instance = response['DBInstances'][0]
+    RDS 인스턴스들의 (엔드포인트, 포트, 마스터 사용자) 조회
 
-        status = db_instance['DBInstanceStatus']
-        if status != 'available':
-            print(f"⚠️  RDS 인스턴스 상태: {status}")
-            print(f"   인스턴스가 'available' 상태가 아닙니다.")
-            sys.exit(1)
-
-        endpoint = db_instance['Endpoint']['Address']
-        print(f"✅ 엔드포인트 확인: {endpoint}")
-        return endpoint
-
-    except rds.exceptions.DBInstanceNotFoundFault:
-        print(f"❌ RDS 인스턴스를 찾을 수 없습니다: {db_instance_identifier}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ 오류 발생: {str(e)}")
-        sys.exit(1)
+    인스턴스 수와 관계없이 필터 조회 한 번(100개 단위)으로 가져온다.
+    available 상태가 아니거나 없는 인스턴스는 결과에서 빠진다.
+    """
+    print(f"🔍 RDS 인스턴스 정보 조회 중: {', '.join(db_instance_identifiers)}")
+
+    rds = aws_client.client('rds', region_name=region)
+    endpoints = {}
+    for i in range(0, len(db_instance_identifiers), FILTER_CHUNK):
+        chunk = db_instance_identifiers[i:i + FILTER_CHUNK]
+        pages = rds.get_paginator('describe_db_instances').paginate(
+            Filters=[{'Name': 'db-instance-id', 'Values': chunk}]
+        )
+        for page in pages:
+            for db in page['DBInstances']:
+                db_id = db['DBInstanceIdentifier']
+                if db['DBInstanceStatus'] != 'available':
+                    print(f"⚠️  {db_id}: 'available' 상태가 아닙니다 ({db['DBInstanceStatus']})")
+                    continue
+                endpoints[db_id] = (db['Endpoint']['Address'], db['Endpoint']['Port'], db['MasterUsername'])
+
+    for db_id in db_instance_identifiers:
+        if db_id not in endpoints:
+            print(f"❌ 사용할 수 없는 RDS 인스턴스: {db_id}")
+    return endpoints
+
+def provision_target(name, host, port, master_username, master_password, users, prune, dry_run):
+    """대상 하나 처리 → (이름, 실패 수, 경고 수, ms, 출력 줄)"""
+    lines = []
+    start = time.monotonic()
+    failed, warned = db_users.provision(host, master_username, master_password, users=users, port=port,
+                                        prune=prune, dry_run=dry_run, log=lines.append)
+    return name, failed, warned, (time.monotonic() - start) * 1000, lines
+
+def parse_host(value):
+    """'host' 또는 'host:port' → (host, port)"""
+    host, _, port = value.partition(':')
+    return host, int(port or 3306)
 
 if __name__ == '__main__':
-    # RDS 인스턴스 설정
-    db_instance_identifier = 'dailyfeed-dev'
-    db_name = 'dailyfeed'
-    master_username = 'admin'
-    master_password = 'hitEnter###'
-
-    # 새로 생성할 사용자 정보
-    new_username = 'dailyfeed'
-    new_password = 'hitEnter###'
+    parser = argparse.ArgumentParser(description='매니페스트 기반 RDS 데이터베이스 사용자 생성')
+    parser.add_argument('--instance', nargs='+', default=None,
+                        help='대상 RDS 인스턴스 식별자 (기본: dailyfeed-dev)')
+    parser.add_argument('--host', nargs='+', default=[], metavar='HOST[:PORT]',
+                        help='RDS 조회 없이 직접 접속할 MySQL')
+    parser.add_argument('--manifest', default=db_users.DEFAULT_MANIFEST, help='사용자/권한 매니페스트')
+    parser.add_argument('--database', default=None, help="매니페스트의 {database} 값")
+    parser.add_argument('--master-user', default=None, help='마스터 사용자 (기본: RDS 의 MasterUsername)')
+    parser.add_argument('--region', default='ap-northeast-2')
+    parser.add_argument('--prune', action='store_true', help='매니페스트에 없는 권한 회수')
+    parser.add_argument('--dry-run', action='store_true', help='변경 계획만 출력')
+    args = parser.parse_args()
+
+    # 마스터 비밀번호는 환경 변수로 전달 (기본값은 생성 스크립트와 같은 값)
+    master_password = os.getenv('RDS_MASTER_PASSWORD', 'hitEnter###')
 
     print("="*60)
     print("RDS 데이터베이스 사용자 생성 스크립트")
     print("="*60)
 
-    # RDS 엔드포인트 가져오기
-    endpoint = get_rds_endpoint(db_instance_identifier)
-
-    # 데이터베이스 사용자 생성
-    create_database_user(
-        endpoint=endpoint,
-        master_username=master_username,
-        master_password=master_password,
-        db_name=db_name,
-        new_username=new_username,
-        new_password=new_password
-    )
+    try:
+        users = db_users.load_manifest(args.manifest, database=args.database)
+    except (OSError, ValueError, KeyError, db_users.ManifestError) as e:
+        print(f"❌ 매니페스트 오류: {e}")
+        sys.exit(1)
+    print(f"📋 사용자 {len(users)}명: {', '.join(user.label for user in users)}")
+
+    targets = [(value, *parse_host(value), args.master_user or 'admin') for value in args.host]
+    instances = args.instance if args.instance is not None else ([] if args.host else ['dailyfeed-dev'])
+    if instances:
+        endpoints = get_rds_endpoints(instances, region=args.region)
+        targets += [(db_id, host, port, args.master_user or master_user)
+                    for db_id, (host, port, master_user) in endpoints.items()]
+        missing = len(instances) - len(endpoints)
+    else:
+        missing = 0
+
+    results = []
+    if targets:
+        # 인스턴스마다 연결 하나로 조회/적용하고, 인스턴스끼리는 동시에 처리
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            futures = [
+                pool.submit(provision_target, name, host, port, master_user, master_password,
+                            users, args.prune, args.dry_run)
+                for name, host, port, master_user in targets
+            ]
+            for future in futures:
+                name, failed, warned, elapsed, lines = future.result()
+                results.append((name, failed, warned, elapsed))
+                print("\n" + "="*60)
+                print(f"[{name}]")
+                print("="*60)
+                for line in lines:
+                    print(f"   {line}")
 
     print("\n" + "="*60)
-    print("사용자 생성 완료!")
+    print("요약")
     print("="*60)
+    for name, failed, warned, elapsed in results:
+        mark = '❌' if failed else '⚠️ ' if warned else '✅'
+        print(f"{mark} {name:<30} 실패 {failed:>2} 경고 {warned:>2} {elapsed:>8.0f}ms")
+
+    # 이 스크립트는 반영 상태 확인용이므로 경고(건너뛴 사용자, 테이블 없음)도 종료 코드 1
+    ok = all(failed == 0 and warned == 0 for _, failed, warned, _ in results)
+    sys.exit(0 if results and missing == 0 and ok else 1)
+
+# 사용법:
+# python rds-user-create.py                                    # dailyfeed-dev 에 db-users.json 반영
+# python rds-user-create.py --instance dailyfeed-dev dailyfeed-stg --dry-run
+# python rds-user-create.py --host localhost:23306 --master-user root
+# DAILYFEED_READONLY_DB_PASSWORD=... python rds-user-create.py --prune
@@ -0,0 +1,241 @@
+# rds_waiter.py
+import fcntl
+import json
+import os
+import random
+import statistics
+import time
+
+# 상태별 예상 소요 시간(초): 관측 이력이 없을 때 사용하는 기본값
+DEFAULT_PHASE_SECONDS = {
+    'creating': 420,
+    'backing-up': 120,
+    'configuring-enhanced-monitoring': 60,
+    'configuring-log-exports': 30,
+    'modifying': 90,
+    'rebooting': 60,
+    'starting': 360,
+    'stopping': 240,
+    'deleting': 300,
+}
+
+# 목표 상태에 도달하기 전에 일반적으로 거치는 후속 상태
+NEXT_PHASES = {
+    'creating': ['backing-up'],
+}
+
+FAILED_STATUSES = {
+    'failed',
+    'incompatible-network',
+    'incompatible-option-group',
+    'incompatible-parameters',
+    'incompatible-restore',
+    'inaccessible-encryption-credentials',
+    'storage-full',
+}
+
+HISTORY_PATH = os.path.expanduser('~/.cache/dailyfeed/rds-wait-history.json')
+HISTORY_SIZE = 20
+
+# describe_db_instances 필터 값 최대 개수
+FILTER_CHUNK = 100
+
+
+def format_seconds(seconds):
+    seconds = int(max(seconds, 0))
+    if seconds >= 60:
+        return f"{seconds // 60}분 {seconds % 60:02d}초"
+    return f"{seconds}초"
+
+
+class RDSReadinessWaiter:
+    """
+    RDS 인스턴스 상태 대기기 (db_instance_available 등 고정 주기 waiter 대체)
+
+    - 상태 구간의 시작과 예상 종료 시점 근처에서는 짧은 주기로 폴링하고,
+      그 사이에는 지터를 섞어 간격을 늘린다.
+    - 이전 실행에서 관측한 상태 전이(creating → backing-up → available 등)의
+      소요 시간을 이력 파일에 기록하고 다음 대기의 예상 시간으로 사용한다.
+    - 여러 인스턴스를 한 번의 describe_db_instances 호출(틱당 1회)로 함께 대기한다.
+    """
+
+    def __init__(self, rds, history_path=HISTORY_PATH, min_delay=5, max_delay=60,
+                 jitter=0.2, timeout=1200, sleep=time.sleep, clock=time.monotonic):
+        self.rds = rds
+        self.history_path = history_path
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.timeout = timeout
+        self.sleep = sleep
+        self.clock = clock
+        self.history = self._load_history()
+        # 이번 실행에서 관측한 구간 (저장 시 파일의 최신 이력에 합친다)
+        self.observed = {}
+        self.describe_calls = 0
+
+    def _load_history(self):
+        if not self.history_path or not os.path.exists(self.history_path):
+            return {}
+        try:
+            with open(self.history_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_history(self):
+        """
+        관측한 구간을 이력 파일에 저장
+
+        여러 프로세스/스레드의 waiter 가 동시에 저장할 수 있으므로, 잠금 파일을 잡은 상태에서
+        현재 파일 내용에 이번 관측을 합치고 임시 파일 → os.replace 로 한 번에 교체한다.
+        """
+        if not self.history_path or not self.observed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.history_path), exist_ok=True)
+            with open(f"{self.history_path}.lock", 'w') as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                history = self._load_history()
+                for status, samples in self.observed.items():
+                    merged = history.setdefault(status, [])
+                    merged.extend(samples)
+                    del merged[:-HISTORY_SIZE]
+                tmp_path = f"{self.history_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(history, f, indent=2)
+                os.replace(tmp_path, self.history_path)
+            self.history = history
+            self.observed = {}
+        except OSError as e:
+            print(f"⚠️  대기 이력 저장 실패: {e}")
+
+    def expected_seconds(self, status):
+        """상태 구간의 예상 소요 시간 (관측 이력 중앙값, 없으면 기본값)"""
+        samples = self.history.get(status)
+        if samples:
+            return statistics.median(samples)
+        return DEFAULT_PHASE_SECONDS.get(status, 60)
+
+    def _record_phase(self, status, seconds):
+        seconds = round(seconds, 1)
+        self.observed.setdefault(status, []).append(seconds)
+        samples = self.history.setdefault(status, [])
+        samples.append(seconds)
+        del samples[:-HISTORY_SIZE]
+
+    def _eta(self, status, phase_elapsed):
+        remaining = max(self.expected_seconds(status) - phase_elapsed, 0)
+        for phase in NEXT_PHASES.get(status, []):
+            remaining += self.expected_seconds(phase)
+        return remaining
+
+    def _next_delay(self, state):
+        """현재 상태 구간의 위치에 따라 다음 폴링 간격 결정"""
+        phase_elapsed = state['phase_elapsed']
+        remaining = self.expected_seconds(state['status']) - phase_elapsed
+
+        if phase_elapsed < 2 * self.min_delay:
+            # 구간 초반: 빠른 전이를 놓치지 않도록 짧게
+            return self.min_delay
+        if remaining <= 2 * self.min_delay:
+            # 예상 종료 시점 근처/초과: 짧게 폴링하되 계속 지연되면 점차 늘림
+            overdue = max(-remaining, 0)
+            return min(self.min_delay * (1 + overdue / 60), self.max_delay)
+        # 구간 중간: 남은 시간의 1/3 간격, 지터 적용
+        delay = min(remaining / 3, self.max_delay)
+        delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(delay, self.min_delay)
+
+    def _describe(self, ids):
+        found = {}
+        paginator = self.rds.get_paginator('describe_db_instances')
+        for i in range(0, len(ids), FILTER_CHUNK):
+            chunk = ids[i:i + FILTER_CHUNK]
+            pages = paginator.paginate(
+                Filters=[{'Name': 'db-instance-id', 'Values': chunk}]
+            )
+            for page in pages:
+                self.describe_calls += 1
+                for db in page['DBInstances']:
+                    found[db['DBInstanceIdentifier']] = db
+        return found
+
+    def wait(self, db_instance_ids, target='available', fresh=True):
+        """
+        인스턴스들이 목표 상태가 될 때까지 대기
+
+        target: 'available', 'stopped' 또는 'deleted'(인스턴스가 사라질 때까지)
+        fresh: 방금 생성/시작/중지를 요청했다면 True (첫 상태 구간도 이력에 기록)
+        반환: 인스턴스 ID → 마지막 describe 결과 (deleted는 None)
+        """
+        if isinstance(db_instance_ids, str):
+            db_instance_ids = [db_instance_ids]
+        ids = list(dict.fromkeys(db_instance_ids))
+
+        started = self.clock()
+        states = {
+            db_id: {'status': None, 'since': started, 'observed_start': fresh}
+            for db_id in ids
+        }
+        results = {}
+        pending = list(ids)
+
+        try:
+            while True:
+                now = self.clock()
+                found = self._describe(pending)
+
+                for db_id in list(pending):
+                    state = states[db_id]
+                    db = found.get(db_id)
+                    status = db['DBInstanceStatus'] if db else None
+
+                    if status is None and target != 'deleted':
+                        # 생성 직후에는 잠시 조회되지 않을 수 있음
+                        status = 'creating' if fresh else None
+                        if status is None:
+                            raise RuntimeError(f"RDS 인스턴스를 찾을 수 없습니다: {db_id}")
+
+                    if status != state['status']:
+                        if state['status'] is not None and state['observed_start']:
+                            self._record_phase(state['status'], now - state['since'])
+                        state['observed_start'] = state['status'] is not None or fresh
+                        state['status'] = status
+                        state['since'] = now
+
+                    if status in FAILED_STATUSES:
+                        raise RuntimeError(f"{db_id}: 실패 상태 {status}")
+
+                    done = (db is None) if target == 'deleted' else (status == target)
+                    if done:
+                        results[db_id] = db
+                        pending.remove(db_id)
+                        print(f"   ✅ {db_id}: {status or 'deleted'} "
+                              f"(경과 {format_seconds(now - started)})")
+                        continue
+
+                    state['phase_elapsed'] = now - state['since']
+                    eta = self._eta(status, state['phase_elapsed'])
+                    print(f"   ⏳ {db_id}: {status} (경과 {format_seconds(now - started)}, "
+                          f"예상 남은 시간 ~{format_seconds(eta)})")
+
+                if not pending:
+                    return results
+
+                if now - started >= self.timeout:
+                    raise TimeoutError(
+                        f"대기 시간 초과({format_seconds(self.timeout)}): {', '.join(pending)}"
+                    )
+
+                delay = min(self._next_delay(states[db_id]) for db_id in pending)
+                delay = min(delay, max(self.timeout - (now - started), 0) + 1)
+                self.sleep(delay)
+        finally:
+            self._save_history()
+
+
+def wait_for_available(rds, db_instance_ids, **kwargs):
+    """인스턴스들이 available 상태가 될 때까지 대기 (describe 결과 반환)"""
+    print(f"\n⏳ RDS 인스턴스가 사용 가능해질 때까지 대기 중...")
+    return RDSReadinessWaiter(rds, **kwargs).wait(db_instance_ids, target='available')
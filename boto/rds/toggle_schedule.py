@@ -1,32 +1,194 @@
 # toggle_schedule.py
-import boto3
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-def toggle_schedule(enable=True):
-    """스케줄 활성화/비활성화"""
-    events = boto3.client('events', region_name='ap-northeast-2')
-    
-    action = '활성화' if enable else '비활성화'
-    
-    for rule_name in ['RDSScheduler-Start-9AM', 'RDSScheduler-Stop-6PM']:
+import aws_client
+
+RULE_PREFIX = 'RDSScheduler-'
+# 설정된 리전 목록 (쉼표 구분), --region 으로 덮어쓸 수 있음
+DEFAULT_REGIONS = os.getenv('DAILYFEED_REGIONS', 'ap-northeast-2').split(',')
+MAX_WORKERS = 16
+
+# disable 로 멈춘 규칙 표시: enable 은 이 태그가 있는 규칙만 되돌린다
+# (배포 설정상 비활성인 규칙, 예: --idle-stop 이 아닐 때의 RDSScheduler-IdleStop 은 그대로 유지)
+PAUSED_TAG = 'SchedulerPausedBy'
+PAUSED_BY = 'toggle_schedule'
+
+def parse_tags(tag_args):
+    """['Key=Value', ...] → {'Key': 'Value'}"""
+    tags = {}
+    for tag in tag_args or []:
+        key, sep, value = tag.partition('=')
+        if not sep:
+            raise ValueError(f"태그 형식 오류(Key=Value): {tag}")
+        tags[key] = value
+    return tags
+
+def list_rules(events, prefix=RULE_PREFIX):
+    """리전 하나의 이름 접두사 일치 규칙 (페이지네이션된 list_rules)"""
+    rules = []
+    for page in events.get_paginator('list_rules').paginate(NamePrefix=prefix):
+        rules.extend(page['Rules'])
+    return rules
+
+def rule_tags(events, rule):
+    tags = events.list_tags_for_resource(ResourceARN=rule['Arn'])['Tags']
+    return {t['Key']: t['Value'] for t in tags}
+
+def discover_rules(pool, regions, prefix=RULE_PREFIX, tags=None, with_tags=False):
+    """
+    모든 리전의 스케줄러 규칙 → ({리전: events 클라이언트}, [(리전, 규칙, 태그)], [(리전, 오류 설명)])
+
+    리전마다 events 클라이언트를 하나 만들어 list_rules 를 동시에 실행하고,
+    태그가 필요하면 규칙별 태그 조회도 동시에 한다. 반환한 클라이언트는 상태 변경에 그대로 사용한다.
+    조회에 실패한 리전/규칙은 오류 목록에 남기고 건너뛰므로 나머지 규칙은 계속 처리한다.
+    """
+    clients = {region: aws_client.client('events', region_name=region) for region in regions}
+    rules, errors = [], []
+    futures = [(region, pool.submit(list_rules, clients[region], prefix)) for region in regions]
+    for region, future in futures:
         try:
-            if enable:
-                events.enable_rule(Name=rule_name)
+            found = future.result()
+        except Exception as e:
+            errors.append((region, f"규칙 조회 실패: {e}"))
+            continue
+        rules.extend((region, rule) for rule in found)
+
+    if not (tags or with_tags):
+        return clients, [(region, rule, {}) for region, rule in rules], errors
+
+    tag_futures = [pool.submit(rule_tags, clients[region], rule) for region, rule in rules]
+    discovered = []
+    for (region, rule), future in zip(rules, tag_futures):
+        try:
+            rule_tag_values = future.result()
+        except Exception as e:
+            errors.append((region, f"{rule['Name']} 태그 조회 실패: {e}"))
+            continue
+        if all(rule_tag_values.get(k) == v for k, v in (tags or {}).items()):
+            discovered.append((region, rule, rule_tag_values))
+    return clients, discovered, errors
+
+def desired_state(rule, tags, enable, restore_all=False):
+    """규칙의 목표 상태 (바꾸지 않으면 None)"""
+    if enable:
+        if rule['State'] == 'ENABLED':
+            return None
+        if restore_all or tags.get(PAUSED_TAG) == PAUSED_BY:
+            return 'ENABLED'
+        return None
+    return 'DISABLED' if rule['State'] == 'ENABLED' else None
+
+def set_rule_state(events, region, rule, state):
+    """
+    규칙 하나 활성화/비활성화 → (리전, 이름, 이전 상태, 결과 상태, ms, 오류, 태그 오류)
+
+    상태 변경과 일시정지 표시 태그 갱신은 따로 보고한다 (태그 오류만 있으면 상태는 바뀐 것).
+    """
+    start = time.monotonic()
+    error = tag_error = None
+    try:
+        if state == 'ENABLED':
+            events.enable_rule(Name=rule['Name'])
+        else:
+            events.disable_rule(Name=rule['Name'])
+    except Exception as e:
+        error = e
+    if error is None:
+        try:
+            if state == 'ENABLED':
+                events.untag_resource(ResourceARN=rule['Arn'], TagKeys=[PAUSED_TAG])
             else:
-                events.disable_rule(Name=rule_name)
-            print(f"✅ {rule_name} {action}")
+                events.tag_resource(ResourceARN=rule['Arn'], Tags=[{'Key': PAUSED_TAG, 'Value': PAUSED_BY}])
         except Exception as e:
-            print(f"❌ {rule_name} {action} 실패: {e}")
+            tag_error = e
+    elapsed = (time.monotonic() - start) * 1000
+    return region, rule['Name'], rule['State'], state, elapsed, error, tag_error
+
+def toggle_schedule(enable=True, regions=None, prefix=RULE_PREFIX, tags=None, dry_run=False, restore_all=False):
+    """
+    스케줄 활성화/비활성화
+
+    모든 리전의 규칙을 찾아 동시에 상태를 바꾸고 규칙별 결과/소요 시간을 출력한다.
+    disable 은 활성 규칙만 멈추고 표시 태그를 남기며, enable 은 표시된 규칙만 되돌린다
+    (restore_all=True 이면 찾은 규칙 전체 활성화).
+    반환: 상태 변경과 일시정지 표시 갱신이 모두 성공하면 True
+    """
+    regions = regions or DEFAULT_REGIONS
+    action = '활성화' if enable else '비활성화'
+    start = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        clients, discovered, errors = discover_rules(pool, regions, prefix, tags,
+                                            with_tags=enable and not restore_all)
+        changes = []
+        for region, rule, rule_tag_values in discovered:
+            state = desired_state(rule, rule_tag_values, enable, restore_all)
+            if state is not None:
+                changes.append((region, rule, state))
+
+        print(f"🔍 {', '.join(regions)}: 규칙 {len(discovered)}개, {action} 대상 {len(changes)}개")
+        if dry_run:
+            targets = {(region, rule['Name']) for region, rule, _ in changes}
+            for region, rule, rule_tag_values in discovered:
+                mark = '→ ' + action if (region, rule['Name']) in targets else '유지'
+                paused = ' (일시정지됨)' if rule_tag_values.get(PAUSED_TAG) == PAUSED_BY else ''
+                print(f"   {region:<16} {rule['Name']:<32} {rule['State']:<9}{paused} {mark}")
+            for region, error in errors:
+                print(f"❌ {region:<16} {error}")
+            return not errors
+
+        results = list(pool.map(
+            lambda change: set_rule_state(clients[change[0]], *change), changes
+        ))
+
+    for region, name, before, after, elapsed, error, tag_error in results:
+        if error:
+            print(f"❌ {region:<16} {name:<32} {action} 실패: {error}")
+        elif tag_error:
+            print(f"⚠️  {region:<16} {name:<32} {before} → {after} ({elapsed:.0f}ms), "
+                  f"상태 변경됨, 일시정지 표시 갱신 실패: {tag_error}")
+        else:
+            print(f"✅ {region:<16} {name:<32} {before} → {after} ({elapsed:.0f}ms)")
+    for region, error in errors:
+        print(f"❌ {region:<16} {error}")
+
+    completed = sum(1 for *_, error, _ in results if error is None)
+    untagged = sum(1 for *_, error, tag_error in results if error is None and tag_error)
+    failed = len(results) - completed + len(errors)
+    summary = f"{action} {completed}개 완료, 실패 {failed}개"
+    if untagged:
+        summary += f", 일시정지 표시 갱신 실패 {untagged}개"
+    print(f"\n⏱️  {summary} ({(time.monotonic() - start) * 1000:.0f}ms)")
+    return failed == 0 and not untagged
 
 if __name__ == '__main__':
-    import sys
-    
-    if len(sys.argv) > 1:
-        enable = sys.argv[1].lower() == 'enable'
-    else:
-        enable = False  # 기본값: 비활성화
-    
-    toggle_schedule(enable)
+    parser = argparse.ArgumentParser(description='RDS 스케줄러 규칙 일괄 활성화/비활성화')
+    parser.add_argument('action', nargs='?', choices=['enable', 'disable'], default='disable',
+                        help='기본값: disable')
+    parser.add_argument('--region', nargs='+', default=None,
+                        help=f"대상 리전 (기본: DAILYFEED_REGIONS 또는 {','.join(DEFAULT_REGIONS)})")
+    parser.add_argument('--prefix', default=RULE_PREFIX, help='규칙 이름 접두사')
+    parser.add_argument('--tag', action='append', help='규칙 태그 조건 Key=Value (여러 번 지정 가능)')
+    parser.add_argument('--all', action='store_true', help='enable 시 일시정지 표시가 없는 규칙도 활성화')
+    parser.add_argument('--dry-run', action='store_true', help='현재 상태와 변경 대상만 출력')
+    args = parser.parse_args()
+
+    try:
+        tags = parse_tags(args.tag)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    ok = toggle_schedule(args.action == 'enable', regions=args.region, prefix=args.prefix, tags=tags,
+                         dry_run=args.dry_run, restore_all=args.all)
+    sys.exit(0 if ok else 1)
 
 # 사용법:
-# python toggle_schedule.py disable  # 비활성화
-# python toggle_schedule.py enable   # 활성화
\ No newline at end of file
+# python toggle_schedule.py disable                                   # 비활성화 (모든 설정 리전)
+# python toggle_schedule.py enable                                    # disable 로 멈춘 규칙만 다시 활성화
+# python toggle_schedule.py disable --dry-run                         # 현재 상태와 변경 대상 출력
+# python toggle_schedule.py disable --region ap-northeast-2 us-west-2 --tag Environment=development
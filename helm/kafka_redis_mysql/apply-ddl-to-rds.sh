@@ -1,45 +1,57 @@
 #!/bin/bash
 
-# RDS 연결 정보
-RDS_HOST="dailyfeed-dev.c7muo0wa2dr1.ap-northeast-2.rds.amazonaws.com"
-RDS_USER="dailyfeed"
-RDS_PASSWORD="hitEnter###"
-RDS_DATABASE="dailyfeed"
-
-echo "📋 Applying DDL to RDS..."
-echo "   Host: ${RDS_HOST}"
-echo "   Database: ${RDS_DATABASE}"
+# RDS 에 스키마 마이그레이션 적용 (sql/migrations, sql/tools/schema-migrate.py)
+#
+# 접속 정보: init/jwt/config/<환경>.env (dev.env.example, prod.env.example 참고)
+#
+# 네트워크 요구 사항:
+#   예전처럼 클러스터 안의 임시 Pod 에서 실행하지 않고, 이 스크립트를 실행하는 머신에서
+#   schema-migrate.py 가 MYSQL_HOST:MYSQL_PORT 로 직접 연결합니다.
+#   RDS 는 private 엔드포인트이므로 VPC 안(배스천/VPN)에서 실행하거나, 로컬 포트로 터널을 연 뒤
+#   <환경>.env 의 MYSQL_HOST/MYSQL_PORT 를 터널 주소로 지정하세요. 예:
+#     ssh -N -L 13306:<RDS 엔드포인트>:3306 <배스천>   # MYSQL_HOST=127.0.0.1, MYSQL_PORT=13306
+# 이미 적용된 마이그레이션은 schema_migrations 테이블의 체크섬으로 확인하고 건너뜁니다.
+#
+# 예전 방식(ddl.sql, batch-schema.sql 을 통째로 실행)으로 스키마를 만든 DB 는
+# 처음 한 번 기준선을 기록해야 합니다:
+#   python3 ../../sql/tools/schema-migrate.py baseline --env dev
+#
+# 사용법:
+#   ./apply-ddl-to-rds.sh            # dev
+#   ./apply-ddl-to-rds.sh dev prod   # 여러 환경 동시 적용
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+MIGRATOR="${SCRIPT_DIR}/../../sql/tools/schema-migrate.py"
+CONFIG_DIR="${SCRIPT_DIR}/../../init/jwt/config"
+ENVIRONMENTS=("${@:-dev}")
+
+for env in "${ENVIRONMENTS[@]}"; do
+  if [ ! -f "${CONFIG_DIR}/${env}.env" ]; then
+    echo "❌ 접속 정보 파일이 없습니다: init/jwt/config/${env}.env"
+    echo "   ${env}.env.example 을 복사해 RDS 접속 정보(MYSQL_HOST, MYSQL_PORT, MYSQL_USERNAME, MYSQL_PASSWORD, MYSQL_SCHEMA)를 입력하세요."
+    exit 1
+  fi
+done
+
+echo "📋 Applying schema migrations to: ${ENVIRONMENTS[*]}"
 echo ""
 
-# MySQL 클라이언트 Pod를 임시로 생성하여 DDL 적용
-kubectl run mysql-client-temp --image=mysql:8.0 -n infra --rm -i --restart=Never -- bash -c "
-mysql -h ${RDS_HOST} -u ${RDS_USER} -p${RDS_PASSWORD} ${RDS_DATABASE} <<'EOFDDL'
-$(cat ddl.sql)
-EOFDDL
-"
-
-if [ $? -eq 0 ]; then
-  echo "✅ DDL applied successfully to RDS"
-else
-  echo "❌ Failed to apply DDL to RDS"
-  exit 1
+if ! python3 -c "import pymysql" &> /dev/null; then
+  echo "📦 Installing pymysql..."
+  pip install pymysql --quiet || {
+    echo "❌ Failed to install pymysql"
+    exit 1
+  }
 fi
 
-echo ""
-echo "📋 Applying Spring Batch schema to RDS..."
-
-kubectl run mysql-client-temp --image=mysql:8.0 -n infra --rm -i --restart=Never -- bash -c "
-mysql -h ${RDS_HOST} -u ${RDS_USER} -p${RDS_PASSWORD} ${RDS_DATABASE} <<'EOFBATCH'
-$(cat batch-schema.sql)
-EOFBATCH
-"
+python3 "${MIGRATOR}" migrate --env "${ENVIRONMENTS[@]}"
 
 if [ $? -eq 0 ]; then
-  echo "✅ Spring Batch schema applied successfully to RDS"
+  echo ""
+  echo "✅ All database schemas applied successfully!"
 else
-  echo "❌ Failed to apply Spring Batch schema to RDS"
+  echo ""
+  echo "❌ Failed to apply database schemas"
+  echo "   연결 오류라면 이 머신에서 RDS 엔드포인트에 직접 접근할 수 있는지 확인하세요 (스크립트 상단의 네트워크 요구 사항 참고)."
   exit 1
 fi
-
-echo ""
-echo "✅ All database schemas applied successfully!"
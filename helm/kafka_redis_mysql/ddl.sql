@@ -0,0 +1 @@
+../../sql/ddl.sql
\ No newline at end of file
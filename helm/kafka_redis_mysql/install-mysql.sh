@@ -29,14 +29,13 @@ if [ $? -eq 0 ]; then
   MYSQL_POD=$(kubectl get pod -n infra -l app=mysql -o jsonpath='{.items[0].metadata.name}')
 
   # 애플리케이션 DDL 적용
+  # ddl.sql 은 ../../sql/ddl.sql 심볼릭 링크: kubectl cp 는 링크를 그대로 복사하므로 stdin 으로 전달
   echo "  → Applying application DDL..."
-  kubectl cp ./ddl.sql infra/$MYSQL_POD:/tmp/ddl.sql
-  kubectl exec -n infra $MYSQL_POD -- mysql -udailyfeed -phitEnter### dailyfeed -e "source /tmp/ddl.sql"
+  kubectl exec -i -n infra $MYSQL_POD -- mysql -udailyfeed -phitEnter### dailyfeed < ./ddl.sql
 
   # Spring Batch 메타데이터 스키마 적용
   echo "  → Applying Spring Batch schema..."
-  kubectl cp ./batch-schema.sql infra/$MYSQL_POD:/tmp/batch-schema.sql
-  kubectl exec -n infra $MYSQL_POD -- mysql -udailyfeed -phitEnter### dailyfeed -e "source /tmp/batch-schema.sql"
+  kubectl exec -i -n infra $MYSQL_POD -- mysql -udailyfeed -phitEnter### dailyfeed < ./batch-schema.sql
 
   echo "✓ DDL, Spring Batch schema execution completed successfully!"
 else
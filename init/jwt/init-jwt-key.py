@@ -3,29 +3,52 @@
 JWT Key Initializer for DailyFeed
 Initializes a primary JWT key in the database before application startup
 to prevent race conditions in multi-replica Kubernetes deployments.
+
+Modes:
+    init   (default) create a primary key if none exists
+    rotate promote a new primary key once the current one is older than JWT_KEY_ROTATION_HOURS
+    prune  delete non-primary keys whose grace period has ended, in bounded chunks
+
+rotate and prune are meant to run periodically (e.g. as a Kubernetes CronJob)
+and exit non-zero on failure.
 """
 
 import sys
 import os
+import argparse
+import statistics
 import base64
 import secrets
 import hashlib
 from datetime import datetime, timedelta
 import pymysql
-from pymysql.cursors import DictCursor
 import time
 
-# Configuration from environment variables
-MYSQL_HOST = os.getenv('MYSQL_HOST', 'localhost')
-MYSQL_PORT = int(os.getenv('MYSQL_PORT', '23306'))
-MYSQL_USERNAME = os.getenv('MYSQL_USERNAME', 'dailyfeed')
-MYSQL_PASSWORD = os.getenv('MYSQL_PASSWORD', 'hitEnter###')
-MYSQL_DATABASE = os.getenv('MYSQL_SCHEMA', 'dailyfeed')
+# Connection settings and wait-for-database handling are shared with the other DB jobs
+from mysql_connection import (
+    MYSQL_HOST, MYSQL_PORT, MYSQL_DATABASE, connect_to_database
+)
 
 # JWT Key configuration (matching Java application settings)
 KEY_ROTATION_HOURS = int(os.getenv('JWT_KEY_ROTATION_HOURS', '24'))
 GRACE_PERIOD_HOURS = int(os.getenv('JWT_KEY_GRACE_PERIOD_HOURS', '48'))
 
+# Prune settings: rows deleted per statement and pause between chunks
+PRUNE_BATCH_SIZE = int(os.getenv('JWT_KEY_PRUNE_BATCH_SIZE', '500'))
+PRUNE_PAUSE_SECONDS = float(os.getenv('JWT_KEY_PRUNE_PAUSE_SECONDS', '0.05'))
+
+# Named lock serializing key creation across concurrently starting replicas
+LOCK_NAME = f"{MYSQL_DATABASE}.jwt_key_init"
+LOCK_TIMEOUT_SECONDS = int(os.getenv('JWT_KEY_LOCK_TIMEOUT_SECONDS', '30'))
+
+PRIMARY_KEY_QUERY = """
+    SELECT id, key_id, secret_key, is_primary, is_active, created_at, updated_at, expires_at
+    FROM jwt_keys
+    WHERE is_primary = TRUE AND is_active = TRUE
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
 def generate_secret_key():
     """Generate a cryptographically secure 256-bit key for HS256"""
     # Generate 32 bytes (256 bits) for HS256
@@ -40,64 +63,46 @@ def generate_key_id():
     random_suffix = hashlib.sha256(secrets.token_bytes(16)).hexdigest()[:8]
     return f"key-{timestamp}-{random_suffix}"
 
-def connect_to_database(max_retries=5, retry_delay=3):
-    """Connect to MySQL database with retry logic"""
-    for attempt in range(1, max_retries + 1):
-        try:
-            print(f"🔌 Connecting to MySQL at {MYSQL_HOST}:{MYSQL_PORT} (attempt {attempt}/{max_retries})...")
-            connection = pymysql.connect(
-                host=MYSQL_HOST,
-                port=MYSQL_PORT,
-                user=MYSQL_USERNAME,
-                password=MYSQL_PASSWORD,
-                database=MYSQL_DATABASE,
-                charset='utf8mb4',
-                cursorclass=DictCursor,
-                autocommit=False
-            )
-            print("✅ Connected to MySQL successfully")
-            return connection
-        except pymysql.Error as e:
-            print(f"⚠️  Connection attempt {attempt} failed: {e}")
-            if attempt < max_retries:
-                print(f"   Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-            else:
-                print(f"❌ Failed to connect after {max_retries} attempts")
-                raise
-
 def check_existing_primary_key(cursor):
     """Check if a primary key already exists"""
-    query = """
-        SELECT id, key_id, secret_key, is_primary, is_active, created_at, updated_at, expires_at
-        FROM jwt_keys
-        WHERE is_primary = TRUE AND is_active = TRUE
-        ORDER BY created_at DESC
-        LIMIT 1
-    """
-    cursor.execute(query)
+    cursor.execute(PRIMARY_KEY_QUERY)
     return cursor.fetchone()
 
-def deactivate_all_primary_keys(cursor):
-    """Deactivate all existing primary keys (safety measure)"""
-    query = """
-        UPDATE jwt_keys
-        SET is_primary = FALSE
-        WHERE is_primary = TRUE
+def acquire_init_lock(cursor):
     """
-    affected_rows = cursor.execute(query)
-    if affected_rows > 0:
-        print(f"   Deactivated {affected_rows} existing primary key(s)")
-    return affected_rows
+    Acquire the key-initialization named lock and re-check for a primary key.
+
+    Both statements travel in a single round trip. Replicas that lost the race
+    block in GET_LOCK until the winner has committed and released the lock,
+    so the re-check sees the winner's key. The lock is held by the session and
+    is released explicitly by the winner or implicitly when the connection closes.
+    """
+    cursor.execute(
+        "SELECT GET_LOCK(%s, %s) AS acquired;" + PRIMARY_KEY_QUERY,
+        (LOCK_NAME, LOCK_TIMEOUT_SECONDS)
+    )
+    acquired = cursor.fetchone()['acquired'] == 1
+    cursor.nextset()
+    existing = cursor.fetchone()
+    return acquired, existing
 
 def create_primary_key(cursor):
-    """Create a new primary JWT key"""
+    """
+    Create a new primary JWT key.
+
+    Deactivates any stale primary keys, inserts the new key, commits and releases
+    the init lock in a single round trip. Must be called while holding the lock.
+    """
     key_id = generate_key_id()
     secret_key = generate_secret_key()
     created_at = datetime.now()
     expires_at = created_at + timedelta(hours=KEY_ROTATION_HOURS + GRACE_PERIOD_HOURS)
 
     query = """
+        START TRANSACTION;
+        UPDATE jwt_keys
+        SET is_primary = FALSE
+        WHERE is_primary = TRUE;
         INSERT INTO jwt_keys (
             key_id,
             secret_key,
@@ -107,7 +112,9 @@ def create_primary_key(cursor):
             expires_at
         ) VALUES (
             %s, %s, %s, %s, %s, %s
-        )
+        );
+        COMMIT;
+        DO RELEASE_LOCK(%s);
     """
 
     cursor.execute(query, (
@@ -116,15 +123,31 @@ def create_primary_key(cursor):
         True,   # is_primary
         True,   # is_active
         created_at,
-        expires_at
+        expires_at,
+        LOCK_NAME
     ))
+    cursor.nextset()
+    deactivated = cursor.rowcount
+    while cursor.nextset():
+        pass
 
     return {
         'key_id': key_id,
         'created_at': created_at,
-        'expires_at': expires_at
+        'expires_at': expires_at,
+        'deactivated': deactivated
     }
 
+def print_existing_key(existing_key):
+    print(f"✅ Primary key already exists:")
+    print(f"   - Key ID: {existing_key['key_id']}")
+    print(f"   - Created: {existing_key['created_at']}")
+    print(f"   - Expires: {existing_key['expires_at']}")
+    print(f"   - Is Primary: {existing_key['is_primary']}")
+    print(f"   - Is Active: {existing_key['is_active']}")
+    print()
+    print("ℹ️  No action needed. Existing key will be used.")
+
 def initialize_jwt_key():
     """Main function to initialize JWT key"""
     print("🔑 JWT Key Initialization Starting...")
@@ -140,35 +163,34 @@ def initialize_jwt_key():
         connection = connect_to_database()
         cursor = connection.cursor()
 
-        # Check for existing primary key
+        # Fast path: a primary key already exists (one round trip)
         print("🔍 Checking for existing primary key...")
         existing_key = check_existing_primary_key(cursor)
 
         if existing_key:
-            print(f"✅ Primary key already exists:")
-            print(f"   - Key ID: {existing_key['key_id']}")
-            print(f"   - Created: {existing_key['created_at']}")
-            print(f"   - Expires: {existing_key['expires_at']}")
-            print(f"   - Is Primary: {existing_key['is_primary']}")
-            print(f"   - Is Active: {existing_key['is_active']}")
-            print()
-            print("ℹ️  No action needed. Existing key will be used.")
+            print_existing_key(existing_key)
             return 0
 
-        # No primary key exists - create new one
-        print("⚠️  No primary key found. Creating new one...")
-        print()
+        # Slow path: serialize creation across replicas with a named lock
+        print("⚠️  No primary key found. Acquiring initialization lock...")
+        acquired, existing_key = acquire_init_lock(cursor)
+
+        if existing_key:
+            # Another replica created the key while we waited for the lock
+            print_existing_key(existing_key)
+            return 0
+
+        if not acquired:
+            print(f"❌ Could not acquire lock '{LOCK_NAME}' within {LOCK_TIMEOUT_SECONDS}s")
+            return 1
 
-        # Safety: Deactivate any stale primary keys
-        print("🔧 Safety check: Deactivating any stale primary keys...")
-        deactivate_all_primary_keys(cursor)
+        print()
 
-        # Create new primary key
+        # Create new primary key (stale primary keys are deactivated in the same transaction)
         print("🔑 Generating new primary JWT key...")
         new_key = create_primary_key(cursor)
-
-        # Commit transaction
-        connection.commit()
+        if new_key['deactivated'] > 0:
+            print(f"   Deactivated {new_key['deactivated']} existing primary key(s)")
 
         print()
         print("✅ Primary JWT key created successfully!")
@@ -197,9 +219,156 @@ def initialize_jwt_key():
             connection.close()
             print("🔌 Database connection closed")
 
+def print_statement_latency(latencies):
+    """Print statement count and latency summary (latencies in seconds)"""
+    if not latencies:
+        return
+    millis = [latency * 1000 for latency in latencies]
+    print(f"   - Statements: {len(millis)}")
+    print(f"   - Latency: p50={statistics.median(millis):.1f}ms max={max(millis):.1f}ms "
+          f"total={sum(millis):.1f}ms")
+
+def release_init_lock(cursor):
+    cursor.execute("DO RELEASE_LOCK(%s)", (LOCK_NAME,))
+
+def run_with_connection(task):
+    """Connect, run task(cursor) and map errors to an exit code"""
+    connection = None
+    try:
+        connection = connect_to_database()
+        return task(connection.cursor())
+
+    except pymysql.Error as e:
+        print(f"❌ Database error: {e}")
+        return 1
+
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return 1
+
+    finally:
+        if connection:
+            connection.close()
+            print("🔌 Database connection closed")
+
+def rotate_primary_key(cursor):
+    """
+    Rotate the primary key if it is older than the rotation window.
+
+    The decision is made while holding the same named lock as initialization,
+    so concurrent rotations (or an init racing a rotation) promote exactly one
+    new key. The old primary stays active until its expires_at, which already
+    includes the grace period, so tokens it signed keep verifying.
+    """
+    latencies = []
+
+    started = time.perf_counter()
+    acquired, current_key = acquire_init_lock(cursor)
+    latencies.append(time.perf_counter() - started)
+
+    if not acquired:
+        print(f"❌ Could not acquire lock '{LOCK_NAME}' within {LOCK_TIMEOUT_SECONDS}s")
+        return 1
+
+    rotate_before = datetime.now() - timedelta(hours=KEY_ROTATION_HOURS)
+    if current_key and current_key['created_at'] and current_key['created_at'] > rotate_before:
+        started = time.perf_counter()
+        release_init_lock(cursor)
+        latencies.append(time.perf_counter() - started)
+        age = datetime.now() - current_key['created_at']
+        print(f"ℹ️  Primary key {current_key['key_id']} is {age.total_seconds() / 3600:.1f}h old "
+              f"(rotation at {KEY_ROTATION_HOURS}h). No rotation needed.")
+        print_statement_latency(latencies)
+        return 0
+
+    if current_key:
+        print(f"🔄 Rotating primary key {current_key['key_id']} (created {current_key['created_at']})...")
+    else:
+        print("⚠️  No primary key found. Creating one...")
+
+    # Demote + insert + commit + release lock in one round trip
+    started = time.perf_counter()
+    new_key = create_primary_key(cursor)
+    latencies.append(time.perf_counter() - started)
+
+    print()
+    print("✅ Primary JWT key rotated successfully!")
+    print(f"   - Key ID: {new_key['key_id']}")
+    print(f"   - Created: {new_key['created_at']}")
+    print(f"   - Expires: {new_key['expires_at']}")
+    print(f"   - Rows touched: {new_key['deactivated']} demoted, 1 inserted")
+    print_statement_latency(latencies)
+    return 0
+
+def prune_expired_keys(cursor, batch_size=None, pause=None):
+    """
+    Delete non-primary keys past their expiry (creation + rotation + grace period).
+
+    Deletes in primary-key order with a LIMIT so each statement touches a bounded
+    number of rows and holds its locks briefly; every chunk commits on its own.
+    """
+    batch_size = PRUNE_BATCH_SIZE if batch_size is None else batch_size
+    pause = PRUNE_PAUSE_SECONDS if pause is None else pause
+    cutoff = datetime.now()
+
+    print(f"🧹 Pruning keys expired before {cutoff:%Y-%m-%d %H:%M:%S} (chunks of {batch_size})...")
+    deleted = 0
+    latencies = []
+    while True:
+        started = time.perf_counter()
+        cursor.execute(
+            """
+            DELETE FROM jwt_keys
+            WHERE is_primary = FALSE AND expires_at < %s
+            ORDER BY id
+            LIMIT %s
+            """,
+            (cutoff, batch_size)
+        )
+        latencies.append(time.perf_counter() - started)
+        deleted += cursor.rowcount
+
+        if cursor.rowcount < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    print()
+    print("✅ Prune complete!")
+    print(f"   - Rows deleted: {deleted}")
+    print_statement_latency(latencies)
+    return 0
+
+def rotate_jwt_key():
+    """Rotate the primary JWT key when it is older than the rotation window"""
+    print("🔄 JWT Key Rotation Starting...")
+    print(f"   - Database: {MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}")
+    print(f"   - Key Rotation: {KEY_ROTATION_HOURS} hours")
+    print(f"   - Grace Period: {GRACE_PERIOD_HOURS} hours")
+    print()
+    return run_with_connection(rotate_primary_key)
+
+def prune_jwt_keys():
+    """Delete JWT keys whose grace period has ended"""
+    print("🧹 JWT Key Pruning Starting...")
+    print(f"   - Database: {MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}")
+    print()
+    return run_with_connection(prune_expired_keys)
+
+MODES = {
+    'init': initialize_jwt_key,
+    'rotate': rotate_jwt_key,
+    'prune': prune_jwt_keys,
+}
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='DailyFeed JWT key management')
+    parser.add_argument('mode', nargs='?', default='init', choices=sorted(MODES),
+                        help='init (default), rotate or prune')
+    args = parser.parse_args()
+
     try:
-        exit_code = initialize_jwt_key()
+        exit_code = MODES[args.mode]()
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n⚠️  Interrupted by user")
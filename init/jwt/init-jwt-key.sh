@@ -4,25 +4,34 @@
 # This ensures Python dependencies are installed and the script runs correctly using venv
 #
 # Usage:
-#   ./init-jwt-key.sh [environment]
+#   ./init-jwt-key.sh [environment] [mode] [options...]
+#
+#   mode: init (default), rotate, prune or retention
+#   retention runs member-email-retention.py; options are passed through to it
 #
 # Examples:
 #   ./init-jwt-key.sh          # Uses local.env (default)
 #   ./init-jwt-key.sh local    # Uses local.env
 #   ./init-jwt-key.sh dev      # Uses dev.env
 #   ./init-jwt-key.sh prod     # Uses prod.env
+#   ./init-jwt-key.sh dev rotate   # Rotates the primary key if it is due
+#   ./init-jwt-key.sh dev prune    # Deletes keys past their grace period
+#   ./init-jwt-key.sh dev retention --dry-run   # Counts stale member_emails rows
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PYTHON_SCRIPT="${SCRIPT_DIR}/init-jwt-key.py"
+RETENTION_SCRIPT="${SCRIPT_DIR}/member-email-retention.py"
 VENV_DIR="${SCRIPT_DIR}/.venv"
 REQUIREMENTS_FILE="${SCRIPT_DIR}/requirements.txt"
 CONFIG_DIR="${SCRIPT_DIR}/config"
 
 # Determine environment (default: local)
 ENVIRONMENT="${1:-local}"
+MODE="${2:-init}"
 
 echo "🔑 JWT Key Initialization Wrapper"
 echo "   Environment: ${ENVIRONMENT}"
+echo "   Mode: ${MODE}"
 echo ""
 
 # Load environment configuration
@@ -145,11 +154,30 @@ export MYSQL_PASSWORD="${MYSQL_PASSWORD:-hitEnter###}"
 export MYSQL_SCHEMA="${MYSQL_SCHEMA:-dailyfeed}"
 export JWT_KEY_ROTATION_HOURS="${JWT_KEY_ROTATION_HOURS:-24}"
 export JWT_KEY_GRACE_PERIOD_HOURS="${JWT_KEY_GRACE_PERIOD_HOURS:-48}"
+export MYSQL_WAIT_TIMEOUT_SECONDS="${MYSQL_WAIT_TIMEOUT_SECONDS:-120}"
+export MYSQL_CONNECT_TIMEOUT_SECONDS="${MYSQL_CONNECT_TIMEOUT_SECONDS:-5}"
+export MYSQL_RETRY_BASE_DELAY_SECONDS="${MYSQL_RETRY_BASE_DELAY_SECONDS:-0.5}"
+export MYSQL_RETRY_MAX_DELAY_SECONDS="${MYSQL_RETRY_MAX_DELAY_SECONDS:-10}"
+export JWT_KEY_PRUNE_BATCH_SIZE="${JWT_KEY_PRUNE_BATCH_SIZE:-500}"
+export JWT_KEY_PRUNE_PAUSE_SECONDS="${JWT_KEY_PRUNE_PAUSE_SECONDS:-0.05}"
+export MEMBER_EMAIL_RETENTION_DAYS="${MEMBER_EMAIL_RETENTION_DAYS:-30}"
+export MEMBER_EMAIL_RETENTION_BATCH_SIZE="${MEMBER_EMAIL_RETENTION_BATCH_SIZE:-1000}"
+export MEMBER_EMAIL_RETENTION_PAUSE_SECONDS="${MEMBER_EMAIL_RETENTION_PAUSE_SECONDS:-0.1}"
+export MEMBER_EMAIL_RETENTION_MAX_PAUSE_SECONDS="${MEMBER_EMAIL_RETENTION_MAX_PAUSE_SECONDS:-30}"
+export MEMBER_EMAIL_RETENTION_MAX_LAG_SECONDS="${MEMBER_EMAIL_RETENTION_MAX_LAG_SECONDS:-2}"
+export MEMBER_EMAIL_RETENTION_MAX_LOCK_WAITS="${MEMBER_EMAIL_RETENTION_MAX_LOCK_WAITS:-0}"
+export MYSQL_REPLICA_HOSTS="${MYSQL_REPLICA_HOSTS:-}"
 
 # Run the Python script
-echo "🚀 Running JWT key initialization..."
-echo ""
-python3 "${PYTHON_SCRIPT}"
+if [ "${MODE}" = "retention" ]; then
+    echo "🚀 Running member_emails retention..."
+    echo ""
+    python3 "${RETENTION_SCRIPT}" "${@:3}"
+else
+    echo "🚀 Running JWT key ${MODE}..."
+    echo ""
+    python3 "${PYTHON_SCRIPT}" "${MODE}"
+fi
 EXIT_CODE=$?
 
 # Deactivate virtual environment
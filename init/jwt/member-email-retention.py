@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Member Email Retention Job for DailyFeed
+Deletes stale member_emails rows that were never activated or verified.
+
+Walks idx_cleanup (is_active, created_at) with a keyset cursor, deletes each
+chunk by primary key and paces itself on replication lag and InnoDB lock
+waits, so no single statement holds locks long enough to stall login queries
+on idx_active_verified.
+
+Usage:
+    python3 member-email-retention.py [--days 30] [--batch-size 1000] [--dry-run]
+"""
+
+import sys
+import os
+import argparse
+import time
+from datetime import datetime, timedelta
+import pymysql
+from pymysql.cursors import DictCursor
+
+from mysql_connection import (
+    MYSQL_HOST, MYSQL_PORT, MYSQL_USERNAME, MYSQL_PASSWORD, MYSQL_DATABASE,
+    CONNECT_TIMEOUT_SECONDS, connect_to_database
+)
+
+# Retention configuration
+RETENTION_DAYS = int(os.getenv('MEMBER_EMAIL_RETENTION_DAYS', '30'))
+BATCH_SIZE = int(os.getenv('MEMBER_EMAIL_RETENTION_BATCH_SIZE', '1000'))
+MIN_BATCH_SIZE = 50
+
+# Pacing: sleep at least BASE_PAUSE between chunks, back off up to MAX_PAUSE
+# while replicas lag more than MAX_REPLICA_LAG or sessions wait on row locks
+BASE_PAUSE_SECONDS = float(os.getenv('MEMBER_EMAIL_RETENTION_PAUSE_SECONDS', '0.1'))
+MAX_PAUSE_SECONDS = float(os.getenv('MEMBER_EMAIL_RETENTION_MAX_PAUSE_SECONDS', '30'))
+MAX_REPLICA_LAG_SECONDS = float(os.getenv('MEMBER_EMAIL_RETENTION_MAX_LAG_SECONDS', '2'))
+MAX_LOCK_WAITS = int(os.getenv('MEMBER_EMAIL_RETENTION_MAX_LOCK_WAITS', '0'))
+
+# Comma-separated read replica hosts to watch for lag (same credentials as the primary)
+REPLICA_HOSTS = [h.strip() for h in os.getenv('MYSQL_REPLICA_HOSTS', '').split(',') if h.strip()]
+
+PROGRESS_EVERY_BATCHES = 10
+
+SELECT_CHUNK_QUERY = """
+    SELECT id, created_at
+    FROM member_emails FORCE INDEX (idx_cleanup)
+    WHERE is_active = FALSE
+      AND created_at < %s
+      AND (created_at > %s OR (created_at = %s AND id > %s))
+      AND verified = FALSE
+    ORDER BY is_active, created_at, id
+    LIMIT %s
+"""
+
+# Predicates are re-checked so a row verified after it was selected is kept
+DELETE_CHUNK_QUERY = """
+    DELETE FROM member_emails
+    WHERE id IN ({placeholders})
+      AND is_active = FALSE
+      AND verified = FALSE
+      AND created_at < %s
+"""
+
+LOCK_WAITS_QUERY = "SHOW GLOBAL STATUS LIKE 'Innodb_row_lock_current_waits'"
+
+
+def connect_to_replicas():
+    """Open one connection per replica host (replicas that cannot be reached are skipped)"""
+    replicas = []
+    for host in REPLICA_HOSTS:
+        try:
+            replicas.append(pymysql.connect(
+                host=host,
+                port=MYSQL_PORT,
+                user=MYSQL_USERNAME,
+                password=MYSQL_PASSWORD,
+                cursorclass=DictCursor,
+                connect_timeout=CONNECT_TIMEOUT_SECONDS,
+                autocommit=True
+            ))
+        except pymysql.Error as e:
+            print(f"⚠️  Replica {host} unavailable, lag will not be tracked: {e}")
+    return replicas
+
+
+def replica_lag(replicas):
+    """
+    Largest Seconds_Behind_Source across replicas (None if unknown)
+
+    A replica that cannot report its status (missing REPLICATION CLIENT privilege,
+    dropped connection, ...) is removed from the list and no longer tracked.
+    """
+    lags = []
+    for replica in list(replicas):
+        try:
+            with replica.cursor() as cursor:
+                try:
+                    cursor.execute("SHOW REPLICA STATUS")
+                except pymysql.err.ProgrammingError:
+                    # MySQL < 8.0.22
+                    cursor.execute("SHOW SLAVE STATUS")
+                status = cursor.fetchone() or {}
+        except pymysql.Error as e:
+            print(f"⚠️  Replica {replica.host} status unavailable, lag will not be tracked: {e}")
+            replicas.remove(replica)
+            try:
+                replica.close()
+            except pymysql.Error:
+                pass
+            continue
+        lag = status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+        if lag is not None:
+            lags.append(lag)
+    return max(lags) if lags else None
+
+
+def current_lock_waits(cursor):
+    cursor.execute(LOCK_WAITS_QUERY)
+    row = cursor.fetchone()
+    return int(row['Value']) if row else 0
+
+
+class Pacer:
+    """
+    Adaptive pause and chunk size between deletes.
+
+    Healthy feedback decays the pause towards BASE_PAUSE and grows the chunk
+    back to the configured size; replication lag or lock waits double the
+    pause and halve the chunk.
+    """
+
+    def __init__(self, batch_size, base_pause=BASE_PAUSE_SECONDS, max_pause=MAX_PAUSE_SECONDS):
+        self.max_batch_size = batch_size
+        self.batch_size = batch_size
+        self.base_pause = base_pause
+        self.max_pause = max_pause
+        self.pause = base_pause
+        self.backoffs = 0
+
+    def update(self, lag, lock_waits):
+        congested = (
+            (lag is not None and lag > MAX_REPLICA_LAG_SECONDS)
+            or lock_waits > MAX_LOCK_WAITS
+        )
+        if congested:
+            self.backoffs += 1
+            self.pause = min(self.max_pause, max(self.pause, self.base_pause) * 2)
+            self.batch_size = max(MIN_BATCH_SIZE, self.batch_size // 2)
+        else:
+            self.pause = max(self.base_pause, self.pause / 2)
+            self.batch_size = min(self.max_batch_size, self.batch_size + max(1, self.max_batch_size // 10))
+        return congested
+
+
+def run_retention(cursor, replicas, cutoff, batch_size, dry_run=False, max_rows=None):
+    """Walk idx_cleanup in chunks and delete stale rows; returns the run statistics"""
+    pacer = Pacer(batch_size)
+    last_created_at, last_id = datetime(1000, 1, 1), 0
+    stats = {'scanned': 0, 'deleted': 0, 'batches': 0, 'delete_seconds': 0.0, 'paused_seconds': 0.0}
+    start = time.monotonic()
+
+    while max_rows is None or stats['scanned'] < max_rows:
+        limit = pacer.batch_size if max_rows is None else min(pacer.batch_size, max_rows - stats['scanned'])
+        cursor.execute(SELECT_CHUNK_QUERY, (cutoff, last_created_at, last_created_at, last_id, limit))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        last_created_at, last_id = rows[-1]['created_at'], rows[-1]['id']
+        stats['scanned'] += len(rows)
+        stats['batches'] += 1
+
+        if not dry_run:
+            ids = [row['id'] for row in rows]
+            query = DELETE_CHUNK_QUERY.format(placeholders=', '.join(['%s'] * len(ids)))
+            statement_start = time.monotonic()
+            cursor.execute(query, ids + [cutoff])
+            stats['delete_seconds'] += time.monotonic() - statement_start
+            stats['deleted'] += cursor.rowcount
+
+        lag = replica_lag(replicas)
+        lock_waits = current_lock_waits(cursor)
+        if pacer.update(lag, lock_waits):
+            print(f"   ⏳ Backing off: lag={lag if lag is not None else '-'}s lock_waits={lock_waits} "
+                  f"→ pause {pacer.pause:.2f}s, chunk {pacer.batch_size}")
+
+        if stats['batches'] % PROGRESS_EVERY_BATCHES == 0:
+            elapsed = time.monotonic() - start
+            print(f"   📊 {stats['deleted']} deleted / {stats['scanned']} scanned "
+                  f"({stats['deleted'] / elapsed:.0f} rows/s), up to {last_created_at}")
+
+        if len(rows) < limit:
+            break
+        time.sleep(pacer.pause)
+        stats['paused_seconds'] += pacer.pause
+
+    stats['elapsed'] = time.monotonic() - start
+    stats['backoffs'] = pacer.backoffs
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Delete stale unverified rows from member_emails')
+    parser.add_argument('--days', type=int, default=RETENTION_DAYS,
+                        help=f'delete rows older than this many days (default: {RETENTION_DAYS})')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                        help=f'maximum rows per delete (default: {BATCH_SIZE})')
+    parser.add_argument('--max-rows', type=int, default=None,
+                        help='stop after scanning this many candidate rows')
+    parser.add_argument('--dry-run', action='store_true', help='only count candidate rows')
+    args = parser.parse_args()
+
+    cutoff = datetime.now() - timedelta(days=args.days)
+
+    print("🧹 Member Email Retention Starting...")
+    print(f"   Configuration:")
+    print(f"   - Database: {MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}")
+    print(f"   - Cutoff: inactive and unverified rows created before {cutoff:%Y-%m-%d %H:%M:%S}")
+    print(f"   - Batch size: {args.batch_size}")
+    print(f"   - Replicas watched: {', '.join(REPLICA_HOSTS) or 'none'}")
+    if args.dry_run:
+        print("   - Dry run: no rows will be deleted")
+    print()
+
+    connection = None
+    replicas = []
+    try:
+        connection = connect_to_database()
+        replicas = connect_to_replicas()
+        stats = run_retention(connection.cursor(), replicas, cutoff, args.batch_size,
+                              dry_run=args.dry_run, max_rows=args.max_rows)
+
+        elapsed = stats['elapsed']
+        print()
+        print("✅ Retention complete!")
+        print(f"   - Rows {'matched' if args.dry_run else 'deleted'}: "
+              f"{stats['scanned'] if args.dry_run else stats['deleted']} ({stats['batches']} batches)")
+        print(f"   - Throughput: {stats['deleted'] / elapsed if elapsed else 0:.0f} rows/s "
+              f"over {elapsed:.1f}s")
+        if stats['batches'] and not args.dry_run:
+            print(f"   - Avg delete: {stats['delete_seconds'] / stats['batches'] * 1000:.1f}ms per batch")
+        print(f"   - Paused: {stats['paused_seconds']:.1f}s ({stats['backoffs']} back-offs)")
+        return 0
+
+    except pymysql.Error as e:
+        print(f"❌ Database error: {e}")
+        return 1
+
+    finally:
+        for replica in replicas:
+            replica.close()
+        if connection:
+            connection.close()
+            print("🔌 Database connection closed")
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n⚠️  Interrupted by user")
+        sys.exit(130)
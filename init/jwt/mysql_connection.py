@@ -0,0 +1,111 @@
+"""
+Shared MySQL connection handling for the DailyFeed DB jobs.
+
+Reads the MYSQL_* settings from the environment (see config/*.env) and waits
+for the database to become reachable before connecting.
+"""
+
+import os
+import random
+import socket
+import time
+import pymysql
+from pymysql.constants import CLIENT
+from pymysql.cursors import DictCursor
+
+# Configuration from environment variables
+MYSQL_HOST = os.getenv('MYSQL_HOST', 'localhost')
+MYSQL_PORT = int(os.getenv('MYSQL_PORT', '23306'))
+MYSQL_USERNAME = os.getenv('MYSQL_USERNAME', 'dailyfeed')
+MYSQL_PASSWORD = os.getenv('MYSQL_PASSWORD', 'hitEnter###')
+MYSQL_DATABASE = os.getenv('MYSQL_SCHEMA', 'dailyfeed')
+
+# Wait-for-database settings: total deadline, per-attempt connect timeout and backoff bounds
+WAIT_TIMEOUT_SECONDS = float(os.getenv('MYSQL_WAIT_TIMEOUT_SECONDS', '120'))
+CONNECT_TIMEOUT_SECONDS = float(os.getenv('MYSQL_CONNECT_TIMEOUT_SECONDS', '5'))
+RETRY_BASE_DELAY_SECONDS = float(os.getenv('MYSQL_RETRY_BASE_DELAY_SECONDS', '0.5'))
+RETRY_MAX_DELAY_SECONDS = float(os.getenv('MYSQL_RETRY_MAX_DELAY_SECONDS', '10'))
+
+# Server errors that retrying cannot fix (access denied, unknown database)
+FATAL_CONNECT_ERRORS = {1044, 1045, 1049}
+
+def probe_tcp(timeout):
+    """Cheap reachability check: open and close a TCP connection without the MySQL handshake"""
+    try:
+        with socket.create_connection((MYSQL_HOST, MYSQL_PORT), timeout=timeout):
+            return None
+    except OSError as e:
+        return e
+
+def backoff_delay(attempt):
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** attempt))
+
+def connect_to_database(wait_timeout=None, connect_timeout=None):
+    """
+    Wait until MySQL accepts connections, then connect.
+
+    Each attempt first probes the port over TCP and only performs the full
+    pymysql handshake once the port is reachable. Failed attempts back off
+    exponentially with jitter until the total deadline (MYSQL_WAIT_TIMEOUT_SECONDS)
+    runs out.
+    """
+    wait_timeout = WAIT_TIMEOUT_SECONDS if wait_timeout is None else wait_timeout
+    connect_timeout = CONNECT_TIMEOUT_SECONDS if connect_timeout is None else connect_timeout
+
+    start = time.monotonic()
+    deadline = start + wait_timeout
+    tcp_ready_at = None
+    attempt = 0
+
+    print(f"🔌 Waiting for MySQL at {MYSQL_HOST}:{MYSQL_PORT} (deadline {wait_timeout:.0f}s)...")
+    while True:
+        attempt += 1
+        remaining = deadline - time.monotonic()
+        timeout = max(0.1, min(connect_timeout, remaining))
+
+        error = probe_tcp(timeout)
+        if error is None:
+            if tcp_ready_at is None:
+                tcp_ready_at = time.monotonic()
+                print(f"   ✅ Port reachable after {tcp_ready_at - start:.2f}s ({attempt} attempt(s))")
+            try:
+                handshake_start = time.monotonic()
+                connection = pymysql.connect(
+                    host=MYSQL_HOST,
+                    port=MYSQL_PORT,
+                    user=MYSQL_USERNAME,
+                    password=MYSQL_PASSWORD,
+                    database=MYSQL_DATABASE,
+                    charset='utf8mb4',
+                    cursorclass=DictCursor,
+                    connect_timeout=timeout,
+                    # autocommit so every read sees the latest committed rows;
+                    # writes use an explicit transaction inside one multi-statement packet
+                    autocommit=True,
+                    client_flag=CLIENT.MULTI_STATEMENTS
+                )
+                ready_at = time.monotonic()
+                print("✅ Connected to MySQL successfully")
+                print(f"⏱️  Time to ready: {ready_at - start:.2f}s "
+                      f"(tcp {tcp_ready_at - start:.2f}s, handshake {ready_at - handshake_start:.2f}s, "
+                      f"attempts {attempt})")
+                return connection
+            except pymysql.Error as e:
+                if e.args and e.args[0] in FATAL_CONNECT_ERRORS:
+                    print(f"❌ Connection rejected, not retrying: {e}")
+                    raise
+                error = e
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            print(f"❌ MySQL not ready after {time.monotonic() - start:.1f}s ({attempt} attempts): {error}")
+            if isinstance(error, pymysql.Error):
+                raise error
+            raise pymysql.err.OperationalError(
+                2003, f"Can't connect to MySQL server on {MYSQL_HOST}:{MYSQL_PORT} ({error})"
+            )
+        delay = min(backoff_delay(attempt), remaining)
+        print(f"⚠️  Attempt {attempt} failed: {error}")
+        print(f"   Retrying in {delay:.1f}s ({remaining:.0f}s left)...")
+        time.sleep(delay)
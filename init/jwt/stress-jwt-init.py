@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Concurrency stress test for JWT key initialization.
+
+Runs N initializers in parallel processes against a local MySQL, all released
+at the same instant (like an HPA scale-out starting many init containers), and
+reports the latency distribution, round trips per replica and the final number
+of active primary keys. Exits non-zero unless exactly one primary key exists.
+
+Usage:
+    python3 stress-jwt-init.py --replicas 32 --rounds 5 --reset
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+
+import pymysql
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LOCAL_HOSTS = {'localhost', '127.0.0.1', '::1'}
+
+
+def load_initializer():
+    """Load init-jwt-key.py as a module (the file name is not importable)"""
+    spec = importlib.util.spec_from_file_location(
+        'init_jwt_key', os.path.join(SCRIPT_DIR, 'init-jwt-key.py')
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_replica(barrier, results):
+    """One simulated init container: wait for the barrier, then initialize"""
+    initializer = load_initializer()
+
+    # Count client commands (each COM_QUERY is one round trip after the handshake)
+    commands = [0]
+    original = pymysql.connections.Connection._execute_command
+
+    def counting_execute_command(self, command, sql):
+        commands[0] += 1
+        return original(self, command, sql)
+
+    pymysql.connections.Connection._execute_command = counting_execute_command
+
+    barrier.wait()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        exit_code = initializer.initialize_jwt_key()
+    elapsed = time.perf_counter() - start
+
+    results.put({
+        'exit_code': exit_code,
+        'elapsed': elapsed,
+        'round_trips': commands[0],
+        'created': 'created successfully' in output.getvalue(),
+    })
+
+
+def count_primary_keys(initializer):
+    connection = initializer.connect_to_database()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*) AS count FROM jwt_keys WHERE is_primary = TRUE AND is_active = TRUE"
+            )
+            return cursor.fetchone()['count']
+    finally:
+        connection.close()
+
+
+def reset_keys(initializer):
+    connection = initializer.connect_to_database()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM jwt_keys")
+    finally:
+        connection.close()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_round(replicas):
+    barrier = multiprocessing.Barrier(replicas)
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=run_replica, args=(barrier, results))
+        for _ in range(replicas)
+    ]
+    for process in processes:
+        process.start()
+    collected = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return collected
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JWT key initialization concurrency stress test')
+    parser.add_argument('--replicas', type=int, default=16, help='parallel initializers per round')
+    parser.add_argument('--rounds', type=int, default=3, help='number of rounds')
+    parser.add_argument('--reset', action='store_true',
+                        help='delete all rows from jwt_keys before each round (local MySQL only)')
+    parser.add_argument('--allow-remote', action='store_true',
+                        help='allow --reset against a non-local MYSQL_HOST')
+    args = parser.parse_args()
+
+    initializer = load_initializer()
+    if args.reset and initializer.MYSQL_HOST not in LOCAL_HOSTS and not args.allow_remote:
+        print(f"❌ Refusing to reset jwt_keys on non-local host {initializer.MYSQL_HOST}")
+        return 2
+
+    print("🧪 JWT Key Initialization Stress Test")
+    print(f"   Database: {initializer.MYSQL_HOST}:{initializer.MYSQL_PORT}/{initializer.MYSQL_DATABASE}")
+    print(f"   Replicas: {args.replicas} x {args.rounds} round(s)")
+    print()
+
+    all_results = []
+    failed_rounds = 0
+    for round_number in range(1, args.rounds + 1):
+        with contextlib.redirect_stdout(io.StringIO()):
+            if args.reset:
+                reset_keys(initializer)
+            results = run_round(args.replicas)
+            primary_keys = count_primary_keys(initializer)
+        all_results.extend(results)
+
+        created = sum(1 for r in results if r['created'])
+        errors = sum(1 for r in results if r['exit_code'] != 0)
+        ok = primary_keys == 1 and errors == 0 and (created <= 1)
+        failed_rounds += 0 if ok else 1
+        print(f"{'✅' if ok else '❌'} Round {round_number}: "
+              f"created={created} errors={errors} primary_keys={primary_keys} "
+              f"p50={statistics.median(r['elapsed'] for r in results) * 1000:.1f}ms")
+
+    latencies = [r['elapsed'] * 1000 for r in all_results]
+    trips = [r['round_trips'] for r in all_results]
+    print()
+    print("📊 Latency (ms):")
+    print(f"   min={min(latencies):.1f} p50={percentile(latencies, 50):.1f} "
+          f"p90={percentile(latencies, 90):.1f} p99={percentile(latencies, 99):.1f} "
+          f"max={max(latencies):.1f}")
+    print("📊 Round trips per replica (after handshake):")
+    for count in sorted(set(trips)):
+        print(f"   {count}: {trips.count(count)} replica(s)")
+    print()
+
+    if failed_rounds:
+        print(f"❌ {failed_rounds} round(s) did not end with exactly one primary key")
+        return 1
+    print("🎉 Exactly one primary key in every round")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
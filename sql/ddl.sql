@@ -1,3 +1,4 @@
+-- V001 기준 스냅숏 (로컬/helm 초기 설치용): 직접 수정하지 말고 sql/migrations 에 새 V<번호>__*.sql 로 추가
 -- members
 create table if not exists dailyfeed.members
 (
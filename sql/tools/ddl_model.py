@@ -0,0 +1,322 @@
+# ddl_model.py
+"""
+DDL 파서
+
+sql/ddl.sql 같은 CREATE TABLE 파일(및 ALTER/CREATE INDEX 마이그레이션)을 테이블/컬럼/인덱스 모델로 읽는다.
+인덱스 분석기, 스키마 드리프트 검사기 등 sql/tools 의 도구들이 함께 사용한다.
+"""
+import os
+import re
+
+SQL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DDL_PATH = os.path.join(SQL_DIR, 'ddl.sql')
+
+CREATE_TABLE = re.compile(
+    r'create\s+table\s+(?:if\s+not\s+exists\s+)?(?:`?(\w+)`?\.)?`?(\w+)`?\s*\(',
+    re.IGNORECASE
+)
+ALTER_TABLE = re.compile(r'alter\s+table\s+(?:`?\w+`?\.)?`?(\w+)`?\s+(.*)', re.IGNORECASE | re.DOTALL)
+CREATE_INDEX = re.compile(
+    r'create\s+(unique\s+)?index\s+`?(\w+)`?\s+on\s+(?:`?\w+`?\.)?`?(\w+)`?\s*(\(.*\))',
+    re.IGNORECASE | re.DOTALL
+)
+DROP_INDEX = re.compile(r'drop\s+index\s+`?(\w+)`?\s+on\s+(?:`?\w+`?\.)?`?(\w+)`?', re.IGNORECASE)
+DROP_TABLE = re.compile(r'drop\s+table\s+(?:if\s+exists\s+)?(?:`?\w+`?\.)?`?(\w+)`?', re.IGNORECASE)
+INTEGER_TYPES = ('tinyint', 'smallint', 'mediumint', 'int', 'bigint')
+
+
+class Column:
+    def __init__(self, name, column_type, nullable=True, default=None,
+                 auto_increment=False, on_update=None):
+        self.name = name
+        self.column_type = column_type
+        self.nullable = nullable
+        self.default = default
+        self.auto_increment = auto_increment
+        self.on_update = on_update
+
+    def __repr__(self):
+        return f"Column({self.name} {self.column_type}{'' if self.nullable else ' not null'})"
+
+
+class Index:
+    def __init__(self, name, columns, unique=False, primary=False):
+        self.name = name
+        self.columns = tuple(columns)
+        self.unique = unique or primary
+        self.primary = primary
+
+    @property
+    def kind(self):
+        if self.primary:
+            return 'primary'
+        return 'unique' if self.unique else 'index'
+
+    def __repr__(self):
+        return f"Index({self.name} {self.kind} ({', '.join(self.columns)}))"
+
+
+class Table:
+    def __init__(self, name, schema=None, sql=''):
+        self.name = name
+        self.schema = schema
+        self.sql = sql
+        self.columns = {}
+        self.indexes = {}
+        self.foreign_keys = []
+
+    @property
+    def primary_key(self):
+        return self.indexes.get('PRIMARY')
+
+    def add_index(self, name, columns, unique=False, primary=False):
+        """인덱스 추가 (이름이 없으면 MySQL 규칙대로 첫 컬럼 이름, 중복 시 _2, _3 ...)"""
+        if primary:
+            name = 'PRIMARY'
+        elif not name:
+            base = columns[0]
+            name = base
+            suffix = 2
+            while name in self.indexes:
+                name = f"{base}_{suffix}"
+                suffix += 1
+        self.indexes[name] = Index(name, columns, unique=unique, primary=primary)
+
+    def create_sql(self, schema=None):
+        """스키마를 바꿔 쓴 CREATE TABLE 문"""
+        target = f"`{schema}`.`{self.name}`" if schema else f"`{self.name}`"
+        return CREATE_TABLE.sub(f"create table if not exists {target} (", self.sql, count=1)
+
+    def __repr__(self):
+        return f"Table({self.name}, {len(self.columns)} columns, {len(self.indexes)} indexes)"
+
+
+def strip_comments(sql):
+    """-- 주석과 /* */ 주석 제거 (문자열 리터럴 안의 -- 는 유지)"""
+    sql = re.sub(r'/\*.*?\*/', ' ', sql, flags=re.DOTALL)
+    lines = []
+    for line in sql.splitlines():
+        in_quote = None
+        for i, ch in enumerate(line):
+            if in_quote:
+                if ch == in_quote:
+                    in_quote = None
+            elif ch in ("'", '"'):
+                in_quote = ch
+            elif line.startswith('--', i):
+                line = line[:i]
+                break
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def split_top_level(body, separator=','):
+    """괄호/따옴표 밖의 구분자로만 분리"""
+    parts, depth, in_quote, current = [], 0, None, []
+    for ch in body:
+        if in_quote:
+            if ch == in_quote:
+                in_quote = None
+        elif ch in ("'", '"', '`'):
+            in_quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == separator and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    if ''.join(current).strip():
+        parts.append(''.join(current).strip())
+    return parts
+
+
+def normalize_type(column_type):
+    """
+    information_schema.COLUMNS.COLUMN_TYPE 과 비교할 수 있는 형태로 정규화
+
+    boolean → tinyint(1), 정수형 표시 폭 제거(MySQL 8.0.19+, tinyint(1) 제외)
+    """
+    column_type = re.sub(r'\s+', ' ', column_type.strip().lower())
+    column_type = re.sub(r'\s*\(\s*', '(', column_type)
+    column_type = re.sub(r'\s*\)', ')', column_type)
+    column_type = re.sub(r'\s*,\s*', ',', column_type)
+    if column_type in ('boolean', 'bool'):
+        return 'tinyint(1)'
+    match = re.match(r'(\w+)(?:\((\d+)\))?(.*)', column_type)
+    base, width, rest = match.groups()
+    if base == 'integer':
+        base = 'int'
+    if base in INTEGER_TYPES and not (base == 'tinyint' and width == '1'):
+        return f"{base}{rest}"
+    return column_type
+
+
+def _index_columns(spec):
+    """'(a, b(10) desc)' → ['a', 'b']"""
+    inner = spec[spec.index('(') + 1:spec.rindex(')')]
+    return [re.match(r'`?(\w+)`?', part.strip()).group(1) for part in split_top_level(inner)]
+
+
+def _parse_column(table, item):
+    match = re.match(r'`?(\w+)`?\s+(\w+(?:\s*\([^)]*\))?(?:\s+unsigned)?(?:\s+zerofill)?)(.*)',
+                     item, re.IGNORECASE | re.DOTALL)
+    name, column_type, attributes = match.groups()
+    attrs = attributes.lower()
+    default = re.search(r"default\s+('(?:[^']*)'|\S+)", attributes, re.IGNORECASE)
+    on_update = re.search(r'on\s+update\s+(\S+)', attrs)
+    table.columns[name] = Column(
+        name,
+        normalize_type(column_type),
+        nullable=not re.search(r'\bnot\s+null\b', attrs) and 'primary key' not in attrs,
+        default=default.group(1).strip("'") if default else None,
+        auto_increment='auto_increment' in attrs,
+        on_update=on_update.group(1) if on_update else None,
+    )
+    if re.search(r'\bprimary\s+key\b', attrs):
+        table.add_index(None, [name], primary=True)
+    elif re.search(r'\bunique\b', attrs):
+        table.add_index(None, [name], unique=True)
+
+
+def _parse_definition(table, item):
+    constraint = re.match(r'constraint\s+`?(\w+)`?\s+', item, re.IGNORECASE)
+    constraint_name = constraint.group(1) if constraint else None
+    definition = item[constraint.end():] if constraint else item
+
+    match = re.match(r'primary\s+key\s*(\(.*\))', definition, re.IGNORECASE)
+    if match:
+        table.add_index(None, _index_columns(match.group(1)), primary=True)
+        return
+    match = re.match(r'unique(?:\s+(?:key|index))?\s*`?(\w+)?`?\s*(\(.*\))', definition, re.IGNORECASE)
+    if match:
+        # CONSTRAINT 이름이 있으면 MySQL 은 그 이름을 인덱스 이름으로 쓴다
+        table.add_index(match.group(1) or constraint_name, _index_columns(match.group(2)), unique=True)
+        return
+    match = re.match(r'(?:key|index)\s*`?(\w+)?`?\s*(\(.*\))', definition, re.IGNORECASE)
+    if match:
+        table.add_index(match.group(1), _index_columns(match.group(2)))
+        return
+    match = re.match(r'foreign\s+key\s*`?(\w+)?`?\s*(\([^)]*\))', definition, re.IGNORECASE)
+    if match:
+        table.foreign_keys.append((constraint_name or match.group(1), tuple(_index_columns(match.group(2)))))
+        return
+    if constraint or definition.lower().startswith(('check', 'fulltext', 'spatial')):
+        return
+    _parse_column(table, item)
+
+
+def _add_foreign_key_indexes(table):
+    """외래 키 컬럼으로 시작하는 인덱스가 없으면 MySQL 이 제약 조건 이름으로 만드는 인덱스 추가"""
+    for name, columns in table.foreign_keys:
+        if not any(index.columns[:len(columns)] == columns for index in table.indexes.values()):
+            table.add_index(name, columns)
+
+
+def _apply_alter(table, clauses):
+    """ALTER TABLE 의 ADD/DROP/MODIFY/CHANGE 절 반영"""
+    for clause in split_top_level(clauses):
+        match = re.match(r'add\s+(?:column\s+)?(.*)', clause, re.IGNORECASE | re.DOTALL)
+        if match:
+            _parse_definition(table, match.group(1))
+            continue
+        match = re.match(r'drop\s+primary\s+key', clause, re.IGNORECASE)
+        if match:
+            table.indexes.pop('PRIMARY', None)
+            continue
+        match = re.match(r'drop\s+(?:index|key)\s+`?(\w+)`?', clause, re.IGNORECASE)
+        if match:
+            table.indexes.pop(match.group(1), None)
+            continue
+        match = re.match(r'drop\s+(?:column\s+)?`?(\w+)`?', clause, re.IGNORECASE)
+        if match:
+            table.columns.pop(match.group(1), None)
+            continue
+        match = re.match(r'modify\s+(?:column\s+)?(.*)', clause, re.IGNORECASE | re.DOTALL)
+        if match:
+            _parse_column(table, match.group(1))
+            continue
+        match = re.match(r'change\s+(?:column\s+)?`?(\w+)`?\s+(.*)', clause, re.IGNORECASE | re.DOTALL)
+        if match:
+            table.columns.pop(match.group(1), None)
+            _parse_column(table, match.group(2))
+    _add_foreign_key_indexes(table)
+
+
+def parse_ddl(sql, tables=None):
+    """
+    DDL 문자열 → {테이블 이름: Table} (선언 순서 유지)
+
+    CREATE TABLE 외에 ALTER TABLE, CREATE/DROP INDEX, DROP TABLE 도 순서대로 반영한다.
+    tables 를 넘기면 그 모델 위에 적용하므로 마이그레이션 파일을 차례로 넘겨 최종 스키마를 만들 수 있다.
+    """
+    tables = {} if tables is None else tables
+    cleaned = strip_comments(sql)
+    for statement in split_top_level(cleaned, ';'):
+        statement = statement.strip()
+        match = CREATE_TABLE.match(statement)
+        if match:
+            schema, name = match.groups()
+            body = statement[match.end():statement.rindex(')')]
+            table = Table(name, schema=schema, sql=statement)
+            for item in split_top_level(body):
+                if item:
+                    _parse_definition(table, item)
+            _add_foreign_key_indexes(table)
+            tables[name] = table
+            continue
+        match = ALTER_TABLE.match(statement)
+        if match and match.group(1) in tables:
+            _apply_alter(tables[match.group(1)], match.group(2))
+            continue
+        match = CREATE_INDEX.match(statement)
+        if match and match.group(3) in tables:
+            unique, index_name, table_name, columns = match.groups()
+            tables[table_name].add_index(index_name, _index_columns(columns), unique=bool(unique))
+            continue
+        match = DROP_INDEX.match(statement)
+        if match and match.group(2) in tables:
+            tables[match.group(2)].indexes.pop(match.group(1), None)
+            continue
+        match = DROP_TABLE.match(statement)
+        if match:
+            tables.pop(match.group(1), None)
+    return tables
+
+
+def load_ddl(*paths):
+    """DDL 파일들을 순서대로 적용해 하나의 모델로 합친다 (마이그레이션 파일 순서 그대로 넘기면 된다)"""
+    tables = {}
+    for path in paths or (DEFAULT_DDL_PATH,):
+        with open(path, encoding='utf-8') as f:
+            parse_ddl(f.read(), tables)
+    return tables
+
+
+def redundant_indexes(table):
+    """
+    중복/불필요 인덱스 목록: [(인덱스, 대신 사용할 인덱스, 사유)]
+
+    - 같은 컬럼 구성의 인덱스가 둘 이상이면 하나만 남긴다 (unique/primary 우선)
+    - 일반 인덱스의 컬럼이 다른 인덱스의 왼쪽 접두사이면 불필요하다
+    """
+    findings = []
+    indexes = sorted(table.indexes.values(), key=lambda i: (not i.primary, not i.unique))
+    for index in indexes:
+        if index.primary:
+            continue
+        for other in indexes:
+            if other is index or other in (f[0] for f in findings):
+                continue
+            if other.columns == index.columns and (other.unique or not index.unique):
+                if indexes.index(other) < indexes.index(index) or other.unique != index.unique:
+                    findings.append((index, other, 'duplicate'))
+                    break
+            elif (not index.unique
+                  and len(other.columns) > len(index.columns)
+                  and other.columns[:len(index.columns)] == index.columns):
+                findings.append((index, other, 'left-prefix'))
+                break
+    return findings
@@ -0,0 +1,94 @@
+# generate_dataset.py
+"""
+dailyfeed 합성 데이터 생성기
+
+scale factor 로 행 수를 정하고 테이블별 작업 프로세스에서 병렬로 적재한다.
+기본 대상은 docker/mysql 의 로컬 MySQL 이다.
+
+사용법:
+    python3 generate-dataset.py --scale 1 --create --truncate
+    python3 generate-dataset.py --scale 10 --method load-data --tables posts comments
+"""
+import argparse
+import sys
+import time
+
+import pymysql
+
+import ddl_model
+import local_mysql
+import synthetic_data
+
+
+def create_schema(database, tables):
+    connection = local_mysql.connect()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{database}`")
+            for table in tables.values():
+                cursor.execute(table.create_sql(database))
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='dailyfeed 합성 데이터 생성기')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='scale factor (1 = 회원 1만, 게시글 5만, 댓글 20만)')
+    parser.add_argument('--database', default='dailyfeed', help='대상 스키마')
+    parser.add_argument('--tables', nargs='+', choices=sorted(synthetic_data.TABLES),
+                        help='적재할 테이블 (기본: 전체)')
+    parser.add_argument('--method', choices=['insert', 'load-data'], default='insert',
+                        help='다중 행 INSERT 또는 LOAD DATA LOCAL INFILE')
+    parser.add_argument('--workers', type=int, default=None, help='병렬 작업 프로세스 수')
+    parser.add_argument('--batch-size', type=int, default=synthetic_data.DEFAULT_BATCH_SIZE,
+                        help='INSERT 한 번에 보낼 행 수')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드 (같은 시드 → 같은 데이터)')
+    parser.add_argument('--create', action='store_true', help='ddl.sql 로 스키마/테이블 생성')
+    parser.add_argument('--truncate', action='store_true', help='적재 전에 대상 테이블 비우기')
+    parser.add_argument('--allow-remote', action='store_true', help='로컬이 아닌 MySQL 허용')
+    args = parser.parse_args()
+
+    if not local_mysql.is_local() and not args.allow_remote:
+        print(f"❌ 로컬 MySQL 이 아닙니다: {local_mysql.MYSQL_HOST} (--allow-remote 로 허용)")
+        return 2
+
+    tables = ddl_model.load_ddl()
+    problems = synthetic_data.check_columns(tables)
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        return 1
+
+    spec = synthetic_data.DatasetSpec(scale=args.scale, seed=args.seed)
+    targets = args.tables or list(synthetic_data.TABLES)
+
+    print("🧪 합성 데이터 생성")
+    print(f"   대상: {local_mysql.MYSQL_HOST}:{local_mysql.MYSQL_PORT}/{args.database}")
+    print(f"   scale: {args.scale}, 방식: {args.method}, seed: {args.seed}")
+    for table in targets:
+        print(f"   - {table}: 약 {spec.counts[table]:,}행")
+
+    start = time.monotonic()
+    try:
+        if args.create:
+            create_schema(args.database, tables)
+        print("\n⏳ 적재 중...")
+        results = synthetic_data.load_dataset(
+            spec, args.database, targets, method=args.method, workers=args.workers,
+            batch_size=args.batch_size, truncate=args.truncate
+        )
+    except pymysql.Error as e:
+        print(f"❌ MySQL 오류: {e}")
+        return 1
+    elapsed = time.monotonic() - start
+
+    total = sum(count for _, count, _ in results)
+    print("\n" + "="*60)
+    print(f"📊 총 {total:,}행, {elapsed:.1f}s ({total / elapsed if elapsed else 0:,.0f} rows/s)")
+    print("="*60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,406 @@
+# index_advisor.py
+"""
+DDL 기반 인덱스 분석기
+
+저장소 스키마(sql/migrations 를 버전 순서대로 적용한 결과)와 대표 쿼리 파일(queries.sql)을 읽어
+  1. DDL만으로 중복/불필요 인덱스를 찾고
+  2. 로컬 MySQL 의 임시 스키마에 DDL 을 적용하고 합성 데이터를 채운 뒤
+  3. 쿼리별 EXPLAIN 으로 풀 스캔/filesort 를 찾아 복합 인덱스를 제안하고
+  4. 제안 인덱스 적용 전/후 실행 시간을 비교한다.
+
+사용법:
+    python3 index-advisor.py --static              # DB 없이 DDL 분석만
+    python3 index-advisor.py --scale 0.5           # 로컬 MySQL(docker/mysql)에서 전/후 비교
+"""
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+import pymysql
+
+import ddl_model
+import local_mysql
+import schema_migrator
+import synthetic_data
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_QUERIES_PATH = os.path.join(TOOLS_DIR, 'queries.sql')
+SCRATCH_SCHEMA = 'dailyfeed_index_advisor'
+
+MAX_INDEX_COLUMNS = 4
+
+SQL_KEYWORDS = {'where', 'join', 'on', 'inner', 'left', 'right', 'cross', 'order', 'group',
+                'limit', 'having', 'straight_join', 'using', 'union'}
+
+
+def load_queries(path):
+    """'-- name: xxx' 주석으로 구분된 쿼리 파일 → [(이름, SQL)]"""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    queries = []
+    for block in re.split(r'^--\s*name:\s*', text, flags=re.MULTILINE)[1:]:
+        name, _, body = block.partition('\n')
+        sql = ddl_model.strip_comments(body).strip().rstrip(';').strip()
+        if sql:
+            queries.append((name.strip(), sql))
+    return queries
+
+
+# ---------------------------------------------------------------------------
+# 쿼리 분석 (인덱스 제안용 휴리스틱)
+# ---------------------------------------------------------------------------
+
+def table_aliases(sql, tables):
+    """FROM/JOIN 절의 별칭 → 테이블"""
+    aliases = {}
+    for match in re.finditer(r'\b(?:from|join)\s+`?(?:\w+\.)?(\w+)`?(?:\s+(?:as\s+)?(\w+))?',
+                             sql, re.IGNORECASE):
+        table, alias = match.groups()
+        if table not in tables:
+            continue
+        aliases[table] = table
+        if alias and alias.lower() not in SQL_KEYWORDS:
+            aliases[alias] = table
+    return aliases
+
+
+def _resolve(qualifier, column, aliases, tables):
+    if qualifier:
+        table = aliases.get(qualifier)
+        return table if table and column in tables[table].columns else None
+    candidates = {t for t in aliases.values() if column in tables[t].columns}
+    return candidates.pop() if len(candidates) == 1 else None
+
+
+def column_usage(sql, tables):
+    """테이블별 {'eq': [...], 'range': [...], 'order': [...]} 컬럼 사용 정보"""
+    aliases = table_aliases(sql, tables)
+    usage = {table: {'eq': [], 'range': [], 'order': []} for table in set(aliases.values())}
+
+    def add(kind, qualifier, column):
+        table = _resolve(qualifier, column, aliases, tables)
+        if table and column not in usage[table][kind]:
+            usage[table][kind].append(column)
+
+    from_match = re.search(r'\bfrom\b', sql, re.IGNORECASE)
+    order_match = re.search(r'\border\s+by\b', sql, re.IGNORECASE)
+    conditions = sql[from_match.start() if from_match else 0:order_match.start() if order_match else len(sql)]
+
+    # a.x = b.y (조인 조건은 양쪽 모두 등치 조건)
+    for q1, c1, q2, c2 in re.findall(r'(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)', conditions):
+        add('eq', q1, c1)
+        add('eq', q2, c2)
+    for qualifier, column in re.findall(
+            r'(?:(\w+)\.)?(\w+)\s*(?:=|<=>|\bin\s*\(|\bis\s+(?:not\s+)?null\b)', conditions, re.IGNORECASE):
+        add('eq', qualifier, column)
+    for qualifier, column in re.findall(
+            r'(?:(\w+)\.)?(\w+)\s*(?:<(?!=>)|>|\bbetween\b|\blike\b)', conditions, re.IGNORECASE):
+        add('range', qualifier, column)
+
+    if order_match:
+        order_clause = re.split(r'\blimit\b', sql[order_match.end():], flags=re.IGNORECASE)[0]
+        for part in order_clause.split(','):
+            match = re.match(r'\s*(?:(\w+)\.)?(\w+)', part)
+            if match:
+                add('order', *match.groups())
+    return usage
+
+
+def suggest_index(table, usage):
+    """
+    등치 컬럼 → (정렬 컬럼 | 첫 범위 컬럼) 순서의 복합 인덱스 제안
+
+    (등치 컬럼, 뒤쪽 컬럼) 튜플을 반환하고, 기존 인덱스로 충분하면 None.
+    """
+    equality = list(usage['eq'])
+    tail = []
+    if usage['order'] and not usage['range']:
+        tail = [c for c in usage['order'] if c not in equality]
+    elif usage['range']:
+        tail = [c for c in usage['range'][:1] if c not in equality]
+
+    # InnoDB 보조 인덱스는 끝에 PK 를 포함하므로 뒤쪽 PK 컬럼은 생략
+    primary = table.primary_key.columns if table.primary_key else ()
+    while tail and tail[-1] in primary:
+        tail.pop()
+    if not tail:
+        while equality and equality[-1] in primary:
+            equality.pop()
+    equality = equality[:MAX_INDEX_COLUMNS]
+    tail = tail[:MAX_INDEX_COLUMNS - len(equality)]
+    if not equality and not tail:
+        return None
+
+    # 등치 컬럼끼리는 순서를 바꿔도 되므로 집합으로 비교
+    width = len(equality) + len(tail)
+    for index in table.indexes.values():
+        if (set(index.columns[:len(equality)]) == set(equality)
+                and index.columns[len(equality):width] == tuple(tail)):
+            return None
+    return tuple(equality), tuple(tail)
+
+
+def merge_suggestions(suggestions):
+    """
+    테이블별 제안을 합친다
+
+    등치 컬럼이 다른 제안의 등치 컬럼에 포함되면, 큰 쪽의 등치 컬럼 순서를 바꿔
+    작은 쪽이 왼쪽 접두사가 되게 하고 작은 쪽은 버린다.
+    → {테이블: [컬럼 튜플]}
+    """
+    merged = {}
+    for table, candidates in suggestions.items():
+        ordered = sorted(set(candidates), key=lambda c: (len(c[0]) + len(c[1]), len(c[0])), reverse=True)
+        kept = []   # [등치 컬럼 리스트, 뒤쪽 컬럼, 고정된 앞부분 길이]
+        for equality, tail in ordered:
+            for entry in kept:
+                kept_equality, kept_tail, fixed = entry
+                prefix = set(kept_equality[:fixed])
+                if not (prefix <= set(equality) <= set(kept_equality)):
+                    continue
+                if tail and (tail != kept_tail or set(equality) != set(kept_equality)):
+                    continue
+                if set(equality) == set(kept_equality):
+                    break
+                entry[0] = kept_equality[:fixed] + [c for c in equality if c not in prefix] + \
+                    [c for c in kept_equality if c not in equality]
+                entry[2] = len(equality)
+                break
+            else:
+                kept.append([list(equality), tail, 0])
+        merged[table] = [tuple(equality) + tuple(tail) for equality, tail, _ in kept]
+    return merged
+
+
+def index_name(columns):
+    return ('idx_' + '_'.join(columns))[:64]
+
+
+# ---------------------------------------------------------------------------
+# 합성 데이터
+# ---------------------------------------------------------------------------
+
+def populate(schema, tables, scale):
+    """synthetic_data 로 임시 스키마를 채우고 통계를 갱신한다"""
+    spec = synthetic_data.DatasetSpec(scale=scale)
+    targets = [name for name in synthetic_data.TABLES if name in tables]
+    skipped = [name for name in tables if name not in synthetic_data.TABLES]
+    if skipped:
+        print(f"   ℹ️  합성 데이터 생성기가 없는 테이블은 비워 둠: {', '.join(skipped)}")
+    synthetic_data.load_dataset(spec, schema, targets)
+
+    connection = local_mysql.connect(database=schema)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE TABLE {', '.join(f'`{t}`' for t in tables)}")
+            cursor.fetchall()
+    finally:
+        connection.close()
+
+
+# ---------------------------------------------------------------------------
+# EXPLAIN / 실행 시간
+# ---------------------------------------------------------------------------
+
+def explain(cursor, sql):
+    cursor.execute(f"EXPLAIN {sql}")
+    return cursor.fetchall()
+
+
+def plan_problems(plan):
+    """EXPLAIN 결과에서 문제 있는 접근 방식 → {테이블 별칭: [문제]}"""
+    problems = {}
+    for row in plan:
+        found = []
+        extra = row.get('Extra') or ''
+        if row['type'] == 'ALL':
+            found.append('full scan')
+        elif row['type'] == 'index':
+            found.append('full index scan')
+        if 'Using filesort' in extra:
+            found.append('filesort')
+        if 'Using temporary' in extra:
+            found.append('temporary')
+        if found and row.get('table'):
+            problems[row['table']] = found
+    return problems
+
+
+def summarize_plan(plan):
+    return ', '.join(
+        f"{row['table']}:{row['type']}{'(' + row['key'] + ')' if row.get('key') else ''}"
+        for row in plan if row.get('table')
+    )
+
+
+def time_query(cursor, sql, repeat):
+    """repeat 회 실행한 중앙값(ms)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cursor.execute(sql)
+        cursor.fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def profile_queries(cursor, queries, repeat):
+    results = {}
+    for name, sql in queries:
+        plan = explain(cursor, sql)
+        results[name] = {
+            'plan': plan,
+            'problems': plan_problems(plan),
+            'ms': time_query(cursor, sql, repeat) if repeat else None,
+        }
+    return results
+
+
+# ---------------------------------------------------------------------------
+# 보고서
+# ---------------------------------------------------------------------------
+
+def print_redundant(tables):
+    print("\n" + "="*60)
+    print("중복/불필요 인덱스 (DDL 분석)")
+    print("="*60)
+    findings = []
+    for table in tables.values():
+        for index, covered_by, reason in ddl_model.redundant_indexes(table):
+            findings.append((table, index, covered_by))
+            label = '중복' if reason == 'duplicate' else '왼쪽 접두사'
+            print(f"⚠️  {table.name}.{index.name} ({', '.join(index.columns)}) "
+                  f"→ {covered_by.name} 과 {label}")
+    if not findings:
+        print("✅ 중복 인덱스 없음")
+    return findings
+
+
+def print_suggestions(suggestions):
+    print("\n" + "="*60)
+    print("제안 인덱스")
+    print("="*60)
+    if not any(suggestions.values()):
+        print("✅ 추가로 필요한 인덱스 없음")
+        return
+    for table, candidates in suggestions.items():
+        for columns in candidates:
+            print(f"ALTER TABLE {table} ADD INDEX {index_name(columns)} ({', '.join(columns)});")
+
+
+def print_comparison(queries, before, after):
+    print("\n" + "="*60)
+    print("적용 전/후 비교")
+    print("="*60)
+    width = max(len(name) for name, _ in queries)
+    print(f"{'query':<{width}}  {'before':>9}  {'after':>9}  {'speedup':>8}  plan(after)")
+    for name, _ in queries:
+        b, a = before[name], after[name]
+        speedup = f"{b['ms'] / a['ms']:.1f}x" if a['ms'] else '-'
+        marker = '⚠️ ' if a['problems'] else '  '
+        print(f"{name:<{width}}  {b['ms']:>7.2f}ms  {a['ms']:>7.2f}ms  {speedup:>8}  "
+              f"{marker}{summarize_plan(a['plan'])}")
+    total_before = sum(r['ms'] for r in before.values())
+    total_after = sum(r['ms'] for r in after.values())
+    print(f"\n📊 합계: {total_before:.1f}ms → {total_after:.1f}ms "
+          f"({total_before / total_after if total_after else 0:.1f}x)")
+
+
+# ---------------------------------------------------------------------------
+
+def advise(tables, queries, scale, repeat, keep):
+    connection = local_mysql.connect()
+    cursor = connection.cursor()
+    try:
+        print("\n" + "="*60)
+        print(f"임시 스키마 준비: {SCRATCH_SCHEMA}")
+        print("="*60)
+        cursor.execute(f"DROP DATABASE IF EXISTS `{SCRATCH_SCHEMA}`")
+        cursor.execute(f"CREATE DATABASE `{SCRATCH_SCHEMA}`")
+        for table in tables.values():
+            cursor.execute(table.create_sql(SCRATCH_SCHEMA))
+        if scale:
+            populate(SCRATCH_SCHEMA, tables, scale)
+        cursor.execute(f"USE `{SCRATCH_SCHEMA}`")
+
+        print("\n" + "="*60)
+        print("EXPLAIN (적용 전)")
+        print("="*60)
+        before = profile_queries(cursor, queries, repeat)
+        suggestions = {}
+        for name, sql in queries:
+            problems = before[name]['problems']
+            if not problems:
+                print(f"✅ {name}: {summarize_plan(before[name]['plan'])}")
+                continue
+            print(f"⚠️  {name}: " + '; '.join(f"{t} {'/'.join(p)}" for t, p in problems.items()))
+            aliases = table_aliases(sql, tables)
+            for table_name, usage in column_usage(sql, tables).items():
+                flagged = any(aliases.get(alias) == table_name for alias in problems)
+                columns = suggest_index(tables[table_name], usage) if flagged else None
+                if columns:
+                    suggestions.setdefault(table_name, []).append(columns)
+        suggestions = merge_suggestions(suggestions)
+        print_suggestions(suggestions)
+        redundant = print_redundant(tables)
+
+        # 제안 인덱스 추가 + 불필요 인덱스 제거 후 다시 측정
+        changes = {}
+        for table_name, candidates in suggestions.items():
+            changes.setdefault(table_name, []).extend(
+                f"ADD INDEX `{index_name(c)}` ({', '.join(f'`{col}`' for col in c)})" for c in candidates
+            )
+        for table, index, _ in redundant:
+            changes.setdefault(table.name, []).append(f"DROP INDEX `{index.name}`")
+        for table_name, clauses in changes.items():
+            cursor.execute(f"ALTER TABLE `{table_name}` {', '.join(clauses)}")
+        if changes:
+            cursor.execute(f"ANALYZE TABLE {', '.join(f'`{t}`' for t in changes)}")
+            cursor.fetchall()
+
+        after = profile_queries(cursor, queries, repeat)
+        if repeat:
+            print_comparison(queries, before, after)
+        return 0
+    finally:
+        if not keep:
+            cursor.execute(f"DROP DATABASE IF EXISTS `{SCRATCH_SCHEMA}`")
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DDL 기반 인덱스 분석기')
+    parser.add_argument('--ddl', nargs='+', default=None,
+                        help='DDL 파일 (기본: sql/migrations 의 파일을 버전 순서대로)')
+    parser.add_argument('--queries', default=DEFAULT_QUERIES_PATH, help='대표 쿼리 파일')
+    parser.add_argument('--static', action='store_true', help='DB 없이 DDL 분석만 수행')
+    parser.add_argument('--scale', type=float, default=0.5,
+                        help='합성 데이터 scale factor (1 = 회원 1만, 댓글 20만, 0 이면 비움)')
+    parser.add_argument('--repeat', type=int, default=5, help='쿼리별 실행 횟수 (중앙값 사용)')
+    parser.add_argument('--keep', action='store_true', help='임시 스키마를 삭제하지 않음')
+    args = parser.parse_args()
+
+    tables = ddl_model.load_ddl(*(args.ddl or [m.path for m in schema_migrator.load_migrations()]))
+    queries = load_queries(args.queries)
+    print(f"📄 테이블 {len(tables)}개, 쿼리 {len(queries)}개")
+
+    if args.static:
+        print_redundant(tables)
+        return 0
+
+    if not local_mysql.is_local():
+        print(f"❌ 임시 스키마는 로컬 MySQL 에서만 만든다: {local_mysql.MYSQL_HOST}")
+        return 2
+
+    try:
+        return advise(tables, queries, args.scale, args.repeat, args.keep)
+    except pymysql.Error as e:
+        print(f"❌ MySQL 오류: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
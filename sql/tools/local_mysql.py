@@ -0,0 +1,80 @@
+# local_mysql.py
+"""
+sql/tools 공용 MySQL 접속 설정
+
+기본값은 docker/mysql 의 로컬 MySQL(root 계정)이며 MYSQL_* 환경 변수로 바꿀 수 있다.
+"""
+import os
+
+import pymysql
+from pymysql.cursors import DictCursor
+
+MYSQL_HOST = os.getenv('MYSQL_HOST', 'localhost')
+MYSQL_PORT = int(os.getenv('MYSQL_PORT', '23306'))
+MYSQL_USERNAME = os.getenv('MYSQL_USERNAME', 'root')
+MYSQL_PASSWORD = os.getenv('MYSQL_PASSWORD', 'pressF5!!!')
+
+LOCAL_HOSTS = {'localhost', '127.0.0.1', '::1', 'mysql-dailyfeed'}
+
+# 환경별 접속 정보 (init/jwt 와 같은 설정 파일 사용): local.env, dev.env, prod.env
+ENV_CONFIG_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'init', 'jwt', 'config'
+)
+
+
+def connect(database=None, host=None, port=None, user=None, password=None, **kwargs):
+    """DictCursor, autocommit 기본 연결"""
+    options = {
+        'charset': 'utf8mb4',
+        'cursorclass': DictCursor,
+        'autocommit': True,
+        'connect_timeout': 10,
+    }
+    options.update(kwargs)
+    return pymysql.connect(
+        host=host or MYSQL_HOST,
+        port=port or MYSQL_PORT,
+        user=user or MYSQL_USERNAME,
+        password=MYSQL_PASSWORD if password is None else password,
+        database=database,
+        **options
+    )
+
+
+def is_local(host=None):
+    return (host or MYSQL_HOST) in LOCAL_HOSTS
+
+
+def load_env_file(path):
+    """KEY=VALUE 형식의 .env 파일 → dict (주석/빈 줄 무시, 따옴표 제거)"""
+    values = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, _, value = line.partition('=')
+            values[key.strip()] = value.strip().strip('"').strip("'")
+    return values
+
+
+def load_target(environment):
+    """
+    환경 이름(local/dev/prod) → connect() 인자
+
+    init/jwt/config/<환경>.env 의 MYSQL_HOST, MYSQL_PORT, MYSQL_USERNAME,
+    MYSQL_PASSWORD, MYSQL_SCHEMA 를 사용한다.
+    """
+    path = os.path.join(ENV_CONFIG_DIR, f"{environment}.env")
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"설정 파일 없음: {path} ({environment}.env.example 을 복사해서 만들어 주세요)"
+        )
+    values = load_env_file(path)
+    return {
+        'host': values.get('MYSQL_HOST', 'localhost'),
+        'port': int(values.get('MYSQL_PORT', '3306')),
+        'user': values.get('MYSQL_USERNAME'),
+        'password': values.get('MYSQL_PASSWORD', ''),
+        'database': values.get('MYSQL_SCHEMA', 'dailyfeed'),
+    }
@@ -0,0 +1,70 @@
+-- 애플리케이션 대표 쿼리 (인덱스 분석기 입력)
+-- 각 쿼리 앞의 "-- name:" 주석이 보고서에 표시되는 이름이다.
+-- 값은 합성 데이터(1 ~ 수천 범위 id)에서 결과가 나오도록 리터럴로 적는다.
+
+-- name: login_by_email
+SELECT id, member_id, email FROM member_emails
+WHERE is_active = TRUE AND verified = TRUE AND email = 'email-42@dailyfeed.io';
+
+-- name: profile_by_handle
+SELECT * FROM member_profiles WHERE handle = 'handle-42';
+
+-- name: profile_by_member
+SELECT * FROM member_profiles WHERE member_id = 42;
+
+-- name: followers_of_member
+SELECT follower_id FROM member_follows WHERE following_id = 42 ORDER BY id DESC LIMIT 20;
+
+-- name: followings_of_member
+SELECT following_id FROM member_follows WHERE follower_id = 42;
+
+-- name: is_following
+SELECT id FROM member_follows WHERE follower_id = 42 AND following_id = 7;
+
+-- name: posts_by_author
+SELECT id, title, created_at FROM posts
+WHERE author_id = 42 AND is_deleted = FALSE
+ORDER BY created_at DESC LIMIT 20;
+
+-- name: timeline_from_followings
+SELECT p.id, p.title, p.author_id, p.created_at
+FROM member_follows f
+JOIN posts p ON p.author_id = f.following_id
+WHERE f.follower_id = 42 AND p.is_deleted = FALSE
+ORDER BY p.created_at DESC LIMIT 20;
+
+-- name: comments_of_post
+SELECT id, author_id, content, created_at FROM comments
+WHERE post_id = 42 AND parent_id IS NULL AND is_deleted = FALSE
+ORDER BY created_at LIMIT 50;
+
+-- name: replies_of_comment
+SELECT id, author_id, content, depth FROM comments
+WHERE parent_id = 42 ORDER BY created_at;
+
+-- name: comment_count_of_post
+SELECT COUNT(*) FROM comments WHERE post_id = 42 AND is_deleted = FALSE;
+
+-- name: comments_by_author
+SELECT id, post_id, created_at FROM comments
+WHERE author_id = 42 ORDER BY created_at DESC LIMIT 20;
+
+-- name: primary_jwt_key
+SELECT id, key_id, secret_key FROM jwt_keys
+WHERE is_primary = TRUE AND is_active = TRUE ORDER BY created_at DESC LIMIT 1;
+
+-- name: refresh_token_lookup
+SELECT * FROM jwt_refresh_tokens WHERE token_value = 'token-value-42';
+
+-- name: refresh_tokens_of_member
+SELECT id, token_id FROM jwt_refresh_tokens WHERE member_id = 42 AND is_revoked = FALSE;
+
+-- name: blacklist_lookup
+SELECT id FROM jwt_blacklist WHERE jti = 'jti-42';
+
+-- name: expired_blacklist_cleanup
+SELECT id FROM jwt_blacklist WHERE expires_at < '2024-01-01 00:00:00' LIMIT 1000;
+
+-- name: profile_images
+SELECT image_url, image_category FROM member_profile_images
+WHERE profile_id = 42 AND image_type = 'avatar';
@@ -0,0 +1,91 @@
+# schema_drift.py
+"""
+스키마 드리프트 검사기
+
+init/jwt/config/<환경>.env 의 DB 를 저장소 DDL(sql/migrations) 과 비교해서
+없는/추가된 테이블, 컬럼, 인덱스와 컬럼 타입/NULL 여부 차이를 보여준다.
+드리프트가 있으면 종료 코드 1 이므로 배포 전 단계에서 게이트로 사용할 수 있다.
+
+사용법:
+    python3 schema-drift.py --env dev
+    python3 schema-drift.py --env local dev prod
+    python3 schema-drift.py --env dev --ddl ../ddl.sql --ignore BATCH_JOB_SEQ
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import local_mysql
+import schema_drift
+
+
+def check_target(environment, expected, ignored):
+    """환경 하나 검사 → (환경, 성공 여부, 드리프트 목록, 단계별 ms, 오류)"""
+    timings = {}
+    connection = None
+    start = time.monotonic()
+    try:
+        target = local_mysql.load_target(environment)
+        connection = local_mysql.connect(**target)
+        timings['connect'] = (time.monotonic() - start) * 1000
+
+        start = time.monotonic()
+        actual = schema_drift.live_tables(connection, target['database'])
+        timings['query'] = (time.monotonic() - start) * 1000
+
+        start = time.monotonic()
+        drifts = schema_drift.compare(expected, actual, ignored)
+        timings['compare'] = (time.monotonic() - start) * 1000
+        return environment, True, drifts, timings, None
+    except Exception as e:
+        return environment, False, [], timings, e
+    finally:
+        if connection:
+            connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스키마 드리프트 검사기')
+    parser.add_argument('--env', nargs='+', default=['local'], help='대상 환경 (local dev prod)')
+    parser.add_argument('--ddl', nargs='+', default=None,
+                        help='기준 DDL 파일 (기본: sql/migrations 의 파일을 버전 순서대로)')
+    parser.add_argument('--ignore', nargs='+', default=[], help='비교하지 않을 테이블')
+    args = parser.parse_args()
+
+    start = time.monotonic()
+    expected = schema_drift.expected_tables(args.ddl)
+    parse_ms = (time.monotonic() - start) * 1000
+    ignored = schema_drift.IGNORED_TABLES | set(args.ignore)
+    print(f"📋 기준 스키마: 테이블 {len(expected)}개 ({parse_ms:.0f}ms)")
+
+    with ThreadPoolExecutor(max_workers=len(args.env)) as pool:
+        futures = [pool.submit(check_target, env, expected, ignored) for env in args.env]
+        results = [future.result() for future in futures]
+
+    for environment, ok, drifts, timings, error in results:
+        print("\n" + "="*60)
+        print(f"[{environment}]")
+        print("="*60)
+        if not ok:
+            print(f"   ❌ {error}")
+            continue
+        if not drifts:
+            print("   ✅ 드리프트 없음")
+        for drift in drifts:
+            print(f"   ⚠️  {drift.describe()}")
+        print("   ⏱️  " + ', '.join(f"{step} {ms:.0f}ms" for step, ms in timings.items()))
+
+    print("\n" + "="*60)
+    print("요약")
+    print("="*60)
+    for environment, ok, drifts, timings, _ in results:
+        state = '✅' if ok and not drifts else '❌'
+        detail = f"드리프트 {len(drifts)}건" if ok else '검사 실패'
+        print(f"{state} {environment:<8} {detail:<14} {sum(timings.values()):>8.0f}ms")
+
+    return 0 if all(ok and not drifts for _, ok, drifts, _, _ in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
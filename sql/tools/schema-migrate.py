@@ -0,0 +1,90 @@
+# schema_migrate.py
+"""
+버전 기반 스키마 마이그레이터
+
+init/jwt/config/<환경>.env 의 접속 정보로 여러 환경에 동시에 마이그레이션을 적용한다.
+환경마다 연결 하나를 열어 모든 마이그레이션을 처리하고, 출력은 환경별로 모아서 보여준다.
+
+사용법:
+    python3 schema-migrate.py migrate --env local
+    python3 schema-migrate.py migrate --env local dev prod
+    python3 schema-migrate.py status --env dev
+    python3 schema-migrate.py baseline --env dev       # 기존 apply-ddl-to-rds.sh 로 만든 DB
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import local_mysql
+import schema_migrator
+
+
+def run_target(environment, command, migrations, args):
+    """환경 하나 처리 → (환경, 성공 여부, 적용 개수, ms, 출력 줄)"""
+    lines = []
+    start = time.monotonic()
+    connection = None
+    try:
+        target = local_mysql.load_target(environment)
+        lines.append(f"🔗 {target['host']}:{target['port']}/{target['database']}")
+        connection = local_mysql.connect(**target)
+        migrator = schema_migrator.SchemaMigrator(connection, migrations, log=lines.append)
+        if command == 'migrate':
+            count = migrator.migrate(repair=args.repair)
+        elif command == 'baseline':
+            count = migrator.baseline(args.version)
+        else:
+            migrator.status()
+            count = 0
+        ok = True
+    except Exception as e:
+        lines.append(f"❌ {e}")
+        count, ok = 0, False
+    finally:
+        if connection:
+            connection.close()
+    return environment, ok, count, (time.monotonic() - start) * 1000, lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='버전 기반 스키마 마이그레이터')
+    parser.add_argument('command', choices=['migrate', 'status', 'baseline'])
+    parser.add_argument('--env', nargs='+', default=['local'], help='대상 환경 (local dev prod)')
+    parser.add_argument('--version', type=int, default=None, help='baseline 으로 기록할 마지막 버전')
+    parser.add_argument('--repair', action='store_true', help='수정된 마이그레이션의 체크섬 갱신, 실패 후 수정된 마이그레이션은 기록된 문장부터 재개')
+    args = parser.parse_args()
+
+    try:
+        migrations = schema_migrator.load_migrations()
+    except schema_migrator.MigrationError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"📋 마이그레이션 {len(migrations)}개: "
+          + ', '.join(f"V{m.version:03d}" for m in migrations))
+
+    with ThreadPoolExecutor(max_workers=len(args.env)) as pool:
+        futures = [pool.submit(run_target, env, args.command, migrations, args) for env in args.env]
+        results = []
+        for future in futures:
+            environment, ok, count, elapsed, lines = future.result()
+            results.append((environment, ok, count, elapsed))
+            print("\n" + "="*60)
+            print(f"[{environment}]")
+            print("="*60)
+            for line in lines:
+                print(f"   {line}")
+
+    print("\n" + "="*60)
+    print("요약")
+    print("="*60)
+    for environment, ok, count, elapsed in results:
+        detail = f"{count}개 적용" if args.command == 'migrate' else args.command
+        print(f"{'✅' if ok else '❌'} {environment:<8} {detail:<12} {elapsed:>8.0f}ms")
+
+    return 0 if all(ok for _, ok, _, _ in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# schema_drift.py
+"""
+스키마 드리프트 검사
+
+운영 DB 의 information_schema 를 저장소의 DDL(sql/migrations) 모델과 비교한다.
+컬럼 전체와 인덱스 전체를 스키마 단위 쿼리 두 번으로 읽어오므로
+테이블 수와 관계없이 왕복 두 번으로 끝난다 (배포 전 게이트로 쓸 수 있는 속도).
+"""
+import ddl_model
+import schema_migrator
+
+LIVE_COLUMNS = """
+    SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name,
+           COLUMN_TYPE AS column_type, IS_NULLABLE AS is_nullable
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = %s
+    ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+LIVE_INDEXES = """
+    SELECT TABLE_NAME AS table_name, INDEX_NAME AS index_name,
+           NON_UNIQUE AS non_unique, COLUMN_NAME AS column_name
+    FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = %s
+    ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+"""
+
+# 비교하지 않는 테이블 (도구가 직접 관리)
+IGNORED_TABLES = {schema_migrator.HISTORY_TABLE}
+
+
+class Drift:
+    """차이 하나: kind 는 missing/extra/changed, target 은 table/column/index"""
+
+    def __init__(self, kind, target, table, name=None, expected=None, actual=None):
+        self.kind = kind
+        self.target = target
+        self.table = table
+        self.name = name
+        self.expected = expected
+        self.actual = actual
+
+    def describe(self):
+        where = f"{self.table}.{self.name}" if self.name else self.table
+        if self.kind == 'missing':
+            return f"{self.target} 없음: {where} (DDL: {self.expected})"
+        if self.kind == 'extra':
+            return f"DDL 에 없는 {self.target}: {where} ({self.actual})"
+        return f"{self.target} 변경: {where} (DDL: {self.expected} → DB: {self.actual})"
+
+    def __repr__(self):
+        return f"Drift({self.kind} {self.target} {self.table}.{self.name})"
+
+
+def expected_tables(paths=None):
+    """저장소 기준 스키마 모델 (기본: sql/migrations 의 파일을 버전 순서대로 적용)"""
+    if not paths:
+        paths = [m.path for m in schema_migrator.load_migrations()]
+    return ddl_model.load_ddl(*paths)
+
+
+def live_tables(connection, database):
+    """information_schema → {테이블 이름: ddl_model.Table}"""
+    tables = {}
+    with connection.cursor() as cursor:
+        cursor.execute(LIVE_COLUMNS, (database,))
+        for row in cursor.fetchall():
+            table = tables.setdefault(row['table_name'], ddl_model.Table(row['table_name'], schema=database))
+            table.columns[row['column_name']] = ddl_model.Column(
+                row['column_name'],
+                ddl_model.normalize_type(row['column_type']),
+                nullable=row['is_nullable'] == 'YES',
+            )
+
+        cursor.execute(LIVE_INDEXES, (database,))
+        grouped = {}
+        for row in cursor.fetchall():
+            key = (row['table_name'], row['index_name'])
+            grouped.setdefault(key, (not int(row['non_unique']), []))[1].append(row['column_name'])
+        for (table_name, index_name), (unique, columns) in grouped.items():
+            if table_name in tables:
+                tables[table_name].add_index(index_name, columns, unique=unique,
+                                             primary=index_name == 'PRIMARY')
+    return tables
+
+
+def _describe_index(index):
+    return f"{index.kind} ({', '.join(index.columns)})"
+
+
+def _by_lower_name(items):
+    return {name.lower(): item for name, item in items.items()}
+
+
+def _compare_indexes(table_name, expected, actual):
+    drifts = []
+    expected_indexes = _by_lower_name(expected.indexes)
+    actual_indexes = _by_lower_name(actual.indexes)
+    for key, index in expected_indexes.items():
+        other = actual_indexes.get(key)
+        if other is None:
+            continue
+        if (index.columns, index.unique) != (other.columns, other.unique):
+            drifts.append(Drift('changed', 'index', table_name, index.name,
+                                _describe_index(index), _describe_index(other)))
+
+    missing = [i for k, i in expected_indexes.items() if k not in actual_indexes]
+    extra = [i for k, i in actual_indexes.items() if k not in expected_indexes]
+    for index in missing:
+        # 같은 구성의 인덱스가 다른 이름으로 있으면 이름만 다른 것으로 본다
+        renamed = next((o for o in extra if (o.columns, o.unique) == (index.columns, index.unique)), None)
+        if renamed:
+            extra.remove(renamed)
+            drifts.append(Drift('changed', 'index', table_name, index.name,
+                                f"이름 {index.name}", f"이름 {renamed.name}"))
+        else:
+            drifts.append(Drift('missing', 'index', table_name, index.name, expected=_describe_index(index)))
+    for index in extra:
+        drifts.append(Drift('extra', 'index', table_name, index.name, actual=_describe_index(index)))
+    return drifts
+
+
+def _compare_columns(table_name, expected, actual):
+    drifts = []
+    expected_columns = _by_lower_name(expected.columns)
+    actual_columns = _by_lower_name(actual.columns)
+    for key, column in expected_columns.items():
+        other = actual_columns.get(key)
+        if other is None:
+            drifts.append(Drift('missing', 'column', table_name, column.name, expected=column.column_type))
+            continue
+        if column.column_type != other.column_type:
+            drifts.append(Drift('changed', 'column', table_name, column.name,
+                                column.column_type, other.column_type))
+        if column.nullable != other.nullable:
+            drifts.append(Drift('changed', 'column', table_name, column.name,
+                                'NULL' if column.nullable else 'NOT NULL',
+                                'NULL' if other.nullable else 'NOT NULL'))
+    for key, column in actual_columns.items():
+        if key not in expected_columns:
+            drifts.append(Drift('extra', 'column', table_name, column.name, actual=column.column_type))
+    return drifts
+
+
+def compare(expected, actual, ignored=IGNORED_TABLES):
+    """
+    두 모델 비교 → [Drift]
+
+    이름 비교는 대소문자를 구분하지 않는다 (lower_case_table_names 설정과 무관하게 동작하도록).
+    """
+    ignored = {name.lower() for name in ignored}
+    expected_by_name = {k: v for k, v in _by_lower_name(expected).items() if k not in ignored}
+    actual_by_name = {k: v for k, v in _by_lower_name(actual).items() if k not in ignored}
+
+    drifts = []
+    for key, table in expected_by_name.items():
+        other = actual_by_name.get(key)
+        if other is None:
+            drifts.append(Drift('missing', 'table', table.name, expected=f"{len(table.columns)} columns"))
+            continue
+        drifts.extend(_compare_columns(table.name, table, other))
+        drifts.extend(_compare_indexes(table.name, table, other))
+    for key, table in actual_by_name.items():
+        if key not in expected_by_name:
+            drifts.append(Drift('extra', 'table', table.name, actual=f"{len(table.columns)} columns"))
+    return drifts
+
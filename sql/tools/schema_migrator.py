@@ -0,0 +1,245 @@
+# schema_migrator.py
+"""
+버전 기반 스키마 마이그레이션
+
+sql/migrations/V<번호>__<설명>.sql 파일을 번호 순서로 적용하고, 적용 결과를
+대상 DB 의 schema_migrations 테이블에 체크섬과 함께 기록한다.
+이미 적용된(체크섬이 같은) 마이그레이션은 건너뛰므로 재실행은 몇 번의 왕복으로 끝난다.
+MySQL DDL 은 문장마다 자동 커밋되므로, 실패한 마이그레이션은 성공한 문장 수를 기록해 두고
+다음 실행에서 실패한 문장부터 재개한다.
+"""
+import hashlib
+import os
+import re
+import time
+
+import ddl_model
+
+MIGRATIONS_DIR = os.path.join(ddl_model.SQL_DIR, 'migrations')
+MIGRATION_FILE = re.compile(r'V(\d+)__(\w+)\.sql$')
+HISTORY_TABLE = 'schema_migrations'
+LOCK_TIMEOUT_SECONDS = 60
+
+CREATE_HISTORY_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {HISTORY_TABLE} (
+        version        int          NOT NULL PRIMARY KEY,
+        description    varchar(200) NOT NULL,
+        checksum       char(64)     NOT NULL,
+        execution_ms   int          NOT NULL DEFAULT 0,
+        success        tinyint(1)   NOT NULL,
+        statements_applied int      NOT NULL DEFAULT 0,
+        applied_at     datetime     NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+RECORD_MIGRATION = f"""
+    INSERT INTO {HISTORY_TABLE} (version, description, checksum, execution_ms, success, statements_applied)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        description = VALUES(description),
+        checksum = VALUES(checksum),
+        execution_ms = VALUES(execution_ms),
+        success = VALUES(success),
+        statements_applied = VALUES(statements_applied),
+        applied_at = CURRENT_TIMESTAMP
+"""
+
+# statements_applied 가 없던 이전 이력 테이블 보완
+ADD_PROGRESS_COLUMN = f"""
+    ALTER TABLE {HISTORY_TABLE}
+        ADD COLUMN statements_applied int NOT NULL DEFAULT 0 AFTER success
+"""
+
+
+class MigrationError(Exception):
+    pass
+
+
+class Migration:
+    def __init__(self, version, description, path):
+        self.version = version
+        self.description = description
+        self.path = path
+        with open(path, encoding='utf-8') as f:
+            self.sql = f.read()
+        # 줄바꿈/줄 끝 공백 차이는 같은 내용으로 본다
+        normalized = '\n'.join(line.rstrip() for line in self.sql.replace('\r\n', '\n').split('\n')).strip()
+        self.checksum = hashlib.sha256(normalized.encode()).hexdigest()
+
+    def statements(self):
+        return [s for s in ddl_model.split_top_level(ddl_model.strip_comments(self.sql), ';') if s.strip()]
+
+    def __repr__(self):
+        return f"Migration(V{self.version:03d} {self.description})"
+
+
+def recovery_steps(migration, done):
+    """실패한 마이그레이션의 복구 안내"""
+    name = f"V{migration.version:03d}"
+    return "\n".join([
+        f"   복구 방법 ({name}, 앞의 문장 {done}개는 이미 적용됨):",
+        f"   - 원인(권한, 기존 객체 등)을 해결하고 다시 migrate 하면 문장 {done + 1} 부터 재개합니다.",
+        f"   - 실패 후 파일을 고쳤다면 이미 적용된 문장이 그대로인지 확인하고 migrate --repair 로 재개하세요.",
+        f"   - 남은 변경을 직접 적용했다면 baseline --version {migration.version} 으로 완료 기록하세요.",
+    ])
+
+
+def load_migrations(directory=MIGRATIONS_DIR):
+    """마이그레이션 파일 목록 (버전 순)"""
+    migrations = {}
+    for name in sorted(os.listdir(directory)):
+        match = MIGRATION_FILE.match(name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"중복된 버전 V{version}: {migrations[version].path}, {name}")
+        migrations[version] = Migration(version, match.group(2).replace('_', ' '),
+                                        os.path.join(directory, name))
+    return [migrations[v] for v in sorted(migrations)]
+
+
+class SchemaMigrator:
+    """
+    대상 DB 하나에 대한 마이그레이터
+
+    한 연결로 잠금 → 이력 조회 → 미적용 마이그레이션 실행 → 기록까지 처리한다.
+    여러 마이그레이터가 같은 DB 에 동시에 붙어도 GET_LOCK 으로 한 번에 하나만 적용한다.
+    log 는 출력 함수 (병렬 실행 시 대상별로 출력을 모으기 위해 주입)
+    """
+
+    def __init__(self, connection, migrations, log=print):
+        self.connection = connection
+        self.migrations = migrations
+        self.log = log
+        self.lock_name = None
+
+    def _execute(self, query, args=None):
+        with self.connection.cursor() as cursor:
+            cursor.execute(query, args)
+            return cursor.fetchall()
+
+    def _lock(self):
+        database = self._execute("SELECT DATABASE() AS name")[0]['name']
+        self.lock_name = f"{database}.{HISTORY_TABLE}"
+        acquired = self._execute("SELECT GET_LOCK(%s, %s) AS acquired",
+                                 (self.lock_name, LOCK_TIMEOUT_SECONDS))[0]['acquired']
+        if acquired != 1:
+            raise MigrationError(f"마이그레이션 잠금 획득 실패: {self.lock_name}")
+
+    def _unlock(self):
+        if self.lock_name:
+            self._execute("DO RELEASE_LOCK(%s)", (self.lock_name,))
+            self.lock_name = None
+
+    def applied(self):
+        """version → 이력 행"""
+        self._execute(CREATE_HISTORY_TABLE)
+        rows = self._execute(f"SELECT * FROM {HISTORY_TABLE}")
+        if rows and 'statements_applied' not in rows[0]:
+            self._execute(ADD_PROGRESS_COLUMN)
+            rows = self._execute(f"SELECT * FROM {HISTORY_TABLE}")
+        return {row['version']: row for row in rows}
+
+    def _record(self, migration, elapsed, success, statements_applied):
+        self._execute(RECORD_MIGRATION, (migration.version, migration.description,
+                                         migration.checksum, elapsed, success, statements_applied))
+
+    def pending(self, applied, repair=False):
+        """
+        적용할 마이그레이션 목록 → [(마이그레이션, 재개할 문장 번호)]
+
+        체크섬이 바뀐 적용 완료 마이그레이션은 오류.
+        실패 후 파일이 수정된 마이그레이션은 이미 실행된 문장과 맞는지 알 수 없으므로
+        --repair(기록된 문장 수부터 재개) 또는 baseline(수동 복구 후 완료로 기록)을 요구한다.
+        """
+        pending = []
+        for migration in self.migrations:
+            row = applied.get(migration.version)
+            if row is None:
+                pending.append((migration, 0))
+            elif not row['success']:
+                done = row['statements_applied']
+                if done and row['checksum'] != migration.checksum and not repair:
+                    raise MigrationError(
+                        f"V{migration.version:03d} 는 문장 {done}개까지 적용된 뒤 실패했고 이후 파일이 수정됨\n"
+                        f"{recovery_steps(migration, done)}"
+                    )
+                pending.append((migration, done))
+            elif row['checksum'] != migration.checksum:
+                if not repair:
+                    raise MigrationError(
+                        f"V{migration.version:03d} 체크섬 불일치: 적용 후 파일이 수정됨 "
+                        f"(변경은 새 마이그레이션 파일로 추가하거나 --repair 로 체크섬 갱신)"
+                    )
+                self._record(migration, row['execution_ms'], True, row['statements_applied'])
+                self.log(f"🔧 V{migration.version:03d} 체크섬 갱신")
+        return pending
+
+    def migrate(self, repair=False):
+        """미적용 마이그레이션 적용 → 적용한 개수"""
+        self._lock()
+        try:
+            pending = self.pending(self.applied(), repair=repair)
+            if not pending:
+                self.log("✅ 최신 상태 (적용할 마이그레이션 없음)")
+                return 0
+            for migration, done in pending:
+                statements = migration.statements()
+                if done:
+                    self.log(f"↪️  V{migration.version:03d} 문장 {done + 1}/{len(statements)} 부터 재개")
+                start = time.monotonic()
+                for index in range(done, len(statements)):
+                    try:
+                        self._execute(statements[index])
+                    except Exception as e:
+                        elapsed = int((time.monotonic() - start) * 1000)
+                        # 앞선 문장은 이미 커밋되었으므로 성공한 문장 수를 남겨 다음 실행에서 재개
+                        self._record(migration, elapsed, False, index)
+                        raise MigrationError(
+                            f"V{migration.version:03d} 문장 {index + 1}/{len(statements)} 적용 실패: {e}\n"
+                            f"{recovery_steps(migration, index)}"
+                        ) from e
+                elapsed = int((time.monotonic() - start) * 1000)
+                self._record(migration, elapsed, True, len(statements))
+                self.log(f"✅ V{migration.version:03d} {migration.description} ({elapsed}ms)")
+            return len(pending)
+        finally:
+            self._unlock()
+
+    def baseline(self, version=None):
+        """이미 스키마가 있는 DB 에서 version 까지를 실행 없이 적용 완료로 기록"""
+        self._lock()
+        try:
+            applied = self.applied()
+            count = 0
+            for migration in self.migrations:
+                if version is not None and migration.version > version:
+                    break
+                row = applied.get(migration.version)
+                if row is not None and row['success']:
+                    continue
+                # 실패한 마이그레이션은 수동으로 복구한 뒤 완료로 기록할 수 있다
+                self._record(migration, 0, True, len(migration.statements()))
+                self.log(f"📌 V{migration.version:03d} {migration.description} 기준선 기록")
+                count += 1
+            return count
+        finally:
+            self._unlock()
+
+    def status(self):
+        applied = self.applied()
+        for migration in self.migrations:
+            row = applied.get(migration.version)
+            if row is None:
+                state = '⏳ 대기'
+            elif not row['success']:
+                state = f"❌ 실패 (문장 {row['statements_applied']}/{len(migration.statements())} 적용됨)"
+            elif row['checksum'] != migration.checksum:
+                state = '⚠️  체크섬 불일치'
+            else:
+                state = f"✅ {row['applied_at']}"
+            self.log(f"V{migration.version:03d} {migration.description:<30} {state}")
+        unknown = sorted(set(applied) - {m.version for m in self.migrations})
+        for version in unknown:
+            self.log(f"V{version:03d} {applied[version]['description']:<30} ⚠️  파일 없음")